@@ -0,0 +1,43 @@
+from lacecore import FACE_DTYPE, Mesh
+import numpy as np
+
+
+def grid_mesh(num_cells_per_side):
+    """
+    Create a wavy square sheet with `2 * num_cells_per_side ** 2` triangles,
+    which is a convenient stand-in for a large scan.
+    """
+    num_vertices_per_side = num_cells_per_side + 1
+    x, y = np.meshgrid(
+        np.linspace(0.0, 1.0, num_vertices_per_side),
+        np.linspace(0.0, 1.0, num_vertices_per_side),
+    )
+    z = 0.05 * np.sin(10.0 * x) * np.cos(10.0 * y)
+    v = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+
+    corners = (
+        np.arange(num_cells_per_side)[:, np.newaxis] * num_vertices_per_side
+        + np.arange(num_cells_per_side)
+    ).ravel()
+    f = np.empty((2 * len(corners), 3), dtype=FACE_DTYPE)
+    f[0::2] = np.column_stack(
+        [corners, corners + 1, corners + num_vertices_per_side + 1]
+    )
+    f[1::2] = np.column_stack(
+        [
+            corners,
+            corners + num_vertices_per_side + 1,
+            corners + num_vertices_per_side,
+        ]
+    )
+    return Mesh(v=v, f=f)
+
+
+def report(name, seconds, baseline_seconds=None):
+    if baseline_seconds is None:
+        print(f"{name}: {seconds * 1000:.1f} ms")
+    else:
+        print(
+            f"{name}: {seconds * 1000:.1f} ms (baseline {baseline_seconds * 1000:.1f} ms, "
+            + f"{baseline_seconds / seconds:.1f}x)"
+        )
@@ -0,0 +1,40 @@
+"""
+Compare evaluating many region selections one at a time with evaluating them
+together using `Mesh.generate_masks_for_selections()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+import numpy as np
+
+
+def main(num_cells_per_side=700, num_selections=200, number=1):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    np.random.seed(0)
+    corners = np.random.rand(num_selections, 3) * 0.9
+
+    def create_selections():
+        return [
+            mesh.select()
+            .vertices_at_or_above(0, corner)
+            .vertices_below(0, corner + 0.1)
+            .vertices_at_or_above(1, corner)
+            .vertices_below(1, corner + 0.1)
+            for corner in corners
+        ]
+
+    def one_at_a_time():
+        return [selection.generate_masks() for selection in create_selections()]
+
+    def batched():
+        return mesh.generate_masks_for_selections(create_selections())
+
+    baseline = min(timeit.repeat(one_at_a_time, number=number, repeat=3)) / number
+    current = min(timeit.repeat(batched, number=number, repeat=3)) / number
+    report(f"generate_masks_for_selections ({num_selections})", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
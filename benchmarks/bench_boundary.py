@@ -0,0 +1,58 @@
+"""
+Compare the boundary, non-manifold and orientation checks, which run over
+the cached table of edges, against counting the sides of the faces in a
+Python dictionary.
+"""
+
+import collections
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+
+
+def checks_with_dictionary(mesh):
+    directions = collections.defaultdict(list)
+    for face in mesh.f.tolist():
+        for start, end in zip(face, face[1:] + face[:1]):
+            directions[(min(start, end), max(start, end))].append(start < end)
+    boundary_edges = [edge for edge, sides in directions.items() if len(sides) == 1]
+    non_manifold_edges = [edge for edge, sides in directions.items() if len(sides) > 2]
+    is_watertight = all(len(sides) == 2 for sides in directions.values())
+    is_consistently_oriented = all(
+        abs(2 * sum(sides) - len(sides)) <= 1 for sides in directions.values()
+    )
+    return boundary_edges, non_manifold_edges, is_watertight, is_consistently_oriented
+
+
+def checks(mesh):
+    # Use a fresh mesh, so nothing is cached from the previous run.
+    fresh = Mesh(v=mesh.v, f=mesh.f)
+    return (
+        fresh.boundary_loops(),
+        fresh.non_manifold_edges(),
+        fresh.is_watertight,
+        fresh.is_consistently_oriented,
+    )
+
+
+def main(num_cells_per_side=300, large_num_cells_per_side=2237, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    baseline = (
+        min(
+            timeit.repeat(lambda: checks_with_dictionary(mesh), number=number, repeat=3)
+        )
+        / number
+    )
+    current = min(timeit.repeat(lambda: checks(mesh), number=number, repeat=3)) / number
+    report("Boundary, non-manifold and orientation checks", current, baseline)
+
+    mesh = grid_mesh(large_num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+    current = min(timeit.repeat(lambda: checks(mesh), number=1, repeat=1))
+    report("Boundary, non-manifold and orientation checks", current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare removing degenerate and duplicate faces from a scan against
+`np.unique(..., axis=0)` on the sorted faces and areas from `np.cross()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import FACE_DTYPE, Mesh
+from lacecore._common.reindexing import create_submesh
+import numpy as np
+
+
+def messy(mesh, num_bad_faces):
+    # Append duplicates of random faces, and faces which repeat a vertex.
+    np.random.seed(0)
+    duplicates = mesh.f[np.random.randint(mesh.num_f, size=num_bad_faces)]
+    repeats = duplicates.copy()
+    repeats[:, 2] = repeats[:, 0]
+    return Mesh(
+        v=mesh.v, f=np.vstack([mesh.f, duplicates[:, ::-1], repeats]).astype(FACE_DTYPE)
+    )
+
+
+def cleaned_with_unique(mesh):
+    _, first_indices = np.unique(np.sort(mesh.f, axis=1), axis=0, return_index=True)
+    face_mask = np.zeros(mesh.num_f, dtype=bool)
+    face_mask[first_indices] = True
+    corners = mesh.v[mesh.f]
+    areas = 0.5 * np.linalg.norm(
+        np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1
+    )
+    face_mask &= areas > 0.0
+    vertex_mask = np.zeros(mesh.num_v, dtype=bool)
+    vertex_mask[mesh.f[face_mask]] = True
+    return create_submesh(mesh, vertex_mask=vertex_mask, face_mask=face_mask)
+
+
+def main(num_cells_per_side=300, num_bad_faces=10000, number=3):
+    mesh = messy(grid_mesh(num_cells_per_side), num_bad_faces)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    def cleaned():
+        # Use a fresh mesh, so the face areas aren't cached from the previous
+        # run.
+        return Mesh(v=mesh.v, f=mesh.f).cleaned()
+
+    baseline = (
+        min(timeit.repeat(lambda: cleaned_with_unique(mesh), number=number, repeat=3))
+        / number
+    )
+    current = min(timeit.repeat(cleaned, number=number, repeat=3)) / number
+    report("Remove degenerate and duplicate faces", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare dragging a clip plane with `Mesh.clipper()` against invoking
+`Mesh.sliced_by_plane()` at each step.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+import numpy as np
+from polliwog import Plane
+
+
+def main(num_cells_per_side=700, num_steps=50, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    # Drag a plane across the middle of the sheet in small steps.
+    normal = np.array([1.0, 0.0, 0.0])
+    planes = [
+        Plane(offset * normal, normal)
+        for offset in np.linspace(0.4, 0.6, num_steps) + 0.0001
+    ]
+
+    def with_sliced_by_plane():
+        for plane in planes:
+            mesh.sliced_by_plane(plane)
+
+    def with_clipper():
+        clipper = mesh.clipper(normal)
+        for plane in planes:
+            clipper.sliced_by_plane(plane)
+
+    baseline = (
+        min(timeit.repeat(with_sliced_by_plane, number=number, repeat=3)) / number
+    )
+    current = min(timeit.repeat(with_clipper, number=number, repeat=3)) / number
+    report(f"clipper ({num_steps} steps)", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare labeling the connected components of a scan surrounded by debris,
+and splitting it into a submesh for each, against a union-find in Python
+and a call to `create_submesh()` for each component.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import FACE_DTYPE, Mesh
+from lacecore._common.reindexing import create_submesh
+import numpy as np
+
+
+def with_debris(mesh, num_pieces):
+    # Scatter small tetrahedra around the mesh.
+    np.random.seed(0)
+    tetrahedron_v = np.array(
+        [[0.0, 0.0, 0.0], [0.01, 0.0, 0.0], [0.0, 0.01, 0.0], [0.0, 0.0, 0.01]]
+    )
+    tetrahedron_f = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    offsets = np.random.rand(num_pieces, 1, 3)
+    return Mesh(
+        v=np.vstack([mesh.v, (tetrahedron_v + offsets).reshape(-1, 3)]),
+        f=np.vstack(
+            [
+                mesh.f,
+                (
+                    tetrahedron_f
+                    + mesh.num_v
+                    + 4 * np.arange(num_pieces)[:, np.newaxis, np.newaxis]
+                ).reshape(-1, 3),
+            ]
+        ).astype(FACE_DTYPE),
+    )
+
+
+def labels_with_union_find(mesh):
+    parents = list(range(mesh.num_v))
+
+    def find(vertex):
+        while parents[vertex] != vertex:
+            parents[vertex] = parents[parents[vertex]]
+            vertex = parents[vertex]
+        return vertex
+
+    for start, end in mesh.edges().tolist():
+        start_root, end_root = find(start), find(end)
+        if start_root != end_root:
+            parents[max(start_root, end_root)] = min(start_root, end_root)
+    roots = np.array([find(vertex) for vertex in range(mesh.num_v)])
+    _, face_labels = np.unique(roots[mesh.f[:, 0]], return_inverse=True)
+    return face_labels
+
+
+def main(num_cells_per_side=300, num_pieces=2000, number=3):
+    mesh = with_debris(grid_mesh(num_cells_per_side), num_pieces)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+    # Build the edges up front for the baseline. The fresh meshes build their
+    # own.
+    mesh.edges()
+
+    def labels():
+        # Use a fresh mesh, so nothing is cached from the previous run.
+        return Mesh(v=mesh.v, f=mesh.f).connected_components()
+
+    baseline = (
+        min(
+            timeit.repeat(lambda: labels_with_union_find(mesh), number=number, repeat=3)
+        )
+        / number
+    )
+    current = min(timeit.repeat(labels, number=number, repeat=3)) / number
+    report("Label connected components", current, baseline)
+
+    face_labels, vertex_labels = mesh.connected_components()
+
+    def split_one_at_a_time():
+        return [
+            create_submesh(
+                mesh, vertex_mask=vertex_labels == label, face_mask=face_labels == label
+            )
+            for label in range(np.max(face_labels) + 1)
+        ]
+
+    baseline = min(timeit.repeat(split_one_at_a_time, number=number, repeat=3)) / number
+    current = (
+        min(timeit.repeat(lambda: mesh.split_components(), number=number, repeat=3))
+        / number
+    )
+    report(f"Split into {np.max(face_labels) + 1} components", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
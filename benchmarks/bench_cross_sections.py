@@ -0,0 +1,51 @@
+"""
+Compare `Mesh.cross_sections()` with many parallel planes against
+intersecting the mesh with one plane at a time.
+"""
+
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from _meshes import grid_mesh, report
+import numpy as np
+from polliwog import Plane
+
+
+def main(num_cells_per_side=700, num_planes=100, number=1):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    # Slices across the sheet at regular intervals.
+    normal = np.array([1.0, 0.0, 0.0])
+    offsets = np.linspace(0.0, 1.0, num_planes + 2)[1:-1]
+    planes = [Plane(offset * normal, normal) for offset in offsets]
+
+    def one_plane_at_a_time():
+        return [mesh.cross_sections(planes=[plane]) for plane in planes]
+
+    baseline = min(timeit.repeat(one_plane_at_a_time, number=number, repeat=3)) / number
+    current = (
+        min(
+            timeit.repeat(
+                lambda: mesh.cross_sections(planes=planes), number=number, repeat=3
+            )
+        )
+        / number
+    )
+    report(f"cross_sections ({num_planes} planes)", current, baseline)
+
+    with ThreadPoolExecutor() as executor:
+        threaded = (
+            min(
+                timeit.repeat(
+                    lambda: mesh.cross_sections(planes=planes, executor=executor),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+    report(f"cross_sections ({num_planes} planes, threaded)", threaded, baseline)
+
+
+if __name__ == "__main__":
+    main()
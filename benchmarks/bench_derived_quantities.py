@@ -0,0 +1,61 @@
+"""
+Compare computing the centroid, bounding box and face normals of transformed
+copies of a mesh, which are derived from those of the mesh, against
+computing them from the transformed vertices.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+from polliwog import Box, CompositeTransform
+from polliwog.tri import surface_normals
+from vg.compat import v2 as vg
+
+
+def derived_quantities_from_scratch(mesh, rotation, translation):
+    transform = CompositeTransform()
+    transform.rotate(rotation)
+    transform.translate(translation)
+    transformed = Mesh(v=transform(mesh.v), f=mesh.f)
+    return (
+        vg.average(transformed.v),
+        Box.from_points(transformed.v),
+        surface_normals(transformed.v[transformed.f]),
+    )
+
+
+def main(num_cells_per_side=300, number=20):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    rotation = np.array([0.1, 0.2, 0.3])
+    translation = vg.basis.z
+
+    def derived_quantities():
+        transformed = mesh.rotated(rotation).translated(translation)
+        return (
+            transformed.vertex_centroid,
+            transformed.bounding_box,
+            transformed.face_normals(),
+        )
+
+    # Compute the quantities of the mesh itself once, as a pipeline would.
+    derived_quantities()
+
+    baseline = (
+        min(
+            timeit.repeat(
+                lambda: derived_quantities_from_scratch(mesh, rotation, translation),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    current = min(timeit.repeat(derived_quantities, number=number, repeat=3)) / number
+    report("Centroid, bounding box and normals of a rotated copy", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare computing vertex normals and selecting half of a large scan whose
+faces and vertices are scattered in memory, such as one which has been
+stitched together from pieces, before and after
+`Mesh.optimized_for_locality()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh, reindex_faces, reindex_vertices
+import numpy as np
+
+
+def scattered(mesh):
+    np.random.seed(0)
+    shuffled = reindex_faces(mesh, np.random.permutation(mesh.num_f))
+    return reindex_vertices(shuffled, np.random.permutation(mesh.num_v))
+
+
+def main(num_cells_per_side=1000, number=3):
+    mesh = scattered(grid_mesh(num_cells_per_side))
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    current = (
+        min(timeit.repeat(mesh.optimized_for_locality, number=number, repeat=3))
+        / number
+    )
+    report("optimized_for_locality()", current)
+    optimized = mesh.optimized_for_locality()
+
+    def timed(fn, target):
+        return (
+            min(
+                timeit.repeat(
+                    # Use a fresh mesh, so nothing is cached from the previous
+                    # run.
+                    lambda: fn(Mesh(v=target.v, f=target.f)),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+
+    def vertex_normals(target):
+        return target.vertex_normals()
+
+    def selection(target):
+        return target.select().vertices_above(0, np.full(3, 0.5)).end()
+
+    for name, fn in (("vertex_normals()", vertex_normals), ("Selection", selection)):
+        report(name, timed(fn, optimized), timed(fn, mesh))
+
+
+if __name__ == "__main__":
+    main()
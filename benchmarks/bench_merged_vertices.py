@@ -0,0 +1,47 @@
+"""
+Compare welding the seams of a scan whose triangles each have their own
+vertices against `np.unique(..., axis=0, return_inverse=True)`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+
+
+def split(mesh):
+    # Give each triangle its own vertices.
+    return Mesh(
+        v=mesh.v[mesh.f].reshape(-1, 3),
+        f=np.arange(3 * mesh.num_f).reshape(-1, 3),
+    )
+
+
+def merged_with_unique(mesh):
+    v, inverse = np.unique(mesh.v, axis=0, return_inverse=True)
+    return Mesh(v=v, f=inverse.ravel()[mesh.f])
+
+
+def main(num_cells_per_side=300, number=3):
+    mesh = split(grid_mesh(num_cells_per_side))
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    baseline = (
+        min(timeit.repeat(lambda: merged_with_unique(mesh), number=number, repeat=3))
+        / number
+    )
+    current = (
+        min(timeit.repeat(lambda: mesh.merged_vertices(), number=number, repeat=3))
+        / number
+    )
+    report("Merge vertices", current, baseline)
+
+    large_mesh = split(grid_mesh(1300))
+    current = min(
+        timeit.repeat(lambda: large_mesh.merged_vertices(), number=1, repeat=1)
+    )
+    report(f"Merge {large_mesh.num_v} vertices", current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measure `Mesh.nearest_vertices()` and `Mesh.closest_points()` for points
+scattered near the surface, as in a fitting loop, with and without a thread
+pool.
+"""
+
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from _meshes import grid_mesh, report
+import numpy as np
+
+
+def main(num_cells_per_side=300, num_points=100000, num_threads=4, number=1):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    np.random.seed(0)
+    points = mesh.v[np.random.randint(mesh.num_v, size=num_points)] + 0.01 * (
+        np.random.randn(num_points, 3)
+    )
+
+    def build_indices():
+        mesh._cache.clear()
+        mesh._vertex_bvh()
+        mesh._face_bvh()
+
+    current = min(timeit.repeat(build_indices, number=number, repeat=3)) / number
+    report("Build spatial indices", current)
+
+    for name in ("nearest_vertices", "closest_points"):
+        method = getattr(mesh, name)
+        single_threaded = (
+            min(timeit.repeat(lambda: method(points), number=number, repeat=3)) / number
+        )
+        report(f"{name} ({num_points})", single_threaded)
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            current = (
+                min(
+                    timeit.repeat(
+                        lambda: method(points, executor=executor),
+                        number=number,
+                        repeat=3,
+                    )
+                )
+                / number
+            )
+        report(
+            f"{name} ({num_points}, {num_threads} threads)", current, single_threaded
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure `Mesh.intersect_rays()` for rays shot down onto a surface from a
+range of angles, with and without a thread pool.
+"""
+
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from _meshes import grid_mesh, report
+import numpy as np
+
+
+def main(num_cells_per_side=300, num_rays=100000, num_threads=4, number=1):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    np.random.seed(0)
+    origins = np.random.rand(num_rays, 3) * np.array([1.0, 1.0, 0.0]) + np.array(
+        [0.0, 0.0, 1.0]
+    )
+    directions = np.array([0.0, 0.0, -1.0]) + 0.3 * np.random.randn(num_rays, 3)
+
+    def build_index():
+        mesh._cache.clear()
+        mesh._face_bvh()
+
+    current = min(timeit.repeat(build_index, number=number, repeat=3)) / number
+    report("Build spatial index", current)
+
+    single_threaded = (
+        min(
+            timeit.repeat(
+                lambda: mesh.intersect_rays(origins, directions),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    report(f"intersect_rays ({num_rays})", single_threaded)
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        current = (
+            min(
+                timeit.repeat(
+                    lambda: mesh.intersect_rays(origins, directions, executor=executor),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+    report(
+        f"intersect_rays ({num_rays}, {num_threads} threads)", current, single_threaded
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare orphan pruning in `reconcile_selection()` with the set-difference
+approach it replaced, for a single selection and for a union.
+"""
+
+import timeit
+from unittest import mock
+from _meshes import grid_mesh, report
+from lacecore._selection.reconcile_selection import reconcile_selection
+import numpy as np
+
+
+def reconcile_selection_with_setdiff(
+    faces, face_mask, vertex_mask, prune_orphan_vertices=True
+):
+    reconciled_face_mask = np.zeros_like(face_mask, dtype=bool)
+    reconciled_face_mask[face_mask] = np.all(vertex_mask[faces[face_mask]], axis=1)
+    orphaned_vertices = np.setdiff1d(
+        faces[~reconciled_face_mask], faces[reconciled_face_mask]
+    )
+    reconciled_vertex_mask = np.copy(vertex_mask)
+    reconciled_vertex_mask[orphaned_vertices] = False
+    return reconciled_face_mask, reconciled_vertex_mask
+
+
+def reconcile_selection_unchecked_with_setdiff(
+    faces, face_mask, vertex_mask, num_vertices, prune_orphan_vertices
+):
+    # Stands in for `reconcile_selection_unchecked()`, which `Selection` uses.
+    if face_mask is None:
+        face_mask = np.ones(len(faces), dtype=bool)
+    if vertex_mask is None:
+        vertex_mask = np.ones(num_vertices, dtype=bool)
+    return reconcile_selection_with_setdiff(
+        faces, face_mask, vertex_mask, prune_orphan_vertices
+    )
+
+
+def main(num_cells_per_side=1600, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    face_mask = np.ones(mesh.num_f, dtype=bool)
+    vertex_mask = mesh.v[:, 0] > 0.5
+
+    baseline = (
+        min(
+            timeit.repeat(
+                lambda: reconcile_selection_with_setdiff(
+                    mesh.f, face_mask, vertex_mask
+                ),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    current = (
+        min(
+            timeit.repeat(
+                lambda: reconcile_selection(
+                    mesh.f, face_mask, vertex_mask, prune_orphan_vertices=True
+                ),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    report("reconcile_selection", current, baseline)
+
+    # `Selection.generate_masks()` reconciles each branch of a union, and then
+    # the union itself.
+    def select_union():
+        return (
+            mesh.select()
+            .vertices_above(0, np.repeat(0.75, 3))
+            .union()
+            .vertices_below(1, np.repeat(0.25, 3))
+            .generate_masks()
+        )
+
+    with mock.patch(
+        "lacecore._selection.selection_object.reconcile_selection_unchecked",
+        reconcile_selection_unchecked_with_setdiff,
+    ):
+        baseline = min(timeit.repeat(select_union, number=number, repeat=3)) / number
+    current = min(timeit.repeat(select_union, number=number, repeat=3)) / number
+    report("Selection.generate_masks() with union", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
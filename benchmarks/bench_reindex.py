@@ -0,0 +1,57 @@
+"""
+Compare `reindex_vertices()` and `reindex_faces()`, which check and invert
+the ordering in linear time, against checking it with `np.unique()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh, reindex_faces, reindex_vertices
+import numpy as np
+
+
+def reindex_vertices_with_unique(mesh, ordering):
+    unique_values, inverse = np.unique(ordering, return_index=True)
+    if not np.array_equal(unique_values, np.arange(mesh.num_v)):
+        raise ValueError("Expected a permutation")
+    return Mesh(v=mesh.v[ordering], f=inverse[mesh.f], face_groups=mesh.face_groups)
+
+
+def reindex_faces_with_unique(mesh, ordering):
+    if not np.array_equal(np.unique(ordering), np.arange(mesh.num_f)):
+        raise ValueError("Expected a permutation")
+    return Mesh(v=mesh.v, f=mesh.f[ordering], face_groups=mesh.face_groups)
+
+
+def main(num_cells_per_side=1000, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+    np.random.seed(0)
+    vertex_ordering = np.random.permutation(mesh.num_v)
+    face_ordering = np.random.permutation(mesh.num_f)
+
+    for name, fn, baseline_fn, ordering in (
+        (
+            "reindex_vertices()",
+            reindex_vertices,
+            reindex_vertices_with_unique,
+            vertex_ordering,
+        ),
+        ("reindex_faces()", reindex_faces, reindex_faces_with_unique, face_ordering),
+    ):
+        baseline = (
+            min(
+                timeit.repeat(
+                    lambda: baseline_fn(mesh, ordering), number=number, repeat=3
+                )
+            )
+            / number
+        )
+        current = (
+            min(timeit.repeat(lambda: fn(mesh, ordering), number=number, repeat=3))
+            / number
+        )
+        report(name, current, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare `Mesh.sliced_by_plane()` with several planes against slicing by one
+plane at a time, which it replaced.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+from polliwog import Plane
+from polliwog.plane import slice_triangles_by_plane
+
+
+def sliced_one_plane_at_a_time(mesh, *planes, only_for_selection=None):
+    working = mesh
+    for plane in planes:
+        if only_for_selection is None:
+            faces_to_slice = None
+        else:
+            selection = working.select()
+            only_for_selection(selection)
+            faces_to_slice, _ = selection.generate_masks()
+
+        vertices, faces, face_mapping = slice_triangles_by_plane(
+            vertices=working.v,
+            faces=working.f,
+            plane_reference_point=plane.reference_point,
+            plane_normal=plane.normal,
+            faces_to_slice=faces_to_slice,
+            ret_face_mapping=True,
+        )
+        face_groups = (
+            None
+            if working.face_groups is None
+            else working.face_groups.reindexed(face_mapping)
+        )
+        working = Mesh(v=vertices, f=faces, face_groups=face_groups)
+    return working
+
+
+def main(num_cells_per_side=700, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    # Cut out a box around the middle of the sheet.
+    center = np.array([0.5, 0.5, 0.0])
+    planes = [
+        Plane(center - 0.2937 * normal, normal)
+        for axis in np.eye(3)
+        for normal in (axis, -axis)
+    ]
+
+    def only_for_selection(selection):
+        selection.vertices_at_or_above(1, np.repeat(0.1, 3))
+
+    for name, kwargs in (
+        ("sliced_by_plane (6 planes)", {}),
+        (
+            "sliced_by_plane (6 planes, with selection)",
+            {"only_for_selection": only_for_selection},
+        ),
+    ):
+        baseline = (
+            min(
+                timeit.repeat(
+                    lambda: sliced_one_plane_at_a_time(mesh, *planes, **kwargs),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+        current = (
+            min(
+                timeit.repeat(
+                    lambda: mesh.sliced_by_plane(*planes, **kwargs),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+        report(name, current, baseline)
+
+
+if __name__ == "__main__":
+    main()
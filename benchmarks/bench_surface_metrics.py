@@ -0,0 +1,62 @@
+"""
+Compare computing the face normals, face areas, surface area, volume and
+area-weighted centroid of a mesh, which share one gather of the corners and
+one cross product, against computing each of them separately.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+from polliwog.tri import surface_normals
+
+
+def surface_metrics_separately(mesh):
+    normals = surface_normals(mesh.v[mesh.f])
+    areas = 0.5 * np.linalg.norm(
+        surface_normals(mesh.v[mesh.f], normalize=False), axis=1
+    )
+    surface_area = np.sum(
+        0.5 * np.linalg.norm(surface_normals(mesh.v[mesh.f], normalize=False), axis=1)
+    )
+    corners = mesh.v[mesh.f]
+    volume = np.sum(corners[:, 0] * np.cross(corners[:, 1], corners[:, 2])) / 6.0
+    corners = mesh.v[mesh.f]
+    face_areas = 0.5 * np.linalg.norm(
+        np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1
+    )
+    centroid = np.sum(
+        np.mean(corners, axis=1) * face_areas[:, np.newaxis], axis=0
+    ) / np.sum(face_areas)
+    return normals, areas, surface_area, volume, centroid
+
+
+def main(num_cells_per_side=300, number=10):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    def surface_metrics():
+        # Use a fresh mesh, so nothing is cached from the previous run.
+        fresh = Mesh(v=mesh.v, f=mesh.f)
+        return (
+            fresh.face_normals(),
+            fresh.face_areas(),
+            fresh.surface_area,
+            fresh.volume,
+            fresh.area_weighted_centroid,
+        )
+
+    baseline = (
+        min(
+            timeit.repeat(
+                lambda: surface_metrics_separately(mesh), number=number, repeat=3
+            )
+        )
+        / number
+    )
+    current = min(timeit.repeat(surface_metrics, number=number, repeat=3)) / number
+    report("Normals, areas, surface area, volume and centroid", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
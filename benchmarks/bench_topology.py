@@ -0,0 +1,37 @@
+"""
+Compare building the edges and face edges of a mesh with a single sort of
+the sides of the faces, which also yields the edge faces, against finding
+the unique sorted pairs of vertices with `np.unique()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+
+
+def topology_with_unique(mesh):
+    sides = np.stack([mesh.f, np.roll(mesh.f, -1, axis=1)], axis=-1).reshape(-1, 2)
+    edges, face_edges = np.unique(np.sort(sides, axis=1), axis=0, return_inverse=True)
+    return edges, face_edges.reshape(mesh.f.shape)
+
+
+def main(num_cells_per_side=300, number=5):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    def topology():
+        # Use a fresh mesh, so nothing is cached from the previous run.
+        fresh = Mesh(v=mesh.v, f=mesh.f)
+        return fresh.edges(), fresh.face_edges()
+
+    baseline = (
+        min(timeit.repeat(lambda: topology_with_unique(mesh), number=number, repeat=3))
+        / number
+    )
+    current = min(timeit.repeat(topology, number=number, repeat=3)) / number
+    report("Edges and face edges", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare transforming a mesh repeatedly, as in an animation or fitting loop,
+with and without a preallocated output buffer, and chaining transforms,
+against the previous implementation of `Transform.end()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+from polliwog import CompositeTransform
+from vg.compat import v2 as vg
+
+
+def transformed_with_composite_transform(mesh, rotation, translation):
+    transform = CompositeTransform()
+    transform.rotate(rotation)
+    transform.translate(translation)
+    transform.flip(0)
+    flipped = np.copy(mesh.f)
+    flipped[()] = np.fliplr(mesh.f)
+    return Mesh(v=transform(mesh.v), f=flipped)
+
+
+def chained_with_composite_transform(mesh, rotation, translation):
+    for apply in (
+        lambda transform: transform.translate(translation),
+        lambda transform: transform.rotate(rotation),
+        lambda transform: transform.uniform_scale(2.0),
+    ):
+        transform = CompositeTransform()
+        apply(transform)
+        mesh = Mesh(v=transform(mesh.v), f=mesh.f)
+    return mesh
+
+
+def main(num_cells_per_side=300, number=20):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    rotation = np.array([0.1, 0.2, 0.3])
+    translation = vg.basis.z
+    out = np.empty((mesh.num_v, 3))
+
+    def transformed(out=None):
+        return (
+            mesh.transform()
+            .rotate(rotation)
+            .translate(translation)
+            .flip(0)
+            .end(out=out)
+        )
+
+    baseline = (
+        min(
+            timeit.repeat(
+                lambda: transformed_with_composite_transform(
+                    mesh, rotation, translation
+                ),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    for name, function in (
+        # Read the vertices, which are otherwise computed lazily.
+        ("Transform.end()", lambda: transformed().v),
+        ("Transform.end(out=...)", lambda: transformed(out=out)),
+    ):
+        current = min(timeit.repeat(function, number=number, repeat=3)) / number
+        report(name, current, baseline)
+
+    baseline = (
+        min(
+            timeit.repeat(
+                lambda: chained_with_composite_transform(mesh, rotation, translation),
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    current = (
+        min(
+            timeit.repeat(
+                lambda: mesh.translated(translation)
+                .rotated(rotation)
+                .uniformly_scaled(2.0)
+                .v,
+                number=number,
+                repeat=3,
+            )
+        )
+        / number
+    )
+    report("Chain of three transforms", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
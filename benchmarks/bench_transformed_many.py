@@ -0,0 +1,54 @@
+"""
+Compare `Mesh.transformed_many()` against building a transform and a mesh
+for each of many candidate rigid transforms.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+import numpy as np
+
+
+def main(num_cells_per_side=100, num_transforms=1000, number=3):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    np.random.seed(0)
+    matrices = np.zeros((num_transforms, 4, 4))
+    matrices[:, :3, :3] = np.linalg.qr(np.random.randn(num_transforms, 3, 3))[0]
+    matrices[:, :3, 3] = np.random.randn(num_transforms, 3)
+    matrices[:, 3, 3] = 1.0
+
+    def one_at_a_time():
+        return [
+            mesh.transform().append_transform(matrix).end().v for matrix in matrices
+        ]
+
+    buffer = np.empty((100, mesh.num_v, 3))
+
+    def in_chunks_with_buffer():
+        for start in range(0, len(matrices), len(buffer)):
+            chunk = matrices[start : start + len(buffer)]
+            mesh.transformed_many(chunk, out=buffer[: len(chunk)])
+
+    baseline = min(timeit.repeat(one_at_a_time, number=number, repeat=3)) / number
+    current = (
+        min(
+            timeit.repeat(
+                lambda: mesh.transformed_many(matrices), number=number, repeat=3
+            )
+        )
+        / number
+    )
+    report(f"transformed_many ({num_transforms} transforms)", current, baseline)
+    current = (
+        min(timeit.repeat(in_chunks_with_buffer, number=number, repeat=3)) / number
+    )
+    report(
+        f"transformed_many ({num_transforms} transforms, reused buffer)",
+        current,
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare `Mesh.vertex_normals()`, which scatters the face normals onto the
+vertices with `np.bincount()`, against accumulating them with `np.add.at()`.
+"""
+
+import timeit
+from _meshes import grid_mesh, report
+from lacecore import Mesh
+import numpy as np
+from polliwog.tri import surface_normals
+from vg.compat import v2 as vg
+
+
+def vertex_normals_with_add_at(mesh, weighting):
+    corners = mesh.v[mesh.f]
+    face_normals = surface_normals(corners, normalize=weighting != "area")
+    result = np.zeros((mesh.num_v, 3))
+    for i in range(3):
+        if weighting == "angle":
+            weights = vg.angle(
+                corners[:, (i + 1) % 3] - corners[:, i],
+                corners[:, i - 1] - corners[:, i],
+                units="rad",
+            )[:, np.newaxis]
+        else:
+            weights = 1.0
+        np.add.at(result, mesh.f[:, i], weights * face_normals)
+    return vg.normalize(result)
+
+
+def main(num_cells_per_side=300, number=10):
+    mesh = grid_mesh(num_cells_per_side)
+    print(f"Mesh with {mesh.num_v} vertices and {mesh.num_f} faces")
+
+    for weighting in ("area", "angle"):
+        baseline = (
+            min(
+                timeit.repeat(
+                    lambda: vertex_normals_with_add_at(mesh, weighting),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+        current = (
+            min(
+                timeit.repeat(
+                    # Use a fresh mesh, so nothing is cached from the previous
+                    # run.
+                    lambda: Mesh(v=mesh.v, f=mesh.f).vertex_normals(
+                        weighting=weighting
+                    ),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+        report(f"vertex_normals(weighting={weighting!r})", current, baseline)
+
+
+if __name__ == "__main__":
+    main()
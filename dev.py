@@ -12,6 +12,7 @@ def python_source_files():
         glob.glob("*.py")
         + glob.glob("lacecore/*.py")
         + glob.glob("lacecore/**/*.py")
+        + glob.glob("benchmarks/*.py")
         + ["doc/"]
     )
     exclude_paths = []
@@ -60,6 +61,19 @@ def coverage_report():
     sh.open("htmlcov/index.html", _fg=True)
 
 
+@cli.command()
+@click.argument("names", nargs=-1)
+def benchmark(names):
+    paths = (
+        [f"benchmarks/bench_{name}.py" for name in names]
+        if names
+        else sorted(glob.glob("benchmarks/bench_*.py"))
+    )
+    for path in paths:
+        click.echo(f"# {path}")
+        sh.python(os.path.basename(path), _cwd="benchmarks", _fg=True)
+
+
 @cli.command()
 def lint():
     sh.flake8(*python_source_files(), _fg=True)
@@ -1,4 +1,10 @@
-from ._common.reindexing import reindex_faces, reindex_vertices  # noqa: F401
+from ._common.reindexing import (  # noqa: F401
+    first_use_vertex_order,
+    reindex_faces,
+    reindex_vertices,
+    spatial_face_order,
+    spatial_vertex_order,
+)
 from ._common.validation import check_arity, check_indices  # noqa: F401
 from ._group_map import GroupMap  # noqa: F401
 from ._mesh import FACE_DTYPE, Mesh  # noqa: F401
@@ -9,5 +15,7 @@ from ._obj.loader import (  # noqa: F401
     loads as load_obj_string,
 )
 from ._obj.writer import write as write_obj  # noqa: F401
+from ._selection.clipper import Clipper  # noqa: F401
 from ._selection.selection_object import Selection  # noqa: F401
+from ._topology.adjacency import Adjacency  # noqa: F401
 from ._transform.transform_object import Transform  # noqa: F401
@@ -1,19 +1,102 @@
+import numpy as np
 from vg.compat import v2 as vg
+from .._common.cache import cached
+
+# How far the linear part of a transform may be from a rotation or
+# reflection times a uniform scale, relative to the squared scale, for
+# quantities to be derived from those of the mesh which was transformed.
+SIMILARITY_TOLERANCE = 1e-12
+
+
+def _cross(a, b):
+    # Like `np.cross()` for `kx3` arrays, with less overhead.
+    result = np.empty_like(a)
+    result[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+    result[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+    result[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    return result
 
 
 class AnalysisMixin:
+    def _similarity_of_transform(self):
+        # When the mesh was produced by rotating, reflecting, uniformly
+        # scaling and translating another mesh, return the linear part of
+        # the transform divided by the scale, which is orthogonal, and the
+        # scale. Otherwise return `None`.
+        if self._transform_source is None:
+            return None
+        linear = self._transform_matrix[:3, :3]
+        gram = linear.T @ linear
+        squared_scale = np.trace(gram) / 3.0
+        if squared_scale == 0.0 or not np.allclose(
+            gram,
+            squared_scale * np.eye(3),
+            rtol=0.0,
+            atol=SIMILARITY_TOLERANCE * squared_scale,
+        ):
+            return None
+        scale = np.sqrt(squared_scale)
+        return linear / scale, scale
+
+    @cached
+    def _vertex_centroid(self):
+        if self._transform_source is None:
+            result = vg.average(self.v)
+        else:
+            # The centroid commutes with any affine transform.
+            result = (
+                self._transform_matrix[:3, :3]
+                @ self._transform_source._vertex_centroid()
+                + self._transform_matrix[:3, 3]
+            )
+        result.setflags(write=False)
+        return result
+
     @property
     def vertex_centroid(self):
         """
         The centroid or geometric average of the vertices.
+
+        For a mesh produced by a transform, it's computed from the centroid
+        of the mesh which was transformed.
         """
-        return vg.average(self.v)
+        return self._vertex_centroid().copy()
+
+    @cached
+    def _vertex_extent(self):
+        # The lowest and highest coordinates of the vertices along each axis,
+        # as a `2x3` array.
+        if self._transform_source is not None:
+            linear = self._transform_matrix[:3, :3]
+            if np.all(np.count_nonzero(linear, axis=0) == 1) and np.all(
+                np.count_nonzero(linear, axis=1) == 1
+            ):
+                # A transform which only scales, flips, swaps and translates
+                # the axes maps the extent of the source to the corners of
+                # this one. Since rounding is monotonic, the result is exact.
+                from .._transform.affine import apply_affine_transforms
+
+                corners = apply_affine_transforms(
+                    self._transform_source._vertex_extent(),
+                    self._transform_matrix[np.newaxis],
+                    np.empty((1, 2, 3)),
+                )[0]
+                result = np.array([corners.min(axis=0), corners.max(axis=0)])
+                result.setflags(write=False)
+                return result
+        result = np.array([np.min(self.v, axis=0), np.max(self.v, axis=0)])
+        result.setflags(write=False)
+        return result
 
     @property
     def bounding_box(self):
         """
         A bounding box around the vertices.
 
+        For a mesh produced by a transform which scales, flips or translates
+        along the axes, it's computed from the bounding box of the mesh which
+        was transformed.
+
         Returns:
             polliwog.Box: The bounding box.
 
@@ -22,7 +105,8 @@ class AnalysisMixin:
         """
         from polliwog import Box
 
-        return Box.from_points(self.v)
+        lower, upper = self._vertex_extent()
+        return Box(origin=lower, size=upper - lower)
 
     def apex(self, along):
         """
@@ -37,10 +121,85 @@ class AnalysisMixin:
         """
         return vg.apex(self.v, along=along)
 
+    def _face_orientation_of_transform(self):
+        # The faces of a mesh produced by a transform are those of the mesh
+        # which was transformed, or its flipped faces.
+        return 1.0 if self.f is self._transform_source.f else -1.0
+
+    @cached
+    def _face_corners(self):
+        # The vertices of the faces, gathered once for all the per-face
+        # quantities. They're stored corner by corner, as a `3xkx3` or
+        # `4xkx3` array, so each corner of all the faces is contiguous.
+        result = self.v[self.f.T]
+        result.setflags(write=False)
+        return result
+
+    @cached
+    def _face_centroids(self):
+        corners = self._face_corners()
+        result = np.sum(corners, axis=0) / len(corners)
+        result.setflags(write=False)
+        return result
+
+    @cached
+    def _face_cross_products(self):
+        # For triangles, the cross product of two edges, and for quads, of
+        # the diagonals. Either way, it's twice the face's vector area.
+        similarity = self._similarity_of_transform()
+        if similarity is not None:
+            # The cross products of a mesh which was rotated, reflected and
+            # uniformly scaled are rotated and reflected, and their lengths
+            # scaled by the square of the scale. A reflection reverses them,
+            # unless the faces were flipped to compensate.
+            orthogonal, scale = similarity
+            factor = (
+                self._face_orientation_of_transform()
+                * np.sign(np.linalg.det(orthogonal))
+                * scale**2
+            )
+            result = self._transform_source._face_cross_products() @ (
+                factor * orthogonal.T
+            )
+        else:
+            corners = self._face_corners()
+            if self.is_tri:
+                result = _cross(corners[1] - corners[0], corners[2] - corners[0])
+            else:
+                result = _cross(corners[2] - corners[0], corners[3] - corners[1])
+        result.setflags(write=False)
+        return result
+
+    @cached
+    def _face_normals(self, normalize):
+        if not normalize:
+            return self._face_cross_products()
+        similarity = self._similarity_of_transform()
+        if similarity is not None:
+            orthogonal, _ = similarity
+            factor = self._face_orientation_of_transform() * np.sign(
+                np.linalg.det(orthogonal)
+            )
+            result = self._transform_source._face_normals(normalize) @ (
+                factor * orthogonal.T
+            )
+        else:
+            result = self._face_cross_products() / (
+                2.0 * self._face_areas()[:, np.newaxis]
+            )
+        result.setflags(write=False)
+        return result
+
     def face_normals(self, normalize=True):
         """
         Compute surface normals of each face. The direction of the normal
         follows conventional counter-clockwise winding and the right-hand rule.
+        The normal of a quad is the cross product of its diagonals, which is
+        perpendicular to its vector area.
+
+        For a mesh produced by a transform which rotates, reflects, uniformly
+        scales or translates, they're computed from the normals of the mesh
+        which was transformed.
 
         Args:
             normalize (bool): When True, return unit-length normals.
@@ -48,6 +207,268 @@ class AnalysisMixin:
         Returns:
             np.ndarray: Face normals as `(k, 3)`.
         """
-        from polliwog.tri import surface_normals
+        return self._face_normals(normalize).copy()
+
+    @cached
+    def _face_areas(self):
+        similarity = self._similarity_of_transform()
+        if similarity is None:
+            cross_products = self._face_cross_products()
+            result = 0.5 * np.sqrt(
+                np.einsum("ij,ij->i", cross_products, cross_products)
+            )
+        else:
+            _, scale = similarity
+            result = scale**2 * self._transform_source._face_areas()
+        result.setflags(write=False)
+        return result
+
+    def face_areas(self):
+        """
+        Compute the area of each face. The area of a quad is the length of
+        its vector area, which is its area when it's planar.
+
+        The computation shares its work with `face_normals()`, `volume`,
+        `surface_area` and `area_weighted_centroid`, so asking for several of
+        them costs about the same as asking for one.
+
+        Returns:
+            np.ndarray: Face areas as `(k,)`.
+        """
+        return self._face_areas().copy()
+
+    @property
+    def surface_area(self):
+        """
+        The total area of the faces.
+
+        Returns:
+            float: The surface area.
+        """
+        return float(np.sum(self._face_areas()))
+
+    @cached
+    def _volume(self):
+        if self._transform_source is not None:
+            # Volume is scaled by the determinant of any affine transform, and
+            # reversed when the faces are flipped.
+            return float(
+                self._face_orientation_of_transform()
+                * np.linalg.det(self._transform_matrix[:3, :3])
+                * self._transform_source._volume()
+            )
+        # By the divergence theorem, the volume is a third of the flux of the
+        # position through the surface. For a quad, the flux through the
+        # bilinear patch spanning its corners is that through its vector area
+        # at the average of the corners. Measuring from the vertex centroid
+        # reduces cancellation.
+        return float(
+            np.einsum(
+                "ij,ij->",
+                self._face_centroids() - self._vertex_centroid(),
+                self._face_cross_products(),
+            )
+            / 6.0
+        )
+
+    @property
+    def volume(self):
+        """
+        The volume enclosed by the surface, which is meaningful for a closed
+        mesh. It's positive when the faces are wound counter-clockwise when
+        viewed from outside, and negative when they're wound the other way.
+
+        Returns:
+            float: The volume.
+        """
+        return self._volume()
+
+    @cached
+    def _area_weighted_centroid(self):
+        similarity = self._similarity_of_transform()
+        if similarity is None:
+            areas = self._face_areas()
+            result = areas @ self._face_centroids() / np.sum(areas)
+        else:
+            result = (
+                self._transform_matrix[:3, :3]
+                @ self._transform_source._area_weighted_centroid()
+                + self._transform_matrix[:3, 3]
+            )
+        result.setflags(write=False)
+        return result
+
+    @property
+    def area_weighted_centroid(self):
+        """
+        The average of the centroids of the faces, weighted by their areas.
+        The centroid of a quad is taken to be the average of its corners.
+
+        Returns:
+            np.ndarray: The centroid as `(3,)`.
+        """
+        return self._area_weighted_centroid().copy()
+
+    @cached
+    def _vertex_normals(self, weighting):
+        similarity = self._similarity_of_transform()
+        if similarity is not None:
+            # Like the face normals, the vertex normals of a mesh which was
+            # rotated, reflected and uniformly scaled are rotated and
+            # reflected.
+            orthogonal, _ = similarity
+            factor = self._face_orientation_of_transform() * np.sign(
+                np.linalg.det(orthogonal)
+            )
+            result = self._transform_source._vertex_normals(weighting) @ (
+                factor * orthogonal.T
+            )
+            result.setflags(write=False)
+            return result
+
+        num_corners = self.f.shape[1]
+        if weighting == "area":
+            # The cross products' lengths are proportional to the areas.
+            face_normals = self._face_cross_products()
+        else:
+            # Give degenerate faces, whose normals are undefined, no weight.
+            cross_products = self._face_cross_products()
+            lengths = 2.0 * self._face_areas()[:, np.newaxis]
+            face_normals = np.divide(
+                cross_products,
+                lengths,
+                out=np.zeros_like(cross_products),
+                where=lengths > 0,
+            )
+        if weighting == "angle":
+            # The angle at each corner, between the edge which arrives and the
+            # edge which leaves.
+            corners = self._face_corners()
+            leaving = np.roll(corners, -1, axis=0) - corners
+            arriving = np.roll(leaving, 1, axis=0)
+            cosines = -np.einsum("ijk,ijk->ij", leaving, arriving)
+            if self.is_tri:
+                # The cross product of any two edges of a triangle has the
+                # same length.
+                sines = 2.0 * self._face_areas()
+            else:
+                cross_products = _cross(leaving.reshape(-1, 3), arriving.reshape(-1, 3))
+                sines = np.sqrt(
+                    np.einsum("ij,ij->i", cross_products, cross_products)
+                ).reshape(num_corners, self.num_f)
+            corner_weights = np.arctan2(sines, cosines)
+        else:
+            corner_weights = None
+
+        # Scatter the weighted normals of the corners onto their vertices, one
+        # coordinate at a time. The corners are ordered corner by corner, like
+        # `_face_corners()`.
+        vertex_indices = self.f.T.ravel()
+        result = np.empty((self.num_v, 3))
+        for i in range(3):
+            if corner_weights is None:
+                weights = np.tile(face_normals[:, i], num_corners)
+            else:
+                weights = (corner_weights * face_normals[:, i]).ravel()
+            result[:, i] = np.bincount(
+                vertex_indices, weights=weights, minlength=self.num_v
+            )
+        lengths = np.sqrt(np.einsum("ij,ij->i", result, result))
+        # Leave the normals of vertices which aren't referenced by any faces
+        # zero.
+        np.divide(
+            result, lengths[:, np.newaxis], out=result, where=lengths[:, np.newaxis] > 0
+        )
+        result.setflags(write=False)
+        return result
+
+    def vertex_normals(self, weighting="area"):
+        """
+        Compute unit normals of each vertex by averaging the normals of the
+        faces which reference it. Vertices which aren't referenced by any
+        face have zero normals.
+
+        The result is cached. For a mesh produced by a transform which
+        rotates, reflects, uniformly scales or translates, it's computed from
+        the vertex normals of the mesh which was transformed.
+
+        Args:
+            weighting (str): How to weight the normal of each face: `"area"`
+                by its area, `"angle"` by its angle at the vertex, and
+                `"uniform"` equally.
+
+        Returns:
+            np.ndarray: Vertex normals as `(k, 3)`.
+        """
+        if weighting not in ("area", "angle", "uniform"):
+            raise ValueError("Expected weighting to be 'area', 'angle', or 'uniform'")
+        return self._vertex_normals(weighting).copy()
+
+    def cross_sections(
+        self,
+        planes=None,
+        axis=None,
+        offsets=None,
+        ret_face_indices=False,
+        executor=None,
+    ):
+        """
+        Intersect the mesh with a stack of parallel planes, such as
+        horizontal slices at regular intervals, in one pass.
+
+        The planes may be given either as `polliwog.Plane` objects which share
+        a normal, or as an axis and the offset of each plane along it. Each
+        face is tested against only the planes which cross it, so the cost
+        grows with the size of the result rather than with the number of
+        faces times the number of planes.
+
+        Polylines pass once through each vertex which lies in a plane. Faces
+        which lie in a plane contribute only the edges which they share with
+        faces which don't.
+
+        Args:
+            planes (list): A list of parallel `polliwog.Plane` objects.
+            axis (np.arraylike): A `(3,)` normal shared by the planes, which
+                need not be normalized.
+            offsets (np.arraylike): The signed distance of each plane from
+                the origin along `axis`.
+            ret_face_indices (bool): When `True`, also return the faces
+                crossed by each polyline.
+            executor (concurrent.futures.Executor): An optional executor,
+                such as a `ThreadPoolExecutor`, used to process batches of
+                planes concurrently.
+
+        Returns:
+            list: For each plane, a list of the `polliwog.Polyline` objects
+            where it crosses the surface. Loops around the surface are
+            closed. When `ret_face_indices` is `True`, returns a tuple
+            `(polylines, face_indices)`, where `face_indices` contains, for
+            each polyline, an array of the index of the face crossed by each
+            of its segments.
+        """
+        from .cross_sections import cross_sections
+
+        if planes is not None:
+            if axis is not None or offsets is not None:
+                raise ValueError("Expected either planes, or axis and offsets")
+            if len(planes) == 0:
+                return ([], []) if ret_face_indices else []
+            normal = planes[0].normal
+            if not all(np.allclose(plane.normal, normal) for plane in planes):
+                raise ValueError("Expected planes to be parallel")
+            offsets = np.array([plane.reference_point.dot(normal) for plane in planes])
+        else:
+            if axis is None or offsets is None:
+                raise ValueError("Expected either planes, or axis and offsets")
+            axis = np.asarray(axis, dtype=np.float64)
+            offsets = np.asarray(offsets, dtype=np.float64)
+            vg.shape.check(locals(), "axis", (3,))
+            vg.shape.check(locals(), "offsets", (-1,))
+            if not np.any(axis):
+                raise ValueError("Expected axis to be nonzero")
+            normal = vg.normalize(axis)
 
-        return surface_normals(self.v[self.f], normalize=normalize)
+        polylines, face_indices = cross_sections(
+            self.v, self.f, normal, offsets, executor=executor
+        )
+        return (polylines, face_indices) if ret_face_indices else polylines
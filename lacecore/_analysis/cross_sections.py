@@ -0,0 +1,224 @@
+import numpy as np
+from .._common.chains import link_segments
+from .._common.ranges import concatenate_ranges
+
+# Roughly how many triangles are intersected together. Batches always contain
+# whole planes, so each one's polylines can be assembled independently.
+BATCH_SIZE = 2**16
+
+
+def _unique_rows(*columns):
+    # Like `np.unique(np.column_stack(columns), axis=0, return_index=True,
+    # return_inverse=True)`, without the overhead of comparing whole rows.
+    order = np.lexsort(columns[::-1])
+    is_new = np.zeros(len(order), dtype=bool)
+    is_new[:1] = True
+    for column in columns:
+        sorted_column = column[order]
+        is_new[1:] |= sorted_column[1:] != sorted_column[:-1]
+    inverse = np.empty(len(order), dtype=np.int64)
+    inverse[order] = np.cumsum(is_new) - 1
+    return order[is_new], inverse
+
+
+def _cross_sections_of_batch(
+    vertices, heights, tris, plane_indices, offsets, tri_indices
+):
+    # Intersect each triangle with the corresponding plane, which it's known
+    # to cross, and link the resulting segments into polylines.
+    from polliwog import Polyline
+
+    tris_to_intersect = tris[tri_indices]
+    heights_of_tris = heights[tris_to_intersect]
+    offsets_of_tris = offsets[:, np.newaxis]
+    # Classify the vertices strictly, so exactly two edges of each triangle
+    # cross its plane, or none.
+    is_above = heights_of_tris > offsets_of_tris
+    is_on = heights_of_tris == offsets_of_tris
+    # A triangle with an edge in the plane yields that edge. Classify the
+    # edge as above the plane when the triangle's third vertex is below it,
+    # so the edge is found from either side.
+    has_edge_on_plane_from_below = np.logical_and(
+        np.count_nonzero(is_on, axis=1) == 2, ~np.any(is_above, axis=1)
+    )
+    is_above |= is_on & has_edge_on_plane_from_below[:, np.newaxis]
+    is_crossing = is_above != np.roll(is_above, -1, axis=1)
+    # Triangles which only touch the plane don't cross it.
+    is_crossed = np.any(is_crossing, axis=1)
+    tris_to_intersect, is_above, is_on, is_crossing = (
+        tris_to_intersect[is_crossed],
+        is_above[is_crossed],
+        is_on[is_crossed],
+        is_crossing[is_crossed],
+    )
+    plane_indices, offsets, tri_indices = (
+        plane_indices[is_crossed],
+        offsets[is_crossed],
+        tri_indices[is_crossed],
+    )
+    edge_starts = tris_to_intersect[is_crossing]
+    edge_ends = np.roll(tris_to_intersect, -1, axis=1)[is_crossing]
+
+    # Orient each segment from the edge where the winding crosses upward to
+    # the one where it crosses downward. Adjacent, consistently wound faces
+    # traverse their shared edge in opposite directions, so their segments
+    # meet end to start.
+    is_upward = ~is_above[is_crossing].reshape(-1, 2)
+    segment_columns = np.where(is_upward[:, 0], 0, 1)[:, np.newaxis]
+    segment_columns = np.column_stack([segment_columns, 1 - segment_columns])
+
+    # Segments which cross the same edge of the same plane share a node. An
+    # edge which crosses at a vertex in the plane does so at the vertex, so
+    # the node is keyed by the vertex alone, and shared by all its edges.
+    lower = np.minimum(edge_starts, edge_ends)
+    upper = np.maximum(edge_starts, edge_ends)
+    vertices_on_plane = np.where(
+        is_on[is_crossing],
+        edge_starts,
+        np.where(np.roll(is_on, -1, axis=1)[is_crossing], edge_ends, -1),
+    )
+    is_vertex_node = vertices_on_plane >= 0
+    lower[is_vertex_node] = upper[is_vertex_node] = vertices_on_plane[is_vertex_node]
+    node_plane_indices = np.repeat(plane_indices, 2)
+    representatives, nodes = _unique_rows(node_plane_indices, lower, upper)
+    lower, upper = lower[representatives], upper[representatives]
+    differences = heights[upper] - heights[lower]
+    fractions = np.divide(
+        offsets.repeat(2)[representatives] - heights[lower],
+        differences,
+        out=np.zeros(len(representatives)),
+        where=lower != upper,
+    )
+    points = vertices[lower] + fractions[:, np.newaxis] * (
+        vertices[upper] - vertices[lower]
+    )
+
+    segments = np.take_along_axis(nodes.reshape(-1, 2), segment_columns, axis=1)
+    # Drop the segments of triangles which touch the plane at a single
+    # vertex, which have no length, and keep one of the segments along an
+    # edge in the plane which is shared by several triangles.
+    is_kept = segments[:, 0] != segments[:, 1]
+    first_of_segments, _ = _unique_rows(
+        np.min(segments, axis=1), np.max(segments, axis=1)
+    )
+    is_first = np.zeros(len(segments), dtype=bool)
+    is_first[first_of_segments] = True
+    is_kept &= is_first
+    segments, plane_indices, tri_indices = (
+        segments[is_kept],
+        plane_indices[is_kept],
+        tri_indices[is_kept],
+    )
+
+    results = []
+    for chain_nodes, chain_segments in link_segments(segments, len(points)):
+        is_closed = len(chain_nodes) > 1 and chain_nodes[-1] == chain_nodes[0]
+        if is_closed:
+            chain_nodes = chain_nodes[:-1]
+        results.append(
+            (
+                plane_indices[chain_segments[0]],
+                Polyline(v=points[chain_nodes], is_closed=is_closed),
+                tri_indices[chain_segments],
+            )
+        )
+    return results
+
+
+def cross_sections(vertices, faces, normal, offsets, executor=None):
+    """
+    Intersect the given triangles or quads with a stack of parallel planes.
+
+    Rather than testing every face against every plane, the planes are
+    sorted, so the planes crossing each face form a contiguous range which
+    can be found by bisection. The work is then proportional to the number
+    of faces plus the number of segments found.
+
+    Args:
+        vertices (np.ndarray): A `kx3` array of vertices.
+        faces (np.ndarray): A `kx3` or `kx4` array of vertex indices.
+        normal (np.ndarray): The unit normal shared by the planes.
+        offsets (np.ndarray): The signed distance of each plane from the
+            origin, along the normal.
+        executor (concurrent.futures.Executor): An optional executor, such
+            as a `ThreadPoolExecutor`, used to process batches of planes
+            concurrently.
+
+    Returns:
+        tuple: `(polylines, face_indices)`, each with one list per plane.
+        `face_indices` contains, for each polyline, the index of the face
+        which each of its segments crosses.
+    """
+    if faces.shape[1] == 4:
+        from polliwog.tri import quads_to_tris
+
+        tris = quads_to_tris(faces)
+        face_indices_of_tris = np.arange(len(tris)) // 2
+    else:
+        tris = faces
+        face_indices_of_tris = np.arange(len(tris))
+
+    heights = vertices.dot(normal)
+    heights_of_tris = heights[tris]
+    order = np.argsort(offsets, kind="stable")
+    sorted_offsets = offsets[order]
+    # A triangle may cross the planes whose offsets lie between its lowest
+    # and highest heights, inclusive. Those which only touch a plane are
+    # discarded along the way.
+    first_planes = np.searchsorted(
+        sorted_offsets, np.min(heights_of_tris, axis=1), side="left"
+    )
+    last_planes = np.searchsorted(
+        sorted_offsets, np.max(heights_of_tris, axis=1), side="right"
+    )
+    num_crossings = last_planes - first_planes
+    plane_indices = concatenate_ranges(first_planes, last_planes)
+    by_plane = np.argsort(plane_indices, kind="stable")
+    plane_indices = plane_indices[by_plane]
+    tri_indices = np.repeat(np.arange(len(tris)), num_crossings)[by_plane]
+
+    # Cut the crossings into batches at plane boundaries.
+    first_crossing_of_plane = np.searchsorted(
+        plane_indices, np.arange(len(offsets) + 1)
+    )
+    planes_at_batch_starts = (
+        np.searchsorted(
+            first_crossing_of_plane,
+            np.arange(0, len(plane_indices), BATCH_SIZE),
+            side="right",
+        )
+        - 1
+    )
+    batch_boundaries = np.unique(
+        np.append(first_crossing_of_plane[planes_at_batch_starts], len(plane_indices))
+    )
+    batches = [
+        slice(start, stop)
+        for start, stop in zip(batch_boundaries[:-1], batch_boundaries[1:])
+    ]
+
+    def process(batch):
+        return _cross_sections_of_batch(
+            vertices,
+            heights,
+            tris,
+            plane_indices[batch],
+            sorted_offsets[plane_indices[batch]],
+            tri_indices[batch],
+        )
+
+    if executor is None:
+        results = list(map(process, batches))
+    else:
+        results = list(executor.map(process, batches))
+
+    polylines = [[] for _ in offsets]
+    face_indices = [[] for _ in offsets]
+    for batch_results in results:
+        for sorted_plane_index, polyline, tri_indices_of_polyline in batch_results:
+            plane_index = order[sorted_plane_index]
+            polylines[plane_index].append(polyline)
+            face_indices[plane_index].append(
+                face_indices_of_tris[tri_indices_of_polyline]
+            )
+    return polylines, face_indices
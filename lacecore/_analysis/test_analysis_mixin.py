@@ -1,5 +1,7 @@
-from lacecore import shapes
+from lacecore import Mesh, shapes
 import numpy as np
+from polliwog import Plane
+import pytest
 from vg.compat import v2 as vg
 
 
@@ -23,6 +25,22 @@ def test_apex():
     )
 
 
+def quad_cube(cube):
+    return Mesh(
+        v=cube.v,
+        f=np.array(
+            [
+                [0, 1, 2, 3],
+                [7, 6, 5, 4],
+                [4, 5, 1, 0],
+                [5, 6, 2, 1],
+                [6, 7, 3, 2],
+                [3, 7, 4, 0],
+            ]
+        ),
+    )
+
+
 def test_face_normals():
     cube_at_origin = shapes.cube(np.zeros(3), 3.0)
     np.testing.assert_array_equal(
@@ -42,3 +60,300 @@ def test_face_normals():
             axis=0,
         ),
     )
+
+
+def test_face_normals_of_quads():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    np.testing.assert_array_equal(
+        quad_cube(cube_at_origin).face_normals(),
+        cube_at_origin.face_normals()[::2],
+    )
+    np.testing.assert_array_equal(
+        quad_cube(cube_at_origin).face_normals(normalize=False),
+        2.0 * cube_at_origin.face_normals(normalize=False)[::2],
+    )
+
+
+def test_face_areas():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    np.testing.assert_array_equal(cube_at_origin.face_areas(), np.repeat(4.5, 12))
+    np.testing.assert_array_equal(
+        quad_cube(cube_at_origin).face_areas(), np.repeat(9.0, 6)
+    )
+
+    # Callers receive copies.
+    cube_at_origin.face_areas()[:] = 0.0
+    np.testing.assert_array_equal(cube_at_origin.face_areas(), np.repeat(4.5, 12))
+
+
+def test_surface_area_and_volume():
+    cube = shapes.cube(np.array([1.0, -2.0, 5.0]), 3.0)
+    for mesh in (cube, quad_cube(cube)):
+        assert mesh.surface_area == 54.0
+        np.testing.assert_almost_equal(mesh.volume, 27.0)
+        np.testing.assert_array_almost_equal(
+            mesh.area_weighted_centroid, np.array([2.5, -0.5, 6.5])
+        )
+    inward = Mesh(v=cube.v, f=np.fliplr(cube.f).astype(cube.f.dtype))
+    np.testing.assert_almost_equal(inward.volume, -27.0)
+
+
+def test_volume_of_non_planar_quads():
+    # Perturb the corners of a cube, so its quads are no longer planar, and
+    # compare against the volume enclosed by the bilinear patches spanning
+    # them, which is approximated by subdividing each one.
+    np.random.seed(0)
+    cube = shapes.cube(np.zeros(3), 3.0)
+    perturbed = quad_cube(cube)
+    perturbed = Mesh(v=perturbed.v + 0.3 * np.random.randn(8, 3), f=perturbed.f)
+
+    u, w = np.meshgrid(*2 * [np.linspace(0.0, 1.0, 101)], indexing="ij")
+    weights = np.stack([(1 - u) * (1 - w), u * (1 - w), u * w, (1 - u) * w], axis=-1)
+    expected = 0.0
+    for corners in perturbed.v[perturbed.f]:
+        points = weights @ corners
+        quads = np.stack(
+            [points[:-1, :-1], points[1:, :-1], points[1:, 1:], points[:-1, 1:]],
+            axis=2,
+        ).reshape(-1, 4, 3)
+        for tri in ([0, 1, 2], [0, 2, 3]):
+            a, b, c = np.moveaxis(quads[:, tri], 1, 0)
+            expected += np.sum(a * np.cross(b, c)) / 6.0
+
+    np.testing.assert_allclose(perturbed.volume, expected, rtol=1e-5)
+
+
+def test_per_face_quantities_share_a_gather():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    cube_at_origin.face_areas()
+    corners = cube_at_origin._face_corners()
+    cross_products = cube_at_origin._face_cross_products()
+    cube_at_origin.face_normals()
+    cube_at_origin.volume
+    cube_at_origin.area_weighted_centroid
+    assert cube_at_origin._face_corners() is corners
+    assert cube_at_origin._face_cross_products() is cross_products
+    assert not cross_products.flags.writeable
+
+
+def vertex_normals_by_brute_force(mesh, weighting):
+    result = np.zeros((mesh.num_v, 3))
+    for face in mesh.f:
+        corners = mesh.v[face]
+        normal = np.cross(corners[1] - corners[0], corners[2] - corners[0])
+        if weighting != "area":
+            normal = vg.normalize(normal)
+        for i, vertex_index in enumerate(face):
+            weight = 1.0
+            if weighting == "angle":
+                weight = vg.angle(
+                    corners[(i + 1) % 3] - corners[i],
+                    corners[i - 1] - corners[i],
+                    units="rad",
+                )
+            result[vertex_index] += weight * normal
+    return vg.normalize(result)
+
+
+def test_vertex_normals():
+    np.random.seed(0)
+    cube = shapes.cube(np.zeros(3), 3.0)
+    mesh = Mesh(v=cube.v + 0.2 * np.random.randn(8, 3), f=cube.f)
+    for weighting in ("area", "angle", "uniform"):
+        np.testing.assert_array_almost_equal(
+            mesh.vertex_normals(weighting=weighting),
+            vertex_normals_by_brute_force(mesh, weighting),
+        )
+    assert mesh.vertex_normals() is not mesh.vertex_normals()
+
+
+def test_vertex_normals_of_cube():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    expected = vg.normalize(cube_at_origin.v - 1.5)
+    np.testing.assert_array_almost_equal(
+        cube_at_origin.vertex_normals(weighting="angle"), expected
+    )
+    for weighting in ("area", "angle", "uniform"):
+        np.testing.assert_array_almost_equal(
+            quad_cube(cube_at_origin).vertex_normals(weighting=weighting), expected
+        )
+
+
+def test_vertex_normals_of_unreferenced_vertex():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    mesh = Mesh(v=np.vstack([cube_at_origin.v, np.zeros(3)]), f=cube_at_origin.f)
+    np.testing.assert_array_equal(mesh.vertex_normals()[8], np.zeros(3))
+
+
+def test_vertex_normals_with_degenerate_face():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    # A sliver along an edge of the cube, through a new vertex at its
+    # midpoint.
+    edge = cube_at_origin.f[0, :2]
+    mesh = Mesh(
+        v=np.vstack([cube_at_origin.v, np.mean(cube_at_origin.v[edge], axis=0)]),
+        f=np.vstack([cube_at_origin.f, [[edge[0], 8, edge[1]]]]),
+    )
+    for weighting in ("area", "angle", "uniform"):
+        vertex_normals = mesh.vertex_normals(weighting=weighting)
+        np.testing.assert_array_almost_equal(
+            vertex_normals[:8], cube_at_origin.vertex_normals(weighting=weighting)
+        )
+        np.testing.assert_array_equal(vertex_normals[8], np.zeros(3))
+
+
+def test_vertex_normals_validation():
+    with pytest.raises(
+        ValueError, match="Expected weighting to be 'area', 'angle', or 'uniform'"
+    ):
+        shapes.cube(np.zeros(3), 3.0).vertex_normals(weighting="mean")
+
+
+def test_cross_sections():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    polylines, face_indices = cube_at_origin.cross_sections(
+        axis=np.array([0.0, 2.0, 0.0]),
+        offsets=np.array([1.0, -1.0, 4.0]),
+        ret_face_indices=True,
+    )
+    assert len(polylines) == 3
+    (polyline,) = polylines[0]
+    assert polyline.is_closed
+    np.testing.assert_array_almost_equal(polyline.v[:, 1], np.repeat(1.0, 8))
+    np.testing.assert_array_almost_equal(polyline.total_length, 12.0)
+    # The four sides of the cube, two triangles each.
+    np.testing.assert_array_equal(np.sort(face_indices[0][0]), np.arange(4, 12))
+    assert polylines[1] == [] and polylines[2] == []
+    assert face_indices[1] == [] and face_indices[2] == []
+
+
+def test_cross_sections_of_quads():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    (polylines,), (face_indices,) = quad_cube(cube_at_origin).cross_sections(
+        planes=[Plane(np.array([1.0, 1.0, 1.0]), vg.basis.y)], ret_face_indices=True
+    )
+    (polyline,) = polylines
+    assert polyline.is_closed
+    np.testing.assert_array_almost_equal(polyline.total_length, 12.0)
+    np.testing.assert_array_equal(np.unique(face_indices[0]), np.arange(2, 6))
+
+
+def test_cross_sections_with_planes():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    normal = vg.normalize(np.array([1.0, 1.0, 1.0]))
+    offsets = np.array([4.0, 0.5, 2.0])
+    with_planes = cube_at_origin.cross_sections(
+        planes=[Plane(offset * normal, normal) for offset in offsets]
+    )
+    with_axis = cube_at_origin.cross_sections(
+        axis=np.array([1.0, 1.0, 1.0]), offsets=offsets
+    )
+    assert [len(polylines) for polylines in with_planes] == [1, 1, 1]
+    for polylines, expected_polylines in zip(with_planes, with_axis):
+        np.testing.assert_array_almost_equal(polylines[0].v, expected_polylines[0].v)
+
+    with_lists = cube_at_origin.cross_sections(
+        axis=[1.0, 1.0, 1.0], offsets=offsets.tolist()
+    )
+    for polylines, expected_polylines in zip(with_lists, with_axis):
+        np.testing.assert_array_equal(polylines[0].v, expected_polylines[0].v)
+
+    assert cube_at_origin.cross_sections(planes=[]) == []
+    assert cube_at_origin.cross_sections(planes=[], ret_face_indices=True) == ([], [])
+
+
+def test_cross_sections_validation():
+    cube_at_origin = shapes.cube(np.zeros(3), 3.0)
+    plane = Plane(np.zeros(3), vg.basis.y)
+    with pytest.raises(ValueError, match="Expected either planes, or axis and offsets"):
+        cube_at_origin.cross_sections()
+    with pytest.raises(ValueError, match="Expected either planes, or axis and offsets"):
+        cube_at_origin.cross_sections(axis=vg.basis.y)
+    with pytest.raises(ValueError, match="Expected either planes, or axis and offsets"):
+        cube_at_origin.cross_sections(planes=[plane], offsets=np.zeros(1))
+    with pytest.raises(ValueError, match="Expected planes to be parallel"):
+        cube_at_origin.cross_sections(planes=[plane, Plane(np.zeros(3), vg.basis.x)])
+    with pytest.raises(ValueError, match="Expected axis to be nonzero"):
+        cube_at_origin.cross_sections(axis=np.zeros(3), offsets=np.zeros(1))
+    with pytest.raises(
+        ValueError, match=r"offsets must be an array with shape \(-1,\)"
+    ):
+        cube_at_origin.cross_sections(axis=vg.basis.y, offsets=np.zeros((1, 2)))
+
+
+def assert_derived_quantities_match(transformed):
+    expected = Mesh(v=np.array(transformed.v), f=transformed.f)
+    np.testing.assert_array_almost_equal(
+        transformed.vertex_centroid, expected.vertex_centroid
+    )
+    np.testing.assert_array_almost_equal(
+        transformed.bounding_box.origin, expected.bounding_box.origin
+    )
+    np.testing.assert_array_almost_equal(
+        transformed.bounding_box.size, expected.bounding_box.size
+    )
+    for normalize in (True, False):
+        np.testing.assert_array_almost_equal(
+            transformed.face_normals(normalize=normalize),
+            expected.face_normals(normalize=normalize),
+        )
+    np.testing.assert_array_almost_equal(
+        transformed.face_areas(), expected.face_areas()
+    )
+    np.testing.assert_almost_equal(transformed.surface_area, expected.surface_area)
+    np.testing.assert_almost_equal(transformed.volume, expected.volume)
+    np.testing.assert_array_almost_equal(
+        transformed.area_weighted_centroid, expected.area_weighted_centroid
+    )
+    for weighting in ("area", "angle", "uniform"):
+        np.testing.assert_array_almost_equal(
+            transformed.vertex_normals(weighting=weighting),
+            expected.vertex_normals(weighting=weighting),
+        )
+
+
+def test_derived_quantities_of_transformed_mesh():
+    cube = shapes.cube(np.array([1.0, -2.0, 0.5]), 3.0)
+    rotation = np.array([0.3, -0.2, 0.5])
+    for transformed in (
+        cube.translated(np.array([1.0, 2.0, 3.0])),
+        cube.rotated(rotation).uniformly_scaled(2.5),
+        cube.flipped(1),
+        cube.faces_flipped().rotated(rotation),
+        cube.flipped(0).flipped(2),
+        # A reflection which doesn't flip the faces.
+        cube.transform().append_transform(np.diag([-0.5, -0.5, -0.5, 1.0])).end(),
+        cube.non_uniformly_scaled(1.0, 2.0, 3.0),
+        cube.rotated(rotation).non_uniformly_scaled(1.0, 2.0, 3.0),
+    ):
+        assert transformed._transform_source is cube
+        assert_derived_quantities_match(transformed)
+
+
+def test_derived_quantities_of_transformed_mesh_use_the_source():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    source_normals = cube.face_normals()
+    transformed = cube.flipped(0).uniformly_scaled(2.0).translated(vg.basis.z)
+
+    np.testing.assert_array_equal(
+        transformed.vertex_centroid, np.array([-3.0, 3.0, 4.0])
+    )
+    np.testing.assert_array_equal(
+        transformed.bounding_box.origin, np.array([-6.0, 0.0, 1.0])
+    )
+    np.testing.assert_array_equal(transformed.bounding_box.size, np.repeat(6.0, 3))
+    np.testing.assert_array_almost_equal(
+        transformed.face_normals(), source_normals * np.array([-1.0, 1.0, 1.0])
+    )
+    # None of these required the transformed vertices.
+    assert transformed._v is None
+
+    # The results are computed once, and callers receive copies.
+    normals = transformed.face_normals()
+    normals[:] = 0.0
+    np.testing.assert_array_almost_equal(
+        transformed.face_normals(), source_normals * np.array([-1.0, 1.0, 1.0])
+    )
+    centroid = transformed.vertex_centroid
+    centroid[0] = 0.0
+    assert transformed.vertex_centroid[0] == -3.0
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from lacecore import Mesh, shapes
+import numpy as np
+from . import cross_sections as cross_sections_module
+from .cross_sections import cross_sections
+
+
+def wavy_sheet(num_cells_per_side=20):
+    x, y = np.meshgrid(
+        np.linspace(0.0, 1.0, num_cells_per_side + 1),
+        np.linspace(0.0, 1.0, num_cells_per_side + 1),
+    )
+    v = np.column_stack(
+        [x.ravel(), y.ravel(), 0.1 * np.sin(7.0 * x.ravel() * y.ravel())]
+    )
+    corners = (
+        np.arange(num_cells_per_side)[:, np.newaxis] * (num_cells_per_side + 1)
+        + np.arange(num_cells_per_side)
+    ).ravel()
+    f = np.column_stack(
+        [
+            corners,
+            corners + 1,
+            corners + num_cells_per_side + 2,
+            corners + num_cells_per_side + 1,
+        ]
+    )
+    return Mesh(v=v, f=f)
+
+
+def brute_force_segments(vertices, tris, normal, offset):
+    # The segment where each triangle crosses the plane, as a sorted tuple of
+    # rounded endpoints, keyed by triangle.
+    heights = vertices.dot(normal)
+    segments = {}
+    for tri_index, tri in enumerate(tris):
+        is_above = heights[tri] > offset
+        if np.all(is_above) or not np.any(is_above):
+            continue
+        points = []
+        for i in range(3):
+            start, end = tri[i], tri[(i + 1) % 3]
+            if is_above[i] != is_above[(i + 1) % 3]:
+                fraction = (offset - heights[start]) / (heights[end] - heights[start])
+                point = vertices[start] + fraction * (vertices[end] - vertices[start])
+                points.append(tuple(np.round(point, 6)))
+        segments[tri_index] = tuple(sorted(points))
+    return segments
+
+
+def segments_of(polylines, face_indices):
+    segments = {}
+    for polyline, face_indices_of_polyline in zip(polylines, face_indices):
+        assert len(face_indices_of_polyline) == len(polyline.e)
+        for edge, face_index in zip(polyline.e, face_indices_of_polyline):
+            assert face_index not in segments
+            segments[face_index] = tuple(
+                sorted(tuple(np.round(point, 6)) for point in polyline.v[edge])
+            )
+    return segments
+
+
+def test_cross_sections_match_brute_force():
+    mesh = wavy_sheet()
+    tris = mesh.faces_triangulated().f
+    normal = np.array([0.6, 0.0, 0.8])
+    offsets = np.linspace(-0.2, 1.6, 50)
+    polylines, face_indices = cross_sections(mesh.v, tris, normal, offsets)
+
+    assert len(polylines) == len(face_indices) == len(offsets)
+    for offset, polylines_of_plane, face_indices_of_plane in zip(
+        offsets, polylines, face_indices
+    ):
+        expected = brute_force_segments(mesh.v, tris, normal, offset)
+        assert segments_of(polylines_of_plane, face_indices_of_plane) == expected
+        for polyline in polylines_of_plane:
+            assert not polyline.is_closed
+            np.testing.assert_array_almost_equal(polyline.v.dot(normal), offset)
+
+
+def test_cross_sections_in_batches(monkeypatch):
+    mesh = wavy_sheet()
+    normal = np.array([1.0, 0.0, 0.0])
+    offsets = np.linspace(0.0, 1.0, 37)
+    expected_polylines, expected_face_indices = cross_sections(
+        mesh.v, mesh.f, normal, offsets
+    )
+
+    monkeypatch.setattr(cross_sections_module, "BATCH_SIZE", 50)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        polylines, face_indices = cross_sections(
+            mesh.v, mesh.f, normal, offsets, executor=executor
+        )
+
+    for actual, expected in zip(polylines, expected_polylines):
+        assert len(actual) == len(expected)
+        for actual_polyline, expected_polyline in zip(actual, expected):
+            np.testing.assert_array_equal(actual_polyline.v, expected_polyline.v)
+    for actual, expected in zip(face_indices, expected_face_indices):
+        for actual_face_indices, expected_face_indices_of_polyline in zip(
+            actual, expected
+        ):
+            np.testing.assert_array_equal(
+                actual_face_indices, expected_face_indices_of_polyline
+            )
+
+
+def test_cross_sections_of_non_manifold_edge():
+    # Three triangles which share the edge from vertex 0 to vertex 1.
+    vertices = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [1.0, 0.0, 0.5],
+            [-1.0, 0.0, 0.5],
+            [0.0, 1.0, 0.5],
+        ]
+    )
+    faces = np.array([[0, 1, 2], [1, 0, 3], [0, 1, 4]])
+    polylines, face_indices = cross_sections(
+        vertices, faces, np.array([0.0, 0.0, 1.0]), np.array([0.25])
+    )
+    assert sum(len(polyline.e) for polyline in polylines[0]) == 3
+    np.testing.assert_array_equal(
+        np.sort(np.concatenate(face_indices[0])), np.arange(3)
+    )
+
+
+def test_cross_sections_through_vertices():
+    mesh = wavy_sheet(num_cells_per_side=4)
+    (polylines,), (face_indices,) = cross_sections(
+        mesh.v, mesh.f, np.array([1.0, 0.0, 0.0]), np.array([0.5])
+    )
+    assert len(polylines) == 1
+    expected = mesh.v[mesh.v[:, 0] == 0.5]
+    np.testing.assert_array_equal(polylines[0].v, expected)
+    assert len(face_indices[0]) == len(expected) - 1
+
+
+def test_cross_sections_along_faces():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    normal = np.array([0.0, 1.0, 0.0])
+    polylines, face_indices = cross_sections(
+        cube.v, cube.f, normal, np.array([0.0, 3.0])
+    )
+    # The bottom and top faces are treated alike.
+    for offset, polylines_of_plane, face_indices_of_plane in zip(
+        [0.0, 3.0], polylines, face_indices
+    ):
+        assert len(polylines_of_plane) == 1
+        (polyline,) = polylines_of_plane
+        assert polyline.is_closed
+        assert sorted(map(tuple, polyline.v)) == sorted(
+            map(tuple, cube.v[cube.v.dot(normal) == offset])
+        )
+        assert len(face_indices_of_plane[0]) == 4
@@ -0,0 +1,132 @@
+import numpy as np
+from .._common.rows import first_occurrences
+
+
+class CleanupMixin:
+    def merged_vertices(self, tolerance=0.0, ret_indices_of_original_vertices=False):
+        """
+        Merge duplicate vertices, such as those along the seams of a mesh
+        whose vertices were split for texturing, into one.
+
+        When `tolerance` is zero, vertices are merged when they're identical.
+        Otherwise, they're merged when their coordinates round to the same
+        multiples of `tolerance`, so a pair of vertices which are closer than
+        `tolerance`, but which round differently, aren't merged.
+
+        Each merged vertex takes the position of the first of its duplicates,
+        and the vertices keep their order. The faces keep their order and
+        their face groups. Faces may become degenerate, when duplicates of
+        a vertex were connected by an edge.
+
+        Args:
+            tolerance (float): The size of the grid to which the coordinates
+                are rounded before they're compared, or zero.
+            ret_indices_of_original_vertices (bool): When `True`, also return
+                the new index of each original vertex.
+
+        Returns:
+            object: Either the new mesh as an instance of `lacecore.Mesh`, or
+            a tuple `(mesh, indices_of_original_vertices)`.
+        """
+        from .._mesh import Mesh
+
+        if tolerance < 0:
+            raise ValueError("Expected tolerance to be nonnegative")
+
+        # Adding zero turns `-0.0` into `0.0`, so they're compared equal.
+        if tolerance == 0:
+            keys = self.v + 0.0
+        else:
+            keys = np.round(self.v / tolerance) + 0.0
+        is_first, first_indices = first_occurrences(keys)
+        indices_of_original_vertices = (np.cumsum(is_first) - 1)[first_indices]
+
+        merged = Mesh._from_valid_arrays(
+            v=self.v[is_first],
+            f=indices_of_original_vertices[self.f],
+            face_groups=self.face_groups,
+        )
+        if ret_indices_of_original_vertices:
+            return merged, indices_of_original_vertices
+        else:
+            return merged
+
+    def cleaned(
+        self,
+        min_area=0.0,
+        prune_orphan_vertices=True,
+        ret_indices_of_original_faces_and_vertices=False,
+    ):
+        """
+        Remove degenerate faces, such as zero-area slivers and faces which
+        repeat a vertex, and faces which duplicate an earlier one.
+
+        Faces are duplicates when they have the same vertices, regardless of
+        their winding. The first of each set of duplicates is kept. The faces
+        keep their order and their face groups.
+
+        Args:
+            min_area (float): Faces whose area is no greater than this are
+                removed. The area of a quad is the length of its vector area.
+            prune_orphan_vertices (bool): When `True`, remove vertices which
+                are referenced only by faces which are being removed.
+            ret_indices_of_original_faces_and_vertices (bool): When `True`,
+                also return the indices of the original faces and vertices.
+
+        Returns:
+            object: Either the cleaned mesh as an instance of `lacecore.Mesh`,
+            or a tuple `(mesh, indices_of_original_faces,
+            indices_of_original_vertices)`. The index arrays contain the new
+            indices of the original faces and vertices, and `-1` for each
+            removed face and vertex.
+        """
+        from .._common.reindexing import create_submesh
+        from .._selection.reconcile_selection import reconcile_selection_unchecked
+
+        sorted_faces = np.sort(self.f, axis=1)
+        repeats_a_vertex = np.any(sorted_faces[:, 1:] == sorted_faces[:, :-1], axis=1)
+        is_first, _ = first_occurrences(sorted_faces)
+        face_mask = is_first & ~repeats_a_vertex & (self._face_areas() > min_area)
+
+        face_mask, vertex_mask = reconcile_selection_unchecked(
+            faces=self.f,
+            face_mask=face_mask,
+            vertex_mask=None,
+            num_vertices=self.num_v,
+            prune_orphan_vertices=prune_orphan_vertices,
+        )
+
+        return create_submesh(
+            mesh=self,
+            vertex_mask=vertex_mask,
+            face_mask=face_mask,
+            ret_indices_of_original_faces_and_vertices=ret_indices_of_original_faces_and_vertices,
+            preserve_face_groups=True,
+        )
+
+    def optimized_for_locality(self):
+        """
+        Reorder the faces and vertices so neighboring faces and the vertices
+        they share are close together in memory, which speeds up later
+        gathers such as `mesh.v[mesh.f]` on large meshes whose elements are
+        scattered, such as those which have been merged or stitched
+        together.
+
+        The faces are ordered along a Morton curve through their centroids,
+        and the vertices by the first face which references them. The face
+        groups are kept.
+
+        Returns:
+            lacecore.Mesh: The reordered mesh.
+        """
+        from .._common.reindexing import (
+            _reindex_faces_unchecked,
+            _reindex_vertices_unchecked,
+            first_use_vertex_order,
+            spatial_face_order,
+        )
+
+        # Both orderings are permutations by construction, so they needn't
+        # be checked.
+        reordered = _reindex_faces_unchecked(self, spatial_face_order(self))
+        return _reindex_vertices_unchecked(reordered, first_use_vertex_order(reordered))
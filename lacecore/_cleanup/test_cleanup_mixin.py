@@ -0,0 +1,177 @@
+from lacecore import GroupMap, Mesh, shapes
+import numpy as np
+import pytest
+
+
+def split_cube():
+    # A cube whose triangles each have their own vertices.
+    cube = shapes.cube(np.zeros(3), 3.0)
+    return Mesh(
+        v=cube.v[cube.f].reshape(-1, 3),
+        f=np.arange(3 * cube.num_f).reshape(-1, 3),
+        face_groups=GroupMap.from_dict(
+            {"top_and_bottom": [0, 1, 2, 3], "sides": np.arange(4, 12)}, cube.num_f
+        ),
+    )
+
+
+def test_merged_vertices():
+    mesh = split_cube()
+    merged, indices_of_original_vertices = mesh.merged_vertices(
+        ret_indices_of_original_vertices=True
+    )
+
+    assert merged.num_v == 8
+    assert merged.num_f == mesh.num_f
+    np.testing.assert_array_equal(merged.v[merged.f], mesh.v[mesh.f])
+    np.testing.assert_array_equal(merged.v[indices_of_original_vertices], mesh.v)
+    np.testing.assert_array_equal(merged.f, indices_of_original_vertices[mesh.f])
+    # The first occurrence of each vertex is kept, in order.
+    _, first_indices = np.unique(mesh.v, axis=0, return_index=True)
+    np.testing.assert_array_equal(merged.v, mesh.v[np.sort(first_indices)])
+    assert merged.face_groups is mesh.face_groups
+    assert merged.is_watertight
+
+    assert isinstance(mesh.merged_vertices(), Mesh)
+
+
+def test_merged_vertices_of_float32_vertices():
+    mesh = split_cube()
+    merged = Mesh(v=mesh.v.astype(np.float32), f=mesh.f).merged_vertices()
+    assert merged.num_v == 8
+    assert merged.v.dtype == np.float32
+    np.testing.assert_array_equal(merged.v[merged.f], mesh.v[mesh.f])
+
+
+def test_merged_vertices_with_tolerance():
+    mesh = split_cube()
+    np.random.seed(0)
+    jittered = Mesh(
+        v=mesh.v + np.random.uniform(-1e-6, 1e-6, mesh.v.shape),
+        f=mesh.f,
+    )
+
+    # Without a tolerance, nothing is merged.
+    assert jittered.merged_vertices().num_v == mesh.num_v
+
+    merged = jittered.merged_vertices(tolerance=1e-3)
+    assert merged.num_v == 8
+    np.testing.assert_array_almost_equal(merged.v[merged.f], mesh.v[mesh.f])
+
+    with pytest.raises(ValueError, match="Expected tolerance to be nonnegative"):
+        jittered.merged_vertices(tolerance=-1.0)
+
+
+def test_merged_vertices_merges_negative_zero():
+    mesh = Mesh(
+        v=np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [-0.0, 0.0, -0.0]]),
+        f=np.array([[0, 1, 2]]),
+    )
+    merged, indices_of_original_vertices = mesh.merged_vertices(
+        ret_indices_of_original_vertices=True
+    )
+    assert merged.num_v == 2
+    np.testing.assert_array_equal(indices_of_original_vertices, [0, 1, 0])
+    np.testing.assert_array_equal(merged.f, [[0, 1, 0]])
+
+
+def messy_cube():
+    # A cube with a sliver along one of its edges, a face which repeats a
+    # vertex, and a duplicate of a face with the opposite winding.
+    cube = shapes.cube(np.zeros(3), 3.0)
+    edge = cube.f[0, :2]
+    f = np.vstack(
+        [
+            cube.f[:6],
+            [[edge[0], 8, edge[1]], [0, 0, 1]],
+            cube.f[6:],
+            cube.f[2, ::-1],
+        ]
+    )
+    return Mesh(
+        v=np.vstack([cube.v, np.mean(cube.v[edge], axis=0)]),
+        f=f,
+        face_groups=GroupMap.from_dict(
+            {"first_half": np.arange(7), "last": [14]}, len(f)
+        ),
+    )
+
+
+def test_cleaned():
+    mesh = messy_cube()
+    cube = shapes.cube(np.zeros(3), 3.0)
+
+    cleaned, indices_of_original_faces, indices_of_original_vertices = mesh.cleaned(
+        ret_indices_of_original_faces_and_vertices=True
+    )
+    np.testing.assert_array_equal(cleaned.v, cube.v)
+    np.testing.assert_array_equal(cleaned.f, cube.f)
+    np.testing.assert_array_equal(
+        indices_of_original_faces, [0, 1, 2, 3, 4, 5, -1, -1, 6, 7, 8, 9, 10, 11, -1]
+    )
+    np.testing.assert_array_equal(indices_of_original_vertices, [*range(8), -1])
+    np.testing.assert_array_equal(cleaned.face_groups["first_half"], np.arange(12) < 6)
+    assert not np.any(cleaned.face_groups["last"])
+    assert cleaned.is_watertight
+
+    not_pruned = mesh.cleaned(prune_orphan_vertices=False)
+    np.testing.assert_array_equal(not_pruned.v, mesh.v)
+    np.testing.assert_array_equal(not_pruned.f, cube.f)
+
+    assert mesh.cleaned(min_area=5.0).num_f == 0
+
+
+def test_cleaned_keeps_isolated_vertices():
+    mesh = messy_cube()
+    # Isolate the vertex in the middle of the sliver.
+    isolated = Mesh(v=mesh.v, f=mesh.f[np.arange(mesh.num_f) != 6])
+    cleaned = isolated.cleaned()
+    assert cleaned.num_v == 9
+    np.testing.assert_array_equal(cleaned.v, isolated.v)
+
+
+def test_cleaned_quads():
+    mesh = Mesh(
+        v=np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [1.0, 1.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [2.0, 0.0, 0.0],
+                [3.0, 0.0, 0.0],
+            ]
+        ),
+        f=np.array([[0, 1, 2, 3], [1, 2, 3, 0], [0, 1, 4, 1], [0, 1, 4, 5]]),
+    )
+    cleaned = mesh.cleaned()
+    np.testing.assert_array_equal(cleaned.f, [[0, 1, 2, 3]])
+    assert cleaned.num_v == 4
+
+
+def sorted_face_corners(mesh, face_mask=slice(None)):
+    return sorted(map(tuple, mesh.v[mesh.f[face_mask]].reshape(-1, 9)))
+
+
+def test_optimized_for_locality():
+    np.random.seed(0)
+    mesh = split_cube().merged_vertices()
+    shuffled = Mesh(
+        v=np.vstack([mesh.v, [[9.0, 9.0, 9.0]]]),
+        f=mesh.f[np.random.permutation(mesh.num_f)],
+        face_groups=mesh.face_groups,
+    )
+
+    optimized = shuffled.optimized_for_locality()
+
+    assert optimized.num_v == shuffled.num_v
+    assert sorted_face_corners(optimized) == sorted_face_corners(shuffled)
+    for group_name in ("top_and_bottom", "sides"):
+        assert sorted_face_corners(
+            optimized, optimized.face_groups[group_name]
+        ) == sorted_face_corners(shuffled, shuffled.face_groups[group_name])
+    # The vertices are numbered by their first use, so the unreferenced
+    # vertex comes last.
+    _, first_positions = np.unique(optimized.f, return_index=True)
+    assert np.all(np.diff(first_positions) > 0)
+    np.testing.assert_array_equal(optimized.v[-1], [9.0, 9.0, 9.0])
@@ -0,0 +1,23 @@
+import functools
+
+
+def cached(method):
+    """
+    Cache the result of a method of an immutable object. Results are stored
+    in the instance's `_cache` dictionary, keyed on the method name and its
+    arguments, which must be hashable.
+
+    Since cached results are shared between callers, methods should return
+    read-only arrays.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+            return result
+
+    return wrapper
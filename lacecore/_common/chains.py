@@ -0,0 +1,60 @@
+import numpy as np
+
+
+def link_segments(segments, num_nodes):
+    """
+    Link segments, each of which joins two nodes, into chains which pass
+    through each segment once. Segments are followed from their start to
+    their end where possible, so when the segments are consistently
+    directed, so are the chains.
+
+    Args:
+        segments (np.ndarray): A `kx2` array of the start and end node of
+            each segment.
+        num_nodes (int): The number of nodes.
+
+    Returns:
+        list: A `(nodes, segments)` tuple for each chain, listing the nodes
+        it passes through and the indices of the segments it follows. The
+        nodes of a closed chain begin and end with the same node.
+    """
+    num_segments = len(segments)
+    ends = segments.ravel()
+    incident = (
+        np.lexsort((np.tile(np.array([0, 1]), num_segments), ends)) // 2
+    ).tolist()
+    degrees = np.bincount(ends, minlength=num_nodes)
+    first_incident = np.concatenate([[0], np.cumsum(degrees)]).tolist()
+    # Start from the ends of open chains, preferring the end from which the
+    # segments lead away, and then pick up the closed chains.
+    in_degrees = np.bincount(segments[:, 1], minlength=num_nodes)
+    starts = np.lexsort((in_degrees > 0, degrees % 2 == 0)).tolist()
+
+    segment_starts, segment_ends = segments.T.tolist()
+    cursors = first_incident[:-1]
+    is_visited = [False] * num_segments
+    chains = []
+    for start in starts:
+        while True:
+            node = start
+            nodes, segments_of_chain = [node], []
+            while True:
+                i, stop = cursors[node], first_incident[node + 1]
+                while i < stop and is_visited[incident[i]]:
+                    i += 1
+                cursors[node] = i
+                if i == stop:
+                    break
+                segment = incident[i]
+                is_visited[segment] = True
+                segments_of_chain.append(segment)
+                node = (
+                    segment_ends[segment]
+                    if segment_starts[segment] == node
+                    else segment_starts[segment]
+                )
+                nodes.append(node)
+            if not segments_of_chain:
+                break
+            chains.append((nodes, segments_of_chain))
+    return chains
@@ -0,0 +1,23 @@
+import numpy as np
+
+
+def concatenate_ranges(starts, stops):
+    """
+    Concatenate the integer ranges `[start, stop)`, like
+    `np.concatenate([np.arange(start, stop) for start, stop in zip(starts,
+    stops)])`, but without a Python loop.
+
+    Args:
+        starts (np.ndarray): The first element of each range.
+        stops (np.ndarray): One past the last element of each range, which
+            should be no less than the corresponding start.
+
+    Returns:
+        np.ndarray: The concatenated ranges.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(stops, dtype=np.int64) - starts
+    total = np.sum(lengths)
+    # Offset each range so a single `arange()` yields its elements.
+    range_offsets = starts - (np.cumsum(lengths) - lengths)
+    return np.repeat(range_offsets, lengths) + np.arange(total, dtype=np.int64)
@@ -1,5 +1,6 @@
 import numpy as np
 from vg.compat import v2 as vg
+from .space_filling_curve import morton_codes
 
 
 def indices_of_original_elements_after_applying_mask(mask):
@@ -14,11 +15,15 @@ def indices_of_original_elements_after_applying_mask(mask):
 
 
 def create_submesh(
-    mesh, vertex_mask, face_mask, ret_indices_of_original_faces_and_vertices=False
+    mesh,
+    vertex_mask,
+    face_mask,
+    ret_indices_of_original_faces_and_vertices=False,
+    preserve_face_groups=False,
 ):
     """
     Apply the requested mask to the vertices and faces to create a submesh,
-    discarding the face groups.
+    discarding the face groups unless `preserve_face_groups` is `True`.
     """
     from .._mesh import Mesh
 
@@ -27,7 +32,12 @@ def create_submesh(
         vertex_mask
     )
     new_f = indices_of_original_vertices[mesh.f[face_mask]]
-    submesh = Mesh(v=new_v, f=new_f)
+    face_groups = (
+        mesh.face_groups.reindexed(np.flatnonzero(face_mask))
+        if preserve_face_groups and mesh.face_groups is not None
+        else None
+    )
+    submesh = Mesh(v=new_v, f=new_f, face_groups=face_groups)
 
     if ret_indices_of_original_faces_and_vertices:
         indices_of_original_faces = indices_of_original_elements_after_applying_mask(
@@ -38,6 +48,50 @@ def create_submesh(
         return submesh
 
 
+def _inverse_of_permutation(ordering, element_name):
+    # Check that the ordering is a permutation, and invert it, in linear
+    # time rather than by sorting.
+    num_elements = len(ordering)
+    if np.any((ordering < 0) | (ordering >= num_elements)) or np.any(
+        np.bincount(ordering, minlength=num_elements) != 1
+    ):
+        raise ValueError(
+            "Expected new {} indices to be unique, and range from 0 to {}".format(
+                element_name, num_elements - 1
+            )
+        )
+    inverse = np.empty(num_elements, dtype=np.int64)
+    inverse[ordering] = np.arange(num_elements)
+    return inverse
+
+
+def _reindex_vertices_unchecked(mesh, ordering, inverse=None):
+    # Like `reindex_vertices()`, for orderings which lacecore has produced,
+    # and which are therefore known to be permutations.
+    from .._mesh import Mesh
+
+    if inverse is None:
+        inverse = np.empty(len(ordering), dtype=np.int64)
+        inverse[ordering] = np.arange(len(ordering))
+    return Mesh._from_valid_arrays(
+        v=mesh.v[ordering], f=inverse[mesh.f], face_groups=mesh.face_groups
+    )
+
+
+def _reindex_faces_unchecked(mesh, ordering):
+    # Like `reindex_faces()`, for orderings which lacecore has produced, and
+    # which are therefore known to be permutations.
+    from .._mesh import Mesh
+
+    return Mesh._from_valid_arrays(
+        v=mesh.v,
+        f=mesh.f[ordering],
+        face_groups=(
+            None if mesh.face_groups is None else mesh.face_groups.reindexed(ordering)
+        ),
+    )
+
+
 def reindex_vertices(mesh, ordering):
     """
     Reorder the vertices of the given mesh, returning a new mesh.
@@ -50,18 +104,10 @@ def reindex_vertices(mesh, ordering):
     Returns:
         lacecore.Mesh: The reindexed mesh.
     """
-    from .._mesh import Mesh
-
+    ordering = np.asarray(ordering)
     vg.shape.check(locals(), "ordering", (mesh.num_v,))
-    unique_values, inverse = np.unique(ordering, return_index=True)
-    if not np.array_equal(unique_values, np.arange(mesh.num_v)):
-        raise ValueError(
-            "Expected new vertex indices to be unique, and range from 0 to {}".format(
-                mesh.num_v - 1
-            )
-        )
-
-    return Mesh(v=mesh.v[ordering], f=inverse[mesh.f], face_groups=mesh.face_groups)
+    inverse = _inverse_of_permutation(ordering, "vertex")
+    return _reindex_vertices_unchecked(mesh, ordering, inverse)
 
 
 def reindex_faces(mesh, ordering):
@@ -76,21 +122,56 @@ def reindex_faces(mesh, ordering):
     Returns:
         lacecore.Mesh: The reindexed mesh.
     """
-    from .._mesh import Mesh
-
+    ordering = np.asarray(ordering)
     vg.shape.check(locals(), "ordering", (mesh.num_f,))
-    unique_values = np.unique(ordering)
-    if not np.array_equal(unique_values, np.arange(mesh.num_f)):
-        raise ValueError(
-            "Expected new face indices to be unique, and range from 0 to {}".format(
-                mesh.num_f - 1
-            )
-        )
+    _inverse_of_permutation(ordering, "face")
+    return _reindex_faces_unchecked(mesh, ordering)
 
-    return Mesh(
-        v=mesh.v,
-        f=mesh.f[ordering],
-        face_groups=(
-            None if mesh.face_groups is None else mesh.face_groups.reindexed(ordering)
-        ),
-    )
+
+def spatial_vertex_order(mesh):
+    """
+    Order the vertices of the given mesh along a Morton curve, so vertices
+    which are close together in space are close together in memory.
+
+    Args:
+        mesh (lacecore.Mesh): The mesh on which to operate.
+
+    Returns:
+        np.ndarray: An ordering suitable for `reindex_vertices()`.
+    """
+    return np.argsort(morton_codes(mesh.v), kind="stable")
+
+
+def spatial_face_order(mesh):
+    """
+    Order the faces of the given mesh along a Morton curve through their
+    centroids, so faces which are close together in space are close together
+    in memory.
+
+    Args:
+        mesh (lacecore.Mesh): The mesh on which to operate.
+
+    Returns:
+        np.ndarray: An ordering suitable for `reindex_faces()`.
+    """
+    return np.argsort(morton_codes(mesh._face_centroids()), kind="stable")
+
+
+def first_use_vertex_order(mesh):
+    """
+    Order the vertices of the given mesh by the first face which references
+    them, followed by any unreferenced vertices. After reindexing, a pass
+    over the faces reads the vertices nearly sequentially, which works well
+    with a face order which keeps neighboring faces together, such as
+    `spatial_face_order()`.
+
+    Args:
+        mesh (lacecore.Mesh): The mesh on which to operate.
+
+    Returns:
+        np.ndarray: An ordering suitable for `reindex_vertices()`.
+    """
+    flat_faces = mesh.f.ravel()
+    first_uses = np.full(mesh.num_v, len(flat_faces))
+    np.minimum.at(first_uses, flat_faces, np.arange(len(flat_faces)))
+    return np.argsort(first_uses, kind="stable")
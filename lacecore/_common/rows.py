@@ -0,0 +1,57 @@
+import numpy as np
+
+# Odd multipliers which mix the columns of a row into a hash.
+_HASH_MULTIPLIERS = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93],
+    dtype=np.uint64,
+)
+
+
+def first_occurrences(rows):
+    """
+    Find the rows which are identical to an earlier row, like
+    `np.unique(rows, axis=0, return_index=True, return_inverse=True)`, but
+    with a single sort of a hash of each row, rather than a comparison of
+    whole rows.
+
+    Args:
+        rows (np.ndarray): A `kxn` array of integers or floats, with up to
+            four columns. Floats are compared by their bits, so `-0.0`
+            and `0.0` differ.
+
+    Returns:
+        tuple: `(is_first, first_indices)`. `is_first` is a boolean mask of
+        the first occurrence of each distinct row, and `first_indices`
+        contains the index of the first occurrence of each row.
+    """
+    rows = np.asarray(rows)
+    # Widen the rows, so each element has 64 bits.
+    rows = rows.astype(np.float64 if rows.dtype.kind == "f" else np.int64, copy=False)
+    bits = np.ascontiguousarray(rows).view(np.uint64)
+    hashes = np.zeros(len(bits), dtype=np.uint64)
+    for column, multiplier in zip(bits.T, _HASH_MULTIPLIERS):
+        hashes ^= column * multiplier
+
+    # Identical rows have identical hashes, so they're adjacent once the
+    # hashes are sorted.
+    order = np.argsort(hashes)
+    sorted_bits = bits[order]
+    is_new_row = np.ones(len(bits), dtype=bool)
+    is_new_row[1:] = np.any(sorted_bits[1:] != sorted_bits[:-1], axis=1)
+    sorted_hashes = hashes[order]
+    if np.any(is_new_row[1:] & (sorted_hashes[1:] == sorted_hashes[:-1])):
+        # Distinct rows with the same hash may be interleaved, so sort by
+        # the whole rows.
+        order = np.lexsort((*bits.T[::-1], hashes))
+        sorted_bits = bits[order]
+        is_new_row[1:] = np.any(sorted_bits[1:] != sorted_bits[:-1], axis=1)
+
+    # The sort isn't stable, so the first occurrence of each row is the
+    # lowest index in its run.
+    first_of_runs = (
+        np.minimum.reduceat(order, np.flatnonzero(is_new_row)) if len(order) else order
+    )
+    first_indices = np.empty(len(bits), dtype=np.int64)
+    first_indices[order] = first_of_runs[np.cumsum(is_new_row) - 1]
+    is_first = first_indices == np.arange(len(bits))
+    return is_first, first_indices
@@ -0,0 +1,40 @@
+import numpy as np
+
+MORTON_BITS_PER_AXIS = 21
+
+
+def _spread_bits(values):
+    # Insert two zero bits after each of the low 21 bits.
+    x = values & np.uint64(0x1FFFFF)
+    x = (x | (x << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return x
+
+
+def morton_codes(points):
+    """
+    Compute the position of each point along a Morton (Z-order) curve through
+    the points' bounding box. Points which are close together in space tend
+    to be close together along the curve.
+
+    Args:
+        points (np.ndarray): A `kx3` array of points.
+
+    Returns:
+        np.ndarray: A `k` array of `np.uint64` codes.
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    lower = np.min(points, axis=0)
+    extent = np.max(points, axis=0) - lower
+    scale = np.zeros(3)
+    np.divide(2**MORTON_BITS_PER_AXIS - 1, extent, out=scale, where=extent > 0)
+    quantized = ((points - lower) * scale).astype(np.uint64)
+    return (
+        _spread_bits(quantized[:, 0])
+        | (_spread_bits(quantized[:, 1]) << np.uint64(1))
+        | (_spread_bits(quantized[:, 2]) << np.uint64(2))
+    )
@@ -0,0 +1,19 @@
+import numpy as np
+from .chains import link_segments
+
+
+def test_link_segments():
+    # A closed loop, an open chain whose middle segment is reversed, and a
+    # node which no segment references.
+    segments = np.array([[0, 1], [2, 0], [1, 2], [3, 4], [5, 4], [5, 6]])
+    chains = link_segments(segments, 8)
+    assert len(chains) == 2
+    (open_nodes, open_segments), (closed_nodes, closed_segments) = chains
+    assert open_nodes == [3, 4, 5, 6]
+    assert open_segments == [3, 4, 5]
+    assert closed_nodes == [0, 1, 2, 0]
+    assert closed_segments == [0, 2, 1]
+
+
+def test_link_segments_empty():
+    assert link_segments(np.zeros((0, 2), dtype=np.int64), 3) == []
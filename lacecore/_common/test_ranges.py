@@ -0,0 +1,15 @@
+import numpy as np
+from .ranges import concatenate_ranges
+
+
+def test_concatenate_ranges():
+    np.testing.assert_array_equal(
+        concatenate_ranges(np.array([3, 10, 0, 7]), np.array([5, 10, 2, 8])),
+        np.array([3, 4, 0, 1, 7]),
+    )
+
+
+def test_concatenate_ranges_empty():
+    result = concatenate_ranges(np.zeros(0), np.zeros(0))
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, np.zeros(0))
@@ -2,10 +2,15 @@ from lacecore import GroupMap, Mesh, shapes
 import numpy as np
 import pytest
 from .reindexing import (
+    create_submesh,
+    first_use_vertex_order,
     indices_of_original_elements_after_applying_mask,
     reindex_faces,
     reindex_vertices,
+    spatial_face_order,
+    spatial_vertex_order,
 )
+from .space_filling_curve import morton_codes
 
 
 def create_cube_with_face_group():
@@ -50,6 +55,19 @@ def test_reindexing_mask_remove_all():
     )
 
 
+def test_create_submesh_with_face_groups():
+    cube = create_cube_with_face_group()
+    face_mask = np.arange(cube.num_f) % 2 == 1
+    vertex_mask = np.ones(cube.num_v, dtype=bool)
+
+    assert create_submesh(cube, vertex_mask, face_mask).face_groups is None
+
+    submesh = create_submesh(cube, vertex_mask, face_mask, preserve_face_groups=True)
+    np.testing.assert_array_equal(
+        submesh.face_groups["selection"], cube.face_groups["selection"][face_mask]
+    )
+
+
 def test_reindex_vertices():
     cube = shapes.cube(np.zeros(3), 3.0)
 
@@ -60,6 +78,15 @@ def test_reindex_vertices():
     np.testing.assert_array_equal(reindexed_cube.v[reindexed_cube.f], cube.v[cube.f])
 
 
+def test_reindex_vertices_with_list():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    ordering = [7, 6, 5, 4, 3, 2, 1, 0]
+    np.testing.assert_array_equal(
+        reindex_vertices(cube, ordering).v,
+        reindex_vertices(cube, ordering[::-1]).v[::-1],
+    )
+
+
 def test_reindex_vertices_with_face_groups():
     cube = create_cube_with_face_group()
 
@@ -79,6 +106,12 @@ def test_reindex_vertices_error():
         reindex_vertices(
             shapes.cube(np.zeros(3), 3.0), np.array([0, 0, 1, 2, 3, 4, 5, 6])
         )
+    for ordering in ([1, 2, 3, 4, 5, 6, 7, 8], [-1, 0, 1, 2, 3, 4, 5, 6]):
+        with pytest.raises(
+            ValueError,
+            match="Expected new vertex indices to be unique, and range from 0 to 7",
+        ):
+            reindex_vertices(shapes.cube(np.zeros(3), 3.0), ordering)
 
 
 def test_reindex_faces():
@@ -111,3 +144,22 @@ def test_reindex_faces_error():
             shapes.cube(np.zeros(3), 3.0),
             np.array([0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]),
         )
+
+
+def test_spatial_orders():
+    np.random.seed(0)
+    mesh = Mesh(v=np.random.rand(50, 3), f=np.random.randint(50, size=(80, 3)))
+
+    vertex_order = spatial_vertex_order(mesh)
+    np.testing.assert_array_equal(np.sort(vertex_order), np.arange(mesh.num_v))
+    assert np.all(np.diff(morton_codes(mesh.v[vertex_order]).astype(float)) >= 0)
+
+    face_order = spatial_face_order(mesh)
+    np.testing.assert_array_equal(np.sort(face_order), np.arange(mesh.num_f))
+    centroids = np.mean(mesh.v[mesh.f], axis=1)
+    assert np.all(np.diff(morton_codes(centroids)[face_order].astype(float)) >= 0)
+
+
+def test_first_use_vertex_order():
+    mesh = Mesh(v=np.zeros((6, 3)), f=np.array([[4, 2, 0], [2, 4, 5], [0, 5, 2]]))
+    np.testing.assert_array_equal(first_use_vertex_order(mesh), [4, 2, 0, 5, 1, 3])
@@ -0,0 +1,54 @@
+import numpy as np
+from . import rows as rows_module
+from .rows import first_occurrences
+
+
+def test_first_occurrences():
+    rows = np.array([[1, 2, 3], [4, 5, 6], [1, 2, 3], [0, 0, 0], [4, 5, 6], [1, 2, 3]])
+    is_first, first_indices = first_occurrences(rows)
+    np.testing.assert_array_equal(
+        is_first, np.array([True, True, False, True, False, False])
+    )
+    np.testing.assert_array_equal(first_indices, np.array([0, 1, 0, 3, 1, 0]))
+
+
+def test_first_occurrences_of_floats():
+    rows = np.array([[0.5, 1.0], [0.5, 1.0 + 1e-15], [0.5, 1.0]])
+    is_first, first_indices = first_occurrences(rows)
+    np.testing.assert_array_equal(is_first, np.array([True, True, False]))
+    np.testing.assert_array_equal(first_indices, np.array([0, 1, 0]))
+
+
+def test_first_occurrences_of_narrow_types():
+    for dtype in (np.float32, np.int32, np.uint8):
+        rows = np.array([[1, 2, 3], [4, 5, 6], [1, 2, 3]], dtype=dtype)
+        is_first, first_indices = first_occurrences(rows)
+        np.testing.assert_array_equal(is_first, np.array([True, True, False]))
+        np.testing.assert_array_equal(first_indices, np.array([0, 1, 0]))
+
+
+def test_first_occurrences_matches_unique():
+    np.random.seed(0)
+    rows = np.random.randint(0, 4, size=(500, 4))
+    is_first, first_indices = first_occurrences(rows)
+    _, expected_first, expected_inverse = np.unique(
+        rows, axis=0, return_index=True, return_inverse=True
+    )
+    np.testing.assert_array_equal(is_first.nonzero()[0], np.sort(expected_first))
+    np.testing.assert_array_equal(
+        first_indices, expected_first[expected_inverse.reshape(-1)]
+    )
+
+
+def test_first_occurrences_with_hash_collisions(monkeypatch):
+    # With all the multipliers zero, every row has the same hash.
+    monkeypatch.setattr(rows_module, "_HASH_MULTIPLIERS", np.zeros(4, dtype=np.uint64))
+    rows = np.array([[1, 2], [3, 4], [1, 2], [3, 4], [5, 6]])
+    is_first, first_indices = first_occurrences(rows)
+    np.testing.assert_array_equal(is_first, np.array([True, True, False, False, True]))
+    np.testing.assert_array_equal(first_indices, np.array([0, 1, 0, 1, 4]))
+
+
+def test_first_occurrences_empty():
+    is_first, first_indices = first_occurrences(np.zeros((0, 3)))
+    assert len(is_first) == 0 and len(first_indices) == 0
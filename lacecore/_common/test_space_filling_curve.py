@@ -0,0 +1,39 @@
+import numpy as np
+from .space_filling_curve import morton_codes
+
+
+def test_morton_codes():
+    codes = morton_codes(
+        np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+                [1.0, 1.0, 1.0],
+            ]
+        )
+    )
+    assert codes.dtype == np.uint64
+    np.testing.assert_array_equal(
+        codes,
+        np.array(
+            [0, int("001" * 21, 2), int("010" * 21, 2), int("100" * 21, 2), 2**63 - 1],
+            dtype=np.uint64,
+        ),
+    )
+
+
+def test_morton_codes_interleave_bits():
+    # The first octant of the bounding box precedes the others.
+    points = np.random.rand(100, 3)
+    points[0] = np.zeros(3)
+    points[1] = np.ones(3)
+    codes = morton_codes(points)
+    in_first_octant = np.all(points < 0.5, axis=1)
+    assert np.max(codes[in_first_octant]) < np.min(codes[~in_first_octant])
+
+
+def test_morton_codes_degenerate():
+    np.testing.assert_array_equal(morton_codes(np.ones((3, 3))), np.zeros(3))
+    np.testing.assert_array_equal(morton_codes(np.zeros((0, 3))), np.zeros(0))
@@ -1,5 +1,10 @@
 import numpy as np
 from vg.compat import v2 as vg
+from ._common.validation import check_indices
+
+# Bound the temporary arrays of `GroupMap.overlap_matrix()` to about this many
+# bytes.
+OVERLAP_CHUNK_BYTES = 2**26
 
 
 class GroupMap:
@@ -32,8 +37,44 @@ class GroupMap:
             masks = masks.copy()
         masks.setflags(write=False)
         self._num_elements = num_elements
-        self._masks = masks
         self._group_names = {k: i for i, k in enumerate(group_names)}
+        # The masks are stored in terms of a set of source elements, which
+        # are mapped to this map's elements by `_element_mapping`. When the
+        # mapping is `None`, the source elements are this map's elements.
+        # This lets `reindexed()` return a lazy view which defers copying
+        # the masks until they are accessed.
+        self._source_masks = masks
+        self._element_mapping = None
+        self._mask_cache = {}
+
+    @classmethod
+    def _view(cls, source_masks, group_names, element_mapping):
+        result = cls.__new__(cls)
+        result._num_elements = len(element_mapping)
+        result._group_names = group_names
+        result._source_masks = source_masks
+        result._element_mapping = element_mapping
+        result._mask_cache = {}
+        return result
+
+    def _mask_matrix(self):
+        # Return the full `(num_groups, num_elements)` mask matrix. For a lazy
+        # view, this computes the masks of every group, without keeping them.
+        if self._element_mapping is None:
+            return self._source_masks
+        else:
+            return self._source_masks[:, self._element_mapping]
+
+    def _mask_at(self, index):
+        if self._element_mapping is None:
+            return self._source_masks[index]
+        try:
+            return self._mask_cache[index]
+        except KeyError:
+            mask = self._source_masks[index][self._element_mapping]
+            mask.setflags(write=False)
+            self._mask_cache[index] = mask
+            return mask
 
     @classmethod
     def from_dict(cls, group_data, num_elements):
@@ -93,7 +134,7 @@ class GroupMap:
             index = self._group_names[group_name]
         except KeyError:
             raise KeyError("Unknown group: {}".format(group_name))
-        return self._masks[index]
+        return self._mask_at(index)
 
     def keys(self):
         """
@@ -125,7 +166,10 @@ class GroupMap:
             np.array: A read-only boolean array corresponding to the
                 group names in `self.keys()`.
         """
-        return self._masks[:, element]
+        if self._element_mapping is None:
+            return self._source_masks[:, element]
+        else:
+            return self._source_masks[:, self._element_mapping[element]]
 
     def group_names_for_element_mask(self, element_mask):
         """
@@ -142,17 +186,7 @@ class GroupMap:
         group_names = self.keys()
         return [group_names[index] for index in element_mask.nonzero()[0]]
 
-    def union(self, *group_names):
-        """
-        Construct the union of the requested groups and return it as a
-        writable mask.
-
-        Args:
-            group_names (list): The requested groups.
-
-        Returns:
-            np.array: A boolean mask with length equal to `self.num_elements`.
-        """
+    def _indices_of_groups(self, group_names):
         if not all(isinstance(group_name, str) for group_name in group_names):
             raise ValueError("Group names must be strings")
         indices = []
@@ -164,7 +198,180 @@ class GroupMap:
                 invalid_group_names.append(group_name)
         if len(invalid_group_names):
             raise KeyError("Unknown groups: {}".format(", ".join(invalid_group_names)))
-        return np.any(self._masks[indices], axis=0)
+        return indices
+
+    def _mapped(self, source_mask):
+        # For a lazy view, it's cheaper to combine the source masks and then
+        # map the result.
+        if self._element_mapping is None:
+            return source_mask
+        else:
+            return source_mask[self._element_mapping]
+
+    def _element_multiplicity(self):
+        # The number of times each source element appears in this map.
+        if self._element_mapping is None:
+            return np.ones(self._source_masks.shape[1], dtype=np.int64)
+        else:
+            return np.bincount(
+                self._element_mapping % self._source_masks.shape[1],
+                minlength=self._source_masks.shape[1],
+            )
+
+    def union(self, *group_names):
+        """
+        Construct the union of the requested groups and return it as a
+        writable mask.
+
+        Args:
+            group_names (list): The requested groups.
+
+        Returns:
+            np.array: A boolean mask with length equal to `self.num_elements`.
+        """
+        indices = self._indices_of_groups(group_names)
+        return self._mapped(np.any(self._source_masks[indices], axis=0))
+
+    def intersection(self, *group_names):
+        """
+        Construct the intersection of the requested groups and return it as a
+        writable mask.
+
+        Args:
+            group_names (list): The requested groups.
+
+        Returns:
+            np.array: A boolean mask with length equal to `self.num_elements`.
+        """
+        indices = self._indices_of_groups(group_names)
+        return self._mapped(np.all(self._source_masks[indices], axis=0))
+
+    def difference(self, group_name, *other_group_names):
+        """
+        Construct a mask of the elements which belong to the given group but
+        none of the other groups, and return it as a writable mask.
+
+        Args:
+            group_name (str): The group from which to subtract.
+            other_group_names (list): The groups to subtract.
+
+        Returns:
+            np.array: A boolean mask with length equal to `self.num_elements`.
+        """
+        index, *other_indices = self._indices_of_groups(
+            (group_name,) + other_group_names
+        )
+        return self._mapped(
+            np.logical_and(
+                self._source_masks[index],
+                ~np.any(self._source_masks[other_indices], axis=0),
+            )
+        )
+
+    def symmetric_difference(self, *group_names):
+        """
+        Construct a mask of the elements which belong to an odd number of the
+        requested groups, and return it as a writable mask. For two groups,
+        these are the elements which belong to one group or the other but not
+        both.
+
+        Args:
+            group_names (list): The requested groups.
+
+        Returns:
+            np.array: A boolean mask with length equal to `self.num_elements`.
+        """
+        indices = self._indices_of_groups(group_names)
+        return self._mapped(np.logical_xor.reduce(self._source_masks[indices], axis=0))
+
+    def counts(self):
+        """
+        Count the elements in each group.
+
+        Returns:
+            np.ndarray: The number of elements in each group, in the order of
+            `self.keys()`.
+        """
+        if self._element_mapping is None:
+            return np.count_nonzero(self._source_masks, axis=1)
+        else:
+            # Weight each source element by the number of times it's mapped,
+            # which avoids materializing the masks.
+            return self._source_masks @ self._element_multiplicity()
+
+    def overlap_matrix(self, chunk_size=None):
+        """
+        Count the elements shared by each pair of groups, using a matrix
+        product over the masks.
+
+        Args:
+            chunk_size (int): The maximum number of elements to process at
+                once. This bounds the size of the temporary arrays. The
+                default keeps them to about `OVERLAP_CHUNK_BYTES`.
+
+        Returns:
+            np.ndarray: A `(num_groups, num_groups)` array whose entry `i, j`
+            is the number of elements in both group `i` and group `j`. The
+            diagonal contains the size of each group.
+        """
+        num_groups, num_source_elements = self._source_masks.shape
+        multiplicity = self._element_multiplicity()
+        if chunk_size is None:
+            # Each chunk is copied to floats twice: once as is, and once
+            # weighted by the multiplicity of its elements.
+            chunk_size = max(
+                1,
+                OVERLAP_CHUNK_BYTES
+                // (2 * np.dtype(np.float64).itemsize * max(1, num_groups)),
+            )
+        chunk_size = min(chunk_size, max(1, num_source_elements))
+        # Compute the product on floats, which is much faster than integer
+        # arithmetic. Within a chunk the weighted sums are bounded by the
+        # number of mapped elements, so they can be represented exactly. The
+        # buffers are allocated once, and each chunk's product is accumulated
+        # into the result.
+        masks = np.empty((num_groups, chunk_size))
+        weighted_masks = np.empty((num_groups, chunk_size))
+        product = np.empty((num_groups, num_groups))
+        result = np.zeros((num_groups, num_groups), dtype=np.int64)
+        for start in range(0, num_source_elements, chunk_size):
+            chunk = self._source_masks[:, start : start + chunk_size]
+            width = chunk.shape[1]
+            np.copyto(masks[:, :width], chunk)
+            np.multiply(
+                masks[:, :width],
+                multiplicity[start : start + width],
+                out=weighted_masks[:, :width],
+            )
+            np.matmul(weighted_masks[:, :width], masks[:, :width].T, out=product)
+            np.add(result, np.rint(product, out=product), out=result, casting="unsafe")
+        return result
+
+    def groups_containing(self, indices_or_boolean_mask):
+        """
+        Find the groups which contain any of the given elements.
+
+        Args:
+            indices_or_boolean_mask (np.arraylike): Either a list of element
+                indices, or a boolean mask with length equal to
+                `self.num_elements`.
+
+        Returns:
+            list: The names of the groups, in the order of `self.keys()`.
+        """
+        elements = np.asarray(indices_or_boolean_mask)
+        if elements.dtype == bool:
+            vg.shape.check(locals(), "elements", (self._num_elements,))
+            elements = elements.nonzero()[0]
+        else:
+            elements = elements.astype(np.int64, copy=False)
+            vg.shape.check(locals(), "elements", (-1,))
+            check_indices(elements, self._num_elements, "elements")
+        if self._element_mapping is not None:
+            elements = self._element_mapping[elements]
+        return self.group_names_for_element_mask(
+            np.any(self._source_masks[:, elements], axis=1)
+        )
 
     def reindexed(self, f_new_to_old):
         """
@@ -174,6 +381,11 @@ class GroupMap:
         the old group map to construct a new group map which preserves the
         original segments wherever possible.
 
+        The result is a lazy view: the index mappings of successive calls are
+        composed, and the mask of a group is only computed when it is
+        accessed. This keeps reindexing cheap when a mesh passes through a
+        chain of operations and nobody reads its groups.
+
         Args:
             f_new_to_old (np.ndarray): The old face index
                 corresponding to each of the new faces.
@@ -181,11 +393,29 @@ class GroupMap:
         Returns:
             GroupMap: A new group map suitable for use with the new faces.
         """
-        return GroupMap(
-            num_elements=len(f_new_to_old),
+        f_new_to_old = np.asarray(f_new_to_old)
+        vg.shape.check(locals(), "f_new_to_old", (-1,))
+        if len(f_new_to_old) == 0:
+            f_new_to_old = f_new_to_old.astype(np.int64)
+        elif f_new_to_old.dtype.kind not in "iu":
+            raise ValueError("Expected f_new_to_old to be an array of indices")
+        if self._element_mapping is None:
+            # Validate eagerly, since the mapping won't be applied until later.
+            if np.any(f_new_to_old >= self._num_elements) or np.any(
+                f_new_to_old < -self._num_elements
+            ):
+                raise IndexError(
+                    "Expected indices in f_new_to_old to be less than {}".format(
+                        self._num_elements
+                    )
+                )
+            element_mapping = np.array(f_new_to_old)
+        else:
+            element_mapping = self._element_mapping[f_new_to_old]
+        return GroupMap._view(
+            source_masks=self._source_masks,
             group_names=self._group_names,
-            masks=np.asarray(self._masks[:, f_new_to_old]),
-            copy_masks=False,
+            element_mapping=element_mapping,
         )
 
     def defragment(self, group_order=None):
@@ -224,11 +454,12 @@ class GroupMap:
                     f"group_order contains unknown groups: {', '.join(sorted(list(unknown_groups)))}"
                 )
 
-        ordering = np.zeros(0, dtype=FACE_DTYPE)
+        is_ordered = np.zeros(self._num_elements, dtype=bool)
+        orderings = [np.zeros(0, dtype=FACE_DTYPE)]
         for group_name in group_order:
             this_mask = self[group_name]
-            these_elements = this_mask.nonzero()[0]
-            if len(np.intersect1d(ordering, these_elements)) > 0:
+            if np.any(is_ordered & this_mask):
                 raise ValueError(f'Group "{group_name}" overlaps with previous groups')
-            ordering = np.append(ordering, these_elements)
-        return ordering
+            is_ordered |= this_mask
+            orderings.append(this_mask.nonzero()[0])
+        return np.concatenate(orderings)
@@ -1,15 +1,27 @@
 import numpy as np
 from vg.compat import v2 as vg
 from ._analysis.analysis_mixin import AnalysisMixin
+from ._cleanup.cleanup_mixin import CleanupMixin
+from ._common.cache import cached
 from ._common.validation import check_arity, check_indices
 from ._obj.writer import write as write_obj
+from ._query.query_mixin import QueryMixin
 from ._selection.selection_mixin import SelectionMixin
+from ._topology.topology_mixin import TopologyMixin
+from ._transform.affine import apply_affine_transforms
 from ._transform.transform_mixin import TransformMixin
 
 FACE_DTYPE = np.int64
 
 
-class Mesh(AnalysisMixin, SelectionMixin, TransformMixin):
+class Mesh(
+    AnalysisMixin,
+    CleanupMixin,
+    QueryMixin,
+    SelectionMixin,
+    TopologyMixin,
+    TransformMixin,
+):
     """
     A triangular or quad mesh. Vertices and faces are represented using NumPy
     arrays. Instances are read-only, at least for now. This class is optimized
@@ -37,11 +49,45 @@ class Mesh(AnalysisMixin, SelectionMixin, TransformMixin):
         #     f = np.copy(f)
         # if copy_v:
         #     v = np.copy(v)
+        self._set_up(v=v, f=f, face_groups=face_groups)
+
+    def _set_up(self, v, f, face_groups, transform_source=None, transform_matrix=None):
         f.setflags(write=False)
-        v.setflags(write=False)
+        if v is not None:
+            v.setflags(write=False)
         self.f = f
-        self.v = v
+        self._v = v
+        # A mesh produced by a transform refers to the mesh which was
+        # transformed, and the 4x4 matrix which was applied. Its vertices
+        # are computed when they're first read.
+        self._transform_source = transform_source
+        self._transform_matrix = transform_matrix
         self.face_groups = face_groups
+        self._cache = {}
+
+    @classmethod
+    def _from_valid_arrays(cls, v, f, face_groups=None):
+        # Construct a mesh from arrays derived from an existing mesh, such as
+        # its transformed vertices and its faces, skipping the validation,
+        # which costs a pass over the faces.
+        mesh = cls.__new__(cls)
+        mesh._set_up(v=v, f=f, face_groups=face_groups)
+        return mesh
+
+    @classmethod
+    def _transformed(cls, source, matrix, f, face_groups=None):
+        # Construct a mesh whose vertices are those of `source`, transformed
+        # by the given matrix. They aren't computed until they're needed.
+        mesh = cls.__new__(cls)
+        matrix.setflags(write=False)
+        mesh._set_up(
+            v=None,
+            f=f,
+            face_groups=face_groups,
+            transform_source=source,
+            transform_matrix=matrix,
+        )
+        return mesh
 
     # TODO: Needs coverage.
     # @classmethod
@@ -51,6 +97,29 @@ class Mesh(AnalysisMixin, SelectionMixin, TransformMixin):
     def __repr__(self):
         return f"lacecore.Mesh(num_v={self.num_v}, num_f={self.num_f})"
 
+    @property
+    def v(self):
+        """
+        The vertices, as a read-only `kx3` array.
+
+        The vertices of a mesh produced by a transform are computed when
+        they're first read, so a chain of transforms only multiplies their
+        matrices.
+
+        Return:
+            np.ndarray: The vertices.
+        """
+        if self._v is None:
+            v = np.empty((self._transform_source.num_v, 3))
+            apply_affine_transforms(
+                self._transform_source.v,
+                self._transform_matrix[np.newaxis],
+                v[np.newaxis],
+            )
+            v.setflags(write=False)
+            self._v = v
+        return self._v
+
     @property
     def num_v(self):
         """
@@ -59,7 +128,9 @@ class Mesh(AnalysisMixin, SelectionMixin, TransformMixin):
         Return:
             int: The number of vertices.
         """
-        return len(self.v)
+        if self._v is None:
+            return self._transform_source.num_v
+        return len(self._v)
 
     @property
     def num_f(self):
@@ -91,6 +162,37 @@ class Mesh(AnalysisMixin, SelectionMixin, TransformMixin):
         """
         return self.f.shape[1] == 4
 
+    @cached
+    def vertex_groups_of_face_groups(self):
+        """
+        Construct a group map of the vertices which belong to each face
+        group. A vertex belongs to a group when any of the faces which
+        reference it belong to the group.
+
+        The vertex masks of all the groups are computed at once, by scattering
+        the face-vertex incidence of every group member, and the result is
+        cached on the mesh. To find the vertices of only a few groups, use
+        `Selection.pick_vertices_of_face_groups()`, which costs less.
+
+        Returns:
+            lacecore.GroupMap: A group map with the same group names as
+            `self.face_groups`, whose elements are the vertices.
+        """
+        from ._group_map import GroupMap
+
+        if self.face_groups is None:
+            raise ValueError("Mesh has no face groups")
+
+        group_indices, face_indices = self.face_groups._mask_matrix().nonzero()
+        vertex_masks = np.zeros((len(self.face_groups), self.num_v), dtype=bool)
+        vertex_masks[group_indices[:, np.newaxis], self.f[face_indices]] = True
+        return GroupMap(
+            num_elements=self.num_v,
+            group_names=self.face_groups.keys(),
+            masks=vertex_masks,
+            copy_masks=False,
+        )
+
     def write_obj(self, filename):
         """
         Save a mesh's faces, vertices, and face groups to a Wavefront OBJ file.
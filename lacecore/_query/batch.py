@@ -0,0 +1,53 @@
+import numpy as np
+
+CHUNK_SIZE = 2**12
+
+
+def map_chunks(function, num_queries, executor=None):
+    """
+    Apply a function to consecutive chunks of queries, so the memory needed
+    for intermediate results stays bounded, and concatenate the results.
+
+    Args:
+        function (function): A function which receives a `slice` of the
+            queries and returns a tuple of arrays with one row per query.
+        num_queries (int): The number of queries.
+        executor (concurrent.futures.Executor): An optional executor, such
+            as a `ThreadPoolExecutor`, used to process chunks concurrently.
+
+    Returns:
+        tuple: The concatenated results.
+    """
+    # Always process at least one chunk, so the results have the right
+    # shape and dtype when there are no queries.
+    chunks = [
+        slice(start, start + CHUNK_SIZE)
+        for start in range(0, max(num_queries, 1), CHUNK_SIZE)
+    ]
+    if executor is None:
+        results = list(map(function, chunks))
+    else:
+        results = list(executor.map(function, chunks))
+    return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+
+def lowest_per_query(num_queries, queries, primitives, values):
+    """
+    Given candidate `(query, primitive, value)` triples, find the primitive
+    with the lowest value for each query, breaking ties in favor of the
+    lowest primitive index.
+
+    Returns:
+        tuple: `(primitives, values)`, with one entry per query. Queries with
+        no candidates yield `-1` and `np.inf`.
+    """
+    order = np.lexsort((primitives, values, queries))
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = queries[order[1:]] != queries[order[:-1]]
+    lowest = order[is_first]
+
+    lowest_primitives = np.full(num_queries, -1, dtype=np.int64)
+    lowest_values = np.full(num_queries, np.inf)
+    lowest_primitives[queries[lowest]] = primitives[lowest]
+    lowest_values[queries[lowest]] = values[lowest]
+    return lowest_primitives, lowest_values
@@ -0,0 +1,51 @@
+import numpy as np
+from vg.compat import v2 as vg
+
+
+def triangles_intersect_box(vertices_of_tris, box_lower, box_upper):
+    """
+    Test whether each triangle intersects an axis-aligned box, using the
+    separating axis theorem. Triangles which touch the box are considered to
+    intersect it.
+
+    Args:
+        vertices_of_tris (np.ndarray): A `kx3x3` array of triangles.
+        box_lower (np.ndarray): The minimum corner of the box.
+        box_upper (np.ndarray): The maximum corner of the box.
+
+    Returns:
+        np.ndarray: A boolean array with `k` elements.
+
+    See also:
+        Tomas Akenine-Möller, "Fast 3D Triangle-Box Overlap Testing"
+    """
+    vg.shape.check(locals(), "vertices_of_tris", (-1, 3, 3))
+    center = 0.5 * (box_lower + box_upper)
+    half_size = 0.5 * (box_upper - box_lower)
+    points = vertices_of_tris - center
+    edges = np.roll(points, -1, axis=1) - points
+
+    def is_separating(axes):
+        # `axes` has shape `kx3`. Project the triangles and the box onto each
+        # axis, and test whether the projections are disjoint.
+        projections = np.einsum("ijk,ik->ij", points, axes)
+        radius = np.abs(axes) @ half_size
+        return np.logical_or(
+            np.min(projections, axis=1) > radius,
+            np.max(projections, axis=1) < -radius,
+        )
+
+    # The box's face normals.
+    separated = np.any(
+        np.logical_or(
+            np.min(points, axis=1) > half_size, np.max(points, axis=1) < -half_size
+        ),
+        axis=1,
+    )
+    # The triangle's normal.
+    separated |= is_separating(np.cross(edges[:, 0], edges[:, 1]))
+    # The cross products of the box's edges and the triangle's edges.
+    for box_axis in np.eye(3):
+        for edge_index in range(3):
+            separated |= is_separating(np.cross(box_axis, edges[:, edge_index]))
+    return ~separated
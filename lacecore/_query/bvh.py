@@ -0,0 +1,176 @@
+import numpy as np
+from .._common.ranges import concatenate_ranges
+from .._common.space_filling_curve import morton_codes
+
+
+class BoundingVolumeHierarchy:
+    """
+    An array-backed bounding volume hierarchy over a set of primitives, such
+    as points or faces, each described by an axis-aligned bounding box.
+
+    The primitives are sorted along a Morton curve and grouped into leaves of
+    up to `leaf_size` consecutive primitives. The leaves form the bottom level
+    of a complete binary tree, which is stored as one pair of bounds arrays
+    per level. This lets many queries traverse the tree together, one level
+    at a time, using array operations.
+
+    Args:
+        lower (np.ndarray): A `kx3` array of the minimum corner of each
+            primitive's bounding box.
+        upper (np.ndarray): A `kx3` array of the maximum corner of each
+            primitive's bounding box.
+        leaf_size (int): The maximum number of primitives in each leaf.
+    """
+
+    def __init__(self, lower, upper, leaf_size=8):
+        num_primitives = len(lower)
+        self.num_primitives = num_primitives
+        self.leaf_size = leaf_size
+
+        self.order = np.argsort(morton_codes(0.5 * (lower + upper)), kind="stable")
+        self.primitive_lower = lower[self.order]
+        self.primitive_upper = upper[self.order]
+
+        num_leaves = max(1, -(-num_primitives // leaf_size))
+        depth = int(np.ceil(np.log2(num_leaves)))
+        # Pad the leaf level with empty boxes, which no query overlaps.
+        leaf_lower = np.full((2**depth, 3), np.inf)
+        leaf_upper = np.full((2**depth, 3), -np.inf)
+        if num_primitives > 0:
+            starts = np.arange(0, num_primitives, leaf_size)
+            leaf_lower[:num_leaves] = np.minimum.reduceat(
+                self.primitive_lower, starts, axis=0
+            )
+            leaf_upper[:num_leaves] = np.maximum.reduceat(
+                self.primitive_upper, starts, axis=0
+            )
+
+        # `self.levels[0]` is the root; the children of node `i` in one level
+        # are nodes `2 * i` and `2 * i + 1` in the next.
+        self.levels = [(leaf_lower, leaf_upper)]
+        while len(self.levels[0][0]) > 1:
+            child_lower, child_upper = self.levels[0]
+            self.levels.insert(
+                0,
+                (
+                    np.minimum(child_lower[0::2], child_lower[1::2]),
+                    np.maximum(child_upper[0::2], child_upper[1::2]),
+                ),
+            )
+
+    @classmethod
+    def from_points(cls, points, leaf_size=8):
+        """
+        Construct a hierarchy over points.
+        """
+        return cls(points, points, leaf_size=leaf_size)
+
+    @classmethod
+    def from_faces(cls, vertices_of_faces, leaf_size=8):
+        """
+        Construct a hierarchy over faces, given as a `kx3x3` or `kx4x3`
+        array of their vertices.
+        """
+        return cls(
+            np.min(vertices_of_faces, axis=1),
+            np.max(vertices_of_faces, axis=1),
+            leaf_size=leaf_size,
+        )
+
+    def traverse(self, query_indices, descend):
+        """
+        Traverse the hierarchy for many queries at once, collecting the
+        primitives which each query reaches.
+
+        Args:
+            query_indices (np.ndarray): The indices of the queries.
+            descend (function): A function which receives an array of query
+                indices, and `nx3` arrays of the lower and upper corners of
+                the corresponding nodes' bounding boxes. It should return a
+                boolean array indicating which queries should visit the
+                contents of the corresponding nodes. It's invoked for each
+                level of the tree, and then for the primitives themselves.
+
+        Returns:
+            tuple: `(query_indices, primitive_indices)`, with one entry for each
+            primitive reached by each query.
+        """
+        queries = np.asarray(query_indices, dtype=np.int64)
+        nodes = np.zeros(len(queries), dtype=np.int64)
+        for level, (lower, upper) in enumerate(self.levels):
+            keep = descend(queries, lower[nodes], upper[nodes])
+            queries, nodes = queries[keep], nodes[keep]
+            if level < len(self.levels) - 1:
+                queries = np.repeat(queries, 2)
+                nodes = (2 * nodes[:, np.newaxis] + np.array([0, 1])).ravel()
+
+        starts = nodes * self.leaf_size
+        stops = np.minimum(starts + self.leaf_size, self.num_primitives)
+        primitives = concatenate_ranges(starts, stops)
+        queries = np.repeat(queries, stops - starts)
+        keep = descend(
+            queries, self.primitive_lower[primitives], self.primitive_upper[primitives]
+        )
+        return queries[keep], self.order[primitives[keep]]
+
+    def query_boxes(self, lower, upper):
+        """
+        Find the primitives whose bounding boxes overlap each of the given
+        boxes. Boxes which touch are considered to overlap.
+
+        Args:
+            lower (np.ndarray): A `kx3` array of the minimum corner of each
+                box.
+            upper (np.ndarray): A `kx3` array of the maximum corner of each
+                box.
+
+        Returns:
+            tuple: `(box_indices, primitive_indices)`, with one entry for each
+            overlapping pair.
+        """
+
+        def overlaps(queries, node_lower, node_upper):
+            return np.all(
+                np.logical_and(
+                    node_lower <= upper[queries], node_upper >= lower[queries]
+                ),
+                axis=1,
+            )
+
+        return self.traverse(np.arange(len(lower)), overlaps)
+
+    def query_rays(self, origins, directions):
+        """
+        Find the primitives whose bounding boxes are crossed by each of the
+        given rays. Rays which touch a box are considered to cross it.
+
+        Args:
+            origins (np.ndarray): A `kx3` array of the origin of each ray.
+            directions (np.ndarray): A `kx3` array of the direction of each
+                ray.
+
+        Returns:
+            tuple: `(ray_indices, primitive_indices)`, with one entry for each
+            crossing.
+        """
+        with np.errstate(divide="ignore"):
+            inverse_directions = 1.0 / directions
+
+        def crosses(queries, lower, upper):
+            # Intersect each ray with the slabs between the box's planes.
+            with np.errstate(invalid="ignore"):
+                to_lower = (lower - origins[queries]) * inverse_directions[queries]
+                to_upper = (upper - origins[queries]) * inverse_directions[queries]
+            entries = np.minimum(to_lower, to_upper)
+            exits = np.maximum(to_lower, to_upper)
+            # A ray which lies in one of the planes yields NaN, and is
+            # conservatively treated as crossing that slab.
+            is_nan = np.isnan(entries)
+            entries[is_nan] = -np.inf
+            exits[is_nan] = np.inf
+            entry = np.maximum(np.maximum(entries[:, 0], entries[:, 1]), entries[:, 2])
+            exit = np.minimum(np.minimum(exits[:, 0], exits[:, 1]), exits[:, 2])
+            # The empty boxes used as padding have inverted bounds.
+            return (entry <= exit) & (exit >= 0) & (lower[:, 0] <= upper[:, 0])
+
+        return self.traverse(np.arange(len(origins)), crosses)
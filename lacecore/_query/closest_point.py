@@ -0,0 +1,101 @@
+import numpy as np
+
+
+def _dot(a, b):
+    return np.einsum("ij,ij->i", a, b)
+
+
+def segment_parameters(points, start, end):
+    """
+    Find the parameter `t` of the point on each segment which is closest to
+    the corresponding query point, where `0` is the start of the segment and
+    `1` is the end. Degenerate segments yield `0`.
+    """
+    direction = end - start
+    length_squared = _dot(direction, direction)
+    t = np.divide(
+        _dot(points - start, direction),
+        length_squared,
+        out=np.zeros(len(points)),
+        where=length_squared > 0,
+    )
+    return np.clip(t, 0.0, 1.0)
+
+
+def coords_of_closest_points_on_triangles(points, vertices_of_tris):
+    """
+    Find the point on each triangle which is closest to the corresponding
+    query point.
+
+    Args:
+        points (np.ndarray): A `kx3` array of query points.
+        vertices_of_tris (np.ndarray): A `kx3x3` array of triangle vertices.
+
+    Returns:
+        np.ndarray: A `kx3` array of the barycentric coordinates of the
+        closest points.
+    """
+    a, b, c = vertices_of_tris[:, 0], vertices_of_tris[:, 1], vertices_of_tris[:, 2]
+    ab, ac, ap = b - a, c - a, points - a
+    d00, d01, d11 = _dot(ab, ab), _dot(ab, ac), _dot(ac, ac)
+    d20, d21 = _dot(ap, ab), _dot(ap, ac)
+    denominator = d00 * d11 - d01**2
+
+    # When the projection of the point onto the triangle's plane lies inside
+    # the triangle, it's the closest point.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = (d11 * d20 - d01 * d21) / denominator
+        w = (d00 * d21 - d01 * d20) / denominator
+    interior_coords = np.stack([1.0 - v - w, v, w], axis=1)
+    is_interior = np.logical_and(denominator > 0, np.all(interior_coords >= 0, axis=1))
+
+    # Otherwise, the closest point lies on one of the edges. Considering all
+    # three edges also handles degenerate triangles.
+    edge_coords = np.zeros((3, len(points), 3))
+    edge_distances_squared = np.empty((3, len(points)))
+    for edge, (i, j) in enumerate(((0, 1), (1, 2), (2, 0))):
+        start, end = vertices_of_tris[:, i], vertices_of_tris[:, j]
+        t = segment_parameters(points, start, end)
+        edge_coords[edge, :, i] = 1.0 - t
+        edge_coords[edge, :, j] = t
+        offsets = points - start - t[:, np.newaxis] * (end - start)
+        edge_distances_squared[edge] = _dot(offsets, offsets)
+    nearest_edge = np.argmin(edge_distances_squared, axis=0)
+    coords = edge_coords[nearest_edge, np.arange(len(points))]
+
+    coords[is_interior] = interior_coords[is_interior]
+    return coords
+
+
+def closest_points_on_faces(points, vertices_of_faces):
+    """
+    Find the point on each triangle or quad which is closest to the
+    corresponding query point. Quads are treated as two triangles,
+    `(0, 1, 2)` and `(0, 2, 3)`.
+
+    Args:
+        points (np.ndarray): A `kx3` array of query points.
+        vertices_of_faces (np.ndarray): A `kx3x3` or `kx4x3` array of face
+            vertices.
+
+    Returns:
+        tuple: `(closest_points, coords)`, where `coords` contains the weight
+        of each of the face's vertices in its closest point, as `kx3` or
+        `kx4`.
+    """
+    coords = coords_of_closest_points_on_triangles(points, vertices_of_faces[:, :3])
+    if vertices_of_faces.shape[1] == 4:
+        coords = np.pad(coords, ((0, 0), (0, 1)))
+        second_coords = np.zeros_like(coords)
+        second_coords[:, [0, 2, 3]] = coords_of_closest_points_on_triangles(
+            points, vertices_of_faces[:, [0, 2, 3]]
+        )
+        first_offsets, second_offsets = (
+            np.einsum("ij,ijk->ik", candidate, vertices_of_faces) - points
+            for candidate in (coords, second_coords)
+        )
+        use_second = _dot(second_offsets, second_offsets) < _dot(
+            first_offsets, first_offsets
+        )
+        coords[use_second] = second_coords[use_second]
+    return np.einsum("ij,ijk->ik", coords, vertices_of_faces), coords
@@ -0,0 +1,131 @@
+import numpy as np
+from .batch import lowest_per_query
+from .closest_point import closest_points_on_faces
+from .._common.ranges import concatenate_ranges
+
+
+def box_distances_squared(points, lower, upper):
+    """
+    Compute the squared distances from each point to the nearest and
+    farthest points of the corresponding axis-aligned box. Empty boxes, whose
+    bounds are infinite, are infinitely far away.
+
+    Returns:
+        tuple: `(nearest_distances_squared, farthest_distances_squared)`.
+    """
+    to_lower, to_upper = lower - points, points - upper
+    nearest_offsets = np.maximum(np.maximum(to_lower, to_upper), 0.0)
+    farthest_offsets = np.maximum(np.abs(to_lower), np.abs(to_upper))
+    return (
+        np.einsum("ij,ij->i", nearest_offsets, nearest_offsets),
+        np.einsum("ij,ij->i", farthest_offsets, farthest_offsets),
+    )
+
+
+def _beam_search(bvh, points, primitive_distances_squared, beam_width):
+    # Follow a handful of the nearest nodes at each level down to the leaves,
+    # and measure the distance to their primitives. This cheaply establishes
+    # a tight upper bound on the distance to the nearest primitive.
+    nodes = np.zeros((len(points), 1), dtype=np.int64)
+    for lower, upper in bvh.levels[1:]:
+        children = (2 * nodes[:, :, np.newaxis] + np.array([0, 1])).reshape(
+            len(points), 2 * nodes.shape[1]
+        )
+        nearest_squared, _ = box_distances_squared(
+            np.repeat(points, children.shape[1], axis=0),
+            lower[children.ravel()],
+            upper[children.ravel()],
+        )
+        if children.shape[1] > beam_width:
+            beam = np.argpartition(
+                nearest_squared.reshape(children.shape), beam_width - 1, axis=1
+            )[:, :beam_width]
+            children = np.take_along_axis(children, beam, axis=1)
+        nodes = children
+
+    # The beam may include padding beyond the last primitive.
+    starts = np.minimum(nodes.ravel() * bvh.leaf_size, bvh.num_primitives)
+    stops = np.minimum(starts + bvh.leaf_size, bvh.num_primitives)
+    queries = np.repeat(np.arange(len(points)), nodes.shape[1])
+    queries = np.repeat(queries, stops - starts)
+    primitives = bvh.order[concatenate_ranges(starts, stops)]
+    bounds = np.full(len(points), np.inf)
+    np.minimum.at(bounds, queries, primitive_distances_squared(queries, primitives))
+    return bounds
+
+
+def find_nearest(bvh, points, primitive_distances_squared, beam_width=4):
+    """
+    Find the nearest primitive to each of the given points.
+
+    Args:
+        bvh (BoundingVolumeHierarchy): A hierarchy containing at least one
+            primitive.
+        points (np.ndarray): A `kx3` array of query points.
+        primitive_distances_squared (function): A function which receives
+            arrays of query indices and primitive indices, and returns the
+            squared distance from each query point to the corresponding
+            primitive.
+        beam_width (int): The number of nodes per level to follow when
+            establishing an initial bound.
+
+    Returns:
+        tuple: `(primitive_indices, distances_squared)`, with one entry per
+        query point.
+    """
+    bounds = _beam_search(bvh, points, primitive_distances_squared, beam_width)
+
+    # Every non-empty node also contains a primitive no farther away than the
+    # farthest point of its box, which tightens the bound as the traversal
+    # descends and skips the nodes which are certainly farther away.
+
+    def may_contain_nearest(queries, lower, upper):
+        nearest_squared, farthest_squared = box_distances_squared(
+            points[queries], lower, upper
+        )
+        np.minimum.at(bounds, queries, farthest_squared)
+        # Allow for rounding, so the node which established each bound is
+        # never excluded.
+        return nearest_squared <= bounds[queries] * (1.0 + 1e-9)
+
+    queries, primitives = bvh.traverse(np.arange(len(points)), may_contain_nearest)
+    distances_squared = primitive_distances_squared(queries, primitives)
+
+    return lowest_per_query(len(points), queries, primitives, distances_squared)
+
+
+def nearest_vertices(mesh, points):
+    """
+    Find the vertex of the mesh nearest to each of the given points.
+
+    Returns:
+        tuple: `(vertex_indices, distances)`.
+    """
+
+    def distances_squared(queries, vertices):
+        offsets = mesh.v[vertices] - points[queries]
+        return np.einsum("ij,ij->i", offsets, offsets)
+
+    indices, nearest_distances_squared = find_nearest(
+        mesh._vertex_bvh(), points, distances_squared
+    )
+    return indices, np.sqrt(nearest_distances_squared)
+
+
+def closest_points(mesh, points):
+    """
+    Find the point on the surface of the mesh closest to each of the given
+    points.
+
+    Returns:
+        tuple: `(closest_points, face_indices, coords, distances)`.
+    """
+
+    def distances_squared(queries, faces):
+        closest, _ = closest_points_on_faces(points[queries], mesh.v[mesh.f[faces]])
+        offsets = closest - points[queries]
+        return np.einsum("ij,ij->i", offsets, offsets)
+
+    face_indices, _ = find_nearest(mesh._face_bvh(), points, distances_squared)
+    closest, coords = closest_points_on_faces(points, mesh.v[mesh.f[face_indices]])
+    return closest, face_indices, coords, np.linalg.norm(closest - points, axis=1)
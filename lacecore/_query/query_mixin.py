@@ -0,0 +1,130 @@
+import numpy as np
+from vg.compat import v2 as vg
+from . import nearest, ray_casting
+from .batch import map_chunks
+from .bvh import BoundingVolumeHierarchy
+from .._common.cache import cached
+
+
+class QueryMixin:
+    @cached
+    def _vertex_bvh(self):
+        # A spatial index of the vertices, built on first use.
+        return BoundingVolumeHierarchy.from_points(self.v)
+
+    @cached
+    def _face_bvh(self):
+        # A spatial index of the faces, built on first use.
+        return BoundingVolumeHierarchy.from_faces(self.v[self.f])
+
+    def nearest_vertices(self, points, executor=None):
+        """
+        Find the vertex nearest to each of the given points.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh. Queries are processed in chunks, so memory
+        use stays bounded for large numbers of points.
+
+        Args:
+            points (np.arraylike): A `kx3` array of query points.
+            executor (concurrent.futures.Executor): An optional executor,
+                such as a `ThreadPoolExecutor`, used to process chunks of
+                queries concurrently.
+
+        Returns:
+            tuple: `(indices, distances)`, where `indices` contains the index
+            of the nearest vertex to each point and `distances` contains
+            the distance to it.
+        """
+        vg.shape.check(locals(), "points", (-1, 3))
+        if self.num_v == 0:
+            raise ValueError("Expected mesh to have at least one vertex")
+        # Build the index up front, rather than in each thread.
+        self._vertex_bvh()
+        return map_chunks(
+            lambda chunk: nearest.nearest_vertices(self, points[chunk]),
+            len(points),
+            executor=executor,
+        )
+
+    def closest_points(self, points, executor=None):
+        """
+        Find the point on the surface of the mesh closest to each of the
+        given points.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh. Queries are processed in chunks, so memory
+        use stays bounded for large numbers of points.
+
+        Args:
+            points (np.arraylike): A `kx3` array of query points.
+            executor (concurrent.futures.Executor): An optional executor,
+                such as a `ThreadPoolExecutor`, used to process chunks of
+                queries concurrently.
+
+        Returns:
+            tuple: `(closest_points, face_indices, coords, distances)`.
+            `closest_points` is a `kx3` array of the closest point on the
+            surface to each query point, and `face_indices` contains the
+            index of the face on which it lies. `coords` contains its
+            barycentric coordinates with respect to that face's vertices,
+            as `kx3` for triangle meshes or `kx4` for quad meshes, in which
+            each quad is treated as the triangles `(0, 1, 2)` and
+            `(0, 2, 3)`. `distances` contains the distance from each query
+            point to its closest point.
+        """
+        vg.shape.check(locals(), "points", (-1, 3))
+        if self.num_f == 0:
+            raise ValueError("Expected mesh to have at least one face")
+        # Build the index up front, rather than in each thread.
+        self._face_bvh()
+        return map_chunks(
+            lambda chunk: nearest.closest_points(self, points[chunk]),
+            len(points),
+            executor=executor,
+        )
+
+    def intersect_rays(self, origins, directions, executor=None):
+        """
+        Find the first face hit by each of the given rays. Faces are hit from
+        either side.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh. Rays are processed in chunks, so memory use
+        stays bounded for large numbers of rays.
+
+        Args:
+            origins (np.arraylike): A `kx3` array of the origin of each ray.
+            directions (np.arraylike): A `kx3` array of the direction of each
+                ray, which need not be normalized.
+            executor (concurrent.futures.Executor): An optional executor,
+                such as a `ThreadPoolExecutor`, used to process chunks of rays
+                concurrently.
+
+        Returns:
+            tuple: `(distances, face_indices, coords)`. `distances` contains
+            the distance from each ray's origin to its first hit, and
+            `face_indices` contains the index of the face which was hit.
+            `coords` contains the barycentric coordinates of the hit with
+            respect to that face's vertices, as `kx3` for triangle meshes or
+            `kx4` for quad meshes, in which each quad is treated as the
+            triangles `(0, 1, 2)` and `(0, 2, 3)`. Rays which miss the mesh
+            yield a distance of `np.inf`, a face index of `-1`, and
+            coordinates of `np.nan`.
+        """
+        k = vg.shape.check(locals(), "origins", (-1, 3))
+        vg.shape.check(locals(), "directions", (k, 3))
+        norms = np.linalg.norm(directions, axis=1)
+        if np.any(norms == 0):
+            raise ValueError("Expected directions to be nonzero")
+        unit_directions = directions / norms[:, np.newaxis]
+
+        # Build the index up front, rather than in each thread.
+        self._face_bvh()
+        return map_chunks(
+            lambda chunk: ray_casting.intersect_rays(
+                self, origins[chunk], unit_directions[chunk]
+            ),
+            len(origins),
+            executor=executor,
+        )
@@ -0,0 +1,27 @@
+import numpy as np
+from .batch import lowest_per_query
+from .ray_intersection import rays_intersect_faces
+
+
+def intersect_rays(mesh, origins, directions):
+    """
+    Find the first face of the mesh hit by each of the given rays.
+
+    Returns:
+        tuple: `(distances, face_indices, coords)`.
+    """
+    queries, faces = mesh._face_bvh().query_rays(origins, directions)
+    t, _ = rays_intersect_faces(
+        origins[queries], directions[queries], mesh.v[mesh.f[faces]]
+    )
+    is_hit = np.isfinite(t)
+    face_indices, distances = lowest_per_query(
+        len(origins), queries[is_hit], faces[is_hit], t[is_hit]
+    )
+
+    coords = np.full((len(origins), mesh.f.shape[1]), np.nan)
+    (hits,) = np.nonzero(face_indices != -1)
+    _, coords[hits] = rays_intersect_faces(
+        origins[hits], directions[hits], mesh.v[mesh.f[face_indices[hits]]]
+    )
+    return distances, face_indices, coords
@@ -0,0 +1,71 @@
+import numpy as np
+
+
+def _dot(a, b):
+    return np.einsum("ij,ij->i", a, b)
+
+
+def rays_intersect_triangles(origins, directions, vertices_of_tris):
+    """
+    Intersect each ray with the corresponding triangle, using the
+    Möller-Trumbore algorithm. Triangles are hit from either side. Rays which
+    are parallel to a triangle, including those which lie in its plane, are
+    considered to miss it.
+
+    Args:
+        origins (np.ndarray): A `kx3` array of ray origins.
+        directions (np.ndarray): A `kx3` array of ray directions.
+        vertices_of_tris (np.ndarray): A `kx3x3` array of triangle vertices.
+
+    Returns:
+        tuple: `(t, coords)`, where `t` is the parameter along each ray, in
+        multiples of its direction, at which it hits the triangle, or
+        `np.inf` for rays which miss, and `coords` is a `kx3` array of the
+        barycentric coordinates of the hit.
+    """
+    a = vertices_of_tris[:, 0]
+    edge_1 = vertices_of_tris[:, 1] - a
+    edge_2 = vertices_of_tris[:, 2] - a
+    p = np.cross(directions, edge_2)
+    determinant = _dot(edge_1, p)
+    to_origin = origins - a
+    q = np.cross(to_origin, edge_1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse_determinant = 1.0 / determinant
+        u = _dot(to_origin, p) * inverse_determinant
+        v = _dot(directions, q) * inverse_determinant
+        t = _dot(edge_2, q) * inverse_determinant
+        # NaNs, from parallel rays, fail every comparison.
+        is_hit = np.logical_and.reduce([u >= 0, v >= 0, u + v <= 1, t >= 0])
+        coords = np.stack([1.0 - u - v, u, v], axis=1)
+    return np.where(is_hit, t, np.inf), coords
+
+
+def rays_intersect_faces(origins, directions, vertices_of_faces):
+    """
+    Intersect each ray with the corresponding triangle or quad. Quads are
+    treated as two triangles, `(0, 1, 2)` and `(0, 2, 3)`.
+
+    Args:
+        origins (np.ndarray): A `kx3` array of ray origins.
+        directions (np.ndarray): A `kx3` array of ray directions.
+        vertices_of_faces (np.ndarray): A `kx3x3` or `kx4x3` array of face
+            vertices.
+
+    Returns:
+        tuple: `(t, coords)`, where `t` is the parameter along each ray, in
+        multiples of its direction, at which it hits the face, or `np.inf`
+        for rays which miss, and `coords` contains the weight of each of the
+        face's vertices at the hit, as `kx3` or `kx4`.
+    """
+    t, coords = rays_intersect_triangles(origins, directions, vertices_of_faces[:, :3])
+    if vertices_of_faces.shape[1] == 4:
+        coords = np.pad(coords, ((0, 0), (0, 1)))
+        second_t, second_coords = rays_intersect_triangles(
+            origins, directions, vertices_of_faces[:, [0, 2, 3]]
+        )
+        use_second = second_t < t
+        t[use_second] = second_t[use_second]
+        coords[use_second] = 0.0
+        coords[np.ix_(use_second, [0, 2, 3])] = second_coords[use_second]
+    return t, coords
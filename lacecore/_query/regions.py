@@ -0,0 +1,51 @@
+import numpy as np
+from .box_intersection import triangles_intersect_box
+
+
+def vertices_in_box(mesh, box_lower, box_upper):
+    """
+    Construct a mask of the vertices which lie inside or on the boundary of
+    the given box, visiting only the candidates found in the mesh's spatial
+    index.
+    """
+    _, candidates = mesh._vertex_bvh().query_boxes(
+        box_lower[np.newaxis], box_upper[np.newaxis]
+    )
+    mask = np.zeros(mesh.num_v, dtype=bool)
+    mask[candidates] = True
+    return mask
+
+
+def vertices_within_radius(mesh, center, radius):
+    """
+    Construct a mask of the vertices whose distance to the given point is no
+    more than `radius`, visiting only the candidates found in the mesh's
+    spatial index.
+    """
+    _, candidates = mesh._vertex_bvh().query_boxes(
+        (center - radius)[np.newaxis], (center + radius)[np.newaxis]
+    )
+    offsets = mesh.v[candidates] - center
+    mask = np.zeros(mesh.num_v, dtype=bool)
+    mask[candidates[np.einsum("ij,ij->i", offsets, offsets) <= radius**2]] = True
+    return mask
+
+
+def faces_intersecting_box(mesh, box_lower, box_upper):
+    """
+    Construct a mask of the faces which intersect or touch the given box,
+    visiting only the candidates found in the mesh's spatial index. Quads
+    are tested as two triangles.
+    """
+    _, candidates = mesh._face_bvh().query_boxes(
+        box_lower[np.newaxis], box_upper[np.newaxis]
+    )
+    vertices_of_faces = mesh.v[mesh.f[candidates]]
+    intersects = triangles_intersect_box(vertices_of_faces[:, :3], box_lower, box_upper)
+    if mesh.is_quad:
+        intersects |= triangles_intersect_box(
+            vertices_of_faces[:, [0, 2, 3]], box_lower, box_upper
+        )
+    mask = np.zeros(mesh.num_f, dtype=bool)
+    mask[candidates[intersects]] = True
+    return mask
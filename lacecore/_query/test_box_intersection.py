@@ -0,0 +1,61 @@
+import numpy as np
+from .box_intersection import triangles_intersect_box
+
+
+def clip_polygon_to_box(polygon, box_lower, box_upper):
+    # Sutherland-Hodgman clipping, used as a reference implementation.
+    for dim in range(3):
+        for sign, bound in ((1.0, box_lower[dim]), (-1.0, box_upper[dim])):
+            clipped = []
+            for index, current in enumerate(polygon):
+                previous = polygon[index - 1]
+                current_inside = sign * (current[dim] - bound) >= 0
+                previous_inside = sign * (previous[dim] - bound) >= 0
+                if current_inside != previous_inside:
+                    t = (bound - previous[dim]) / (current[dim] - previous[dim])
+                    clipped.append(previous + t * (current - previous))
+                if current_inside:
+                    clipped.append(current)
+            polygon = clipped
+            if len(polygon) == 0:
+                return polygon
+    return polygon
+
+
+def test_triangles_intersect_box_examples():
+    box_lower = np.zeros(3)
+    box_upper = np.ones(3)
+    triangles = np.array(
+        [
+            # Inside.
+            [[0.2, 0.2, 0.2], [0.8, 0.2, 0.2], [0.2, 0.8, 0.2]],
+            # Passes through the box without any vertex inside.
+            [[-5.0, 0.5, -5.0], [5.0, 0.5, -5.0], [0.0, 0.5, 10.0]],
+            # Touches a face of the box.
+            [[1.0, 0.2, 0.2], [2.0, 0.2, 0.2], [2.0, 0.8, 0.2]],
+            # Beside the box.
+            [[1.1, 0.2, 0.2], [2.0, 0.2, 0.2], [2.0, 0.8, 0.2]],
+            # Contains the box in its bounding box, but cuts past a corner.
+            [[2.6, -0.5, 0.5], [-0.5, 2.6, 0.5], [2.6, 2.6, 0.5]],
+            # Cuts across a corner.
+            [[2.4, -0.5, 0.5], [-0.5, 2.4, 0.5], [2.4, 2.4, 0.5]],
+        ]
+    )
+    np.testing.assert_array_equal(
+        triangles_intersect_box(triangles, box_lower, box_upper),
+        [True, True, True, False, False, True],
+    )
+
+
+def test_triangles_intersect_box_matches_clipping():
+    np.random.seed(0)
+    box_lower = np.array([0.3, 0.4, 0.35])
+    box_upper = np.array([0.6, 0.55, 0.7])
+    triangles = np.random.rand(2000, 3, 3)
+    expected = [
+        len(clip_polygon_to_box(list(triangle), box_lower, box_upper)) > 0
+        for triangle in triangles
+    ]
+    np.testing.assert_array_equal(
+        triangles_intersect_box(triangles, box_lower, box_upper), expected
+    )
@@ -0,0 +1,104 @@
+import numpy as np
+from .bvh import BoundingVolumeHierarchy
+
+
+def brute_force_query_boxes(lower, upper, box_lower, box_upper):
+    overlaps = np.all(
+        np.logical_and(
+            lower[np.newaxis] <= box_upper[:, np.newaxis],
+            upper[np.newaxis] >= box_lower[:, np.newaxis],
+        ),
+        axis=2,
+    )
+    return set(zip(*[indices.tolist() for indices in overlaps.nonzero()]))
+
+
+def test_query_boxes_of_points():
+    np.random.seed(0)
+    box_lower = np.random.rand(50, 3) * 0.8
+    box_upper = box_lower + 0.2
+    for num_points in (0, 1, 7, 8, 9, 100, 1000):
+        points = np.random.rand(num_points, 3)
+        bvh = BoundingVolumeHierarchy.from_points(points)
+        box_indices, point_indices = bvh.query_boxes(box_lower, box_upper)
+        assert set(
+            zip(box_indices.tolist(), point_indices.tolist())
+        ) == brute_force_query_boxes(points, points, box_lower, box_upper)
+
+
+def test_query_boxes_of_faces():
+    np.random.seed(0)
+    vertices_of_faces = np.random.rand(500, 3, 3)
+    vertices_of_faces[:, 1:] = vertices_of_faces[:, 0:1] + 0.1 * np.random.randn(
+        500, 2, 3
+    )
+    box_lower = np.random.rand(50, 3) * 0.9
+    box_upper = box_lower + 0.1
+    for leaf_size in (1, 3, 8):
+        bvh = BoundingVolumeHierarchy.from_faces(vertices_of_faces, leaf_size=leaf_size)
+        box_indices, face_indices = bvh.query_boxes(box_lower, box_upper)
+        assert set(
+            zip(box_indices.tolist(), face_indices.tolist())
+        ) == brute_force_query_boxes(
+            np.min(vertices_of_faces, axis=1),
+            np.max(vertices_of_faces, axis=1),
+            box_lower,
+            box_upper,
+        )
+
+
+def test_levels():
+    bvh = BoundingVolumeHierarchy.from_points(np.random.rand(20, 3), leaf_size=4)
+    assert [len(lower) for lower, _ in bvh.levels] == [1, 2, 4, 8]
+    root_lower, root_upper = bvh.levels[0]
+    np.testing.assert_array_equal(root_lower[0], np.min(bvh.primitive_lower, axis=0))
+    np.testing.assert_array_equal(root_upper[0], np.max(bvh.primitive_upper, axis=0))
+
+
+def ray_crosses_box(origin, direction, lower, upper):
+    entry, exit = -np.inf, np.inf
+    for dim in range(3):
+        if direction[dim] == 0:
+            if not lower[dim] <= origin[dim] <= upper[dim]:
+                return False
+        else:
+            t_1 = (lower[dim] - origin[dim]) / direction[dim]
+            t_2 = (upper[dim] - origin[dim]) / direction[dim]
+            entry = max(entry, min(t_1, t_2))
+            exit = min(exit, max(t_1, t_2))
+    return entry <= exit and exit >= 0
+
+
+def test_query_rays():
+    np.random.seed(0)
+    lower = np.random.rand(200, 3) * 0.9
+    upper = lower + 0.1
+    bvh = BoundingVolumeHierarchy(lower, upper, leaf_size=4)
+    origins = np.random.rand(50, 3) * 2.0 - 0.5
+    directions = np.random.randn(50, 3)
+    # Include some rays parallel to the axes.
+    directions[:10, 0] = 0.0
+    ray_indices, box_indices = bvh.query_rays(origins, directions)
+    assert set(zip(ray_indices.tolist(), box_indices.tolist())) == {
+        (ray_index, box_index)
+        for ray_index in range(len(origins))
+        for box_index in range(len(lower))
+        if ray_crosses_box(
+            origins[ray_index],
+            directions[ray_index],
+            lower[box_index],
+            upper[box_index],
+        )
+    }
+
+
+def test_query_rays_in_the_planes_of_boxes():
+    lower = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [3.0, 0.0, 0.0]])
+    upper = np.array([[2.0, 2.0, 0.0], [2.0, 2.0, 1.0], [4.0, 1.0, 1.0]])
+    bvh = BoundingVolumeHierarchy(lower, upper)
+    # Both rays lie in the plane `z = 0`, and point along the x-axis.
+    ray_indices, box_indices = bvh.query_rays(
+        np.array([[-1.0, 0.5, 0.0], [5.0, 0.5, 0.0]]),
+        np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]),
+    )
+    assert set(zip(ray_indices.tolist(), box_indices.tolist())) == {(0, 0), (0, 2)}
@@ -0,0 +1,101 @@
+import numpy as np
+from .closest_point import closest_points_on_faces, segment_parameters
+
+
+def test_segment_parameters():
+    np.testing.assert_array_equal(
+        segment_parameters(
+            np.array(
+                [[0.5, 1.0, 0.0], [-1.0, 0.0, 0.0], [3.0, 0.0, 0.0], [1.0, 1.0, 1.0]]
+            ),
+            np.array(
+                [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+            ),
+            np.array(
+                [[1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+            ),
+        ),
+        np.array([0.5, 0.0, 1.0, 0.0]),
+    )
+
+
+def test_closest_points_on_triangles():
+    triangle = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0]])
+    points = np.array(
+        [
+            # Above the interior.
+            [0.5, 0.5, 3.0],
+            # Nearest a vertex.
+            [-1.0, -1.0, 1.0],
+            [3.0, -1.0, 0.0],
+            # Nearest an edge.
+            [1.0, -1.0, 0.0],
+            [2.0, 2.0, -1.0],
+            [-1.0, 1.0, 0.0],
+        ]
+    )
+    closest, coords = closest_points_on_faces(points, np.tile(triangle, (6, 1, 1)))
+    np.testing.assert_array_almost_equal(
+        closest,
+        np.array(
+            [
+                [0.5, 0.5, 0.0],
+                [0.0, 0.0, 0.0],
+                [2.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [1.0, 1.0, 0.0],
+                [0.0, 1.0, 0.0],
+            ]
+        ),
+    )
+    np.testing.assert_array_almost_equal(
+        coords,
+        np.array(
+            [
+                [0.5, 0.25, 0.25],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.5, 0.5, 0.0],
+                [0.0, 0.5, 0.5],
+                [0.5, 0.0, 0.5],
+            ]
+        ),
+    )
+
+
+def test_closest_points_on_degenerate_triangles():
+    points = np.array([[1.0, 1.0, 0.0], [5.0, 5.0, 5.0]])
+    vertices_of_tris = np.array(
+        [
+            # Collinear.
+            [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [4.0, 0.0, 0.0]],
+            # All the same point.
+            [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]],
+        ]
+    )
+    closest, coords = closest_points_on_faces(points, vertices_of_tris)
+    np.testing.assert_array_almost_equal(
+        closest, np.array([[1.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+    )
+    assert np.all(np.isfinite(coords))
+    np.testing.assert_array_almost_equal(np.sum(coords, axis=1), np.ones(2))
+
+
+def test_closest_points_on_quads():
+    quad = np.array(
+        [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 2.0, 0.0], [0.0, 2.0, 0.0]]
+    )
+    points = np.array([[1.5, 0.5, 1.0], [0.5, 1.5, -1.0], [3.0, 3.0, 0.0]])
+    closest, coords = closest_points_on_faces(points, np.tile(quad, (3, 1, 1)))
+    np.testing.assert_array_almost_equal(
+        closest,
+        np.array([[1.5, 0.5, 0.0], [0.5, 1.5, 0.0], [2.0, 2.0, 0.0]]),
+    )
+    # The first point lies in the first triangle, and the second in the
+    # second triangle.
+    np.testing.assert_array_almost_equal(
+        coords,
+        np.array(
+            [[0.25, 0.5, 0.25, 0.0], [0.25, 0.0, 0.25, 0.5], [0.0, 0.0, 1.0, 0.0]]
+        ),
+    )
@@ -0,0 +1,208 @@
+from concurrent.futures import ThreadPoolExecutor
+from lacecore import Mesh
+import numpy as np
+import pytest
+from . import batch
+from .closest_point import closest_points_on_faces
+from .ray_intersection import rays_intersect_faces
+from .._selection.test_selection_mixin import cube_vertices
+
+
+def random_mesh(num_vertices=500, num_faces=300, seed=0):
+    # Small, scattered triangles.
+    np.random.seed(seed)
+    v = np.random.rand(num_vertices, 3)
+    f = np.random.randint(num_vertices, size=(num_faces, 3))
+    v[f[:, 1:]] = v[f[:, 0:1]] + 0.05 * np.random.randn(num_faces, 2, 3)
+    return Mesh(v=v, f=f)
+
+
+def brute_force_closest_points(mesh, points):
+    queries = np.repeat(np.arange(len(points)), mesh.num_f)
+    faces = np.tile(np.arange(mesh.num_f), len(points))
+    closest, _ = closest_points_on_faces(points[queries], mesh.v[mesh.f[faces]])
+    distances = np.linalg.norm(closest - points[queries], axis=1).reshape(
+        len(points), mesh.num_f
+    )
+    return np.min(distances, axis=1)
+
+
+def test_nearest_vertices():
+    mesh = random_mesh()
+    points = np.random.rand(1000, 3) * 1.4 - 0.2
+    # Include some exact matches.
+    points[:100] = mesh.v[:100]
+    indices, distances = mesh.nearest_vertices(points)
+
+    expected_distances = np.linalg.norm(
+        points[:, np.newaxis] - mesh.v[np.newaxis], axis=2
+    )
+    np.testing.assert_array_almost_equal(distances, np.min(expected_distances, axis=1))
+    np.testing.assert_array_equal(indices, np.argmin(expected_distances, axis=1))
+    np.testing.assert_array_equal(indices[:100], np.arange(100))
+
+
+def test_nearest_vertices_breaks_ties_by_index():
+    mesh = Mesh(
+        v=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]]),
+        f=np.array([[0, 1, 2]]),
+    )
+    indices, distances = mesh.nearest_vertices(np.zeros((1, 3)))
+    np.testing.assert_array_equal(indices, np.array([0]))
+    np.testing.assert_array_equal(distances, np.array([1.0]))
+
+
+def test_closest_points():
+    mesh = random_mesh()
+    points = np.random.rand(500, 3) * 1.4 - 0.2
+    closest, face_indices, coords, distances = mesh.closest_points(points)
+
+    np.testing.assert_array_almost_equal(
+        distances, brute_force_closest_points(mesh, points)
+    )
+    np.testing.assert_array_almost_equal(
+        distances, np.linalg.norm(closest - points, axis=1)
+    )
+    np.testing.assert_array_almost_equal(
+        np.einsum("ij,ijk->ik", coords, mesh.v[mesh.f[face_indices]]), closest
+    )
+
+
+def test_closest_points_on_quads():
+    mesh = Mesh(
+        v=cube_vertices,
+        f=np.array(
+            [
+                [0, 1, 2, 3],
+                [7, 6, 5, 4],
+                [4, 5, 1, 0],
+                [5, 6, 2, 1],
+                [6, 7, 3, 2],
+                [3, 7, 4, 0],
+            ]
+        ),
+    )
+    points = np.array([[1.5, -1.0, 1.0], [1.5, 2.0, 1.0], [4.0, 4.0, 4.0]])
+    closest, face_indices, coords, distances = mesh.closest_points(points)
+    np.testing.assert_array_almost_equal(
+        closest, np.array([[1.5, 0.0, 1.0], [1.5, 3.0, 1.0], [3.0, 3.0, 3.0]])
+    )
+    np.testing.assert_array_equal(face_indices[:2], np.array([0, 1]))
+    assert coords.shape == (3, 4)
+    np.testing.assert_array_almost_equal(distances, np.array([1.0, 1.0, np.sqrt(3)]))
+
+
+def test_intersect_rays():
+    mesh = random_mesh()
+    origins = np.random.rand(500, 3)
+    directions = np.random.randn(500, 3)
+    distances, face_indices, coords = mesh.intersect_rays(origins, 3.0 * directions)
+
+    unit_directions = directions / np.linalg.norm(directions, axis=1)[:, np.newaxis]
+    rays = np.repeat(np.arange(len(origins)), mesh.num_f)
+    faces = np.tile(np.arange(mesh.num_f), len(origins))
+    t, _ = rays_intersect_faces(
+        origins[rays], unit_directions[rays], mesh.v[mesh.f[faces]]
+    )
+    t = t.reshape(len(origins), mesh.num_f)
+    np.testing.assert_array_almost_equal(distances, np.min(t, axis=1))
+    np.testing.assert_array_equal(
+        face_indices, np.where(np.isfinite(distances), np.argmin(t, axis=1), -1)
+    )
+
+    is_hit = face_indices != -1
+    assert 0 < np.count_nonzero(is_hit) < len(origins)
+    np.testing.assert_array_almost_equal(
+        np.einsum("ij,ijk->ik", coords[is_hit], mesh.v[mesh.f[face_indices[is_hit]]]),
+        origins[is_hit] + distances[is_hit, np.newaxis] * unit_directions[is_hit],
+    )
+    assert np.all(np.isnan(coords[~is_hit]))
+
+
+def test_intersect_rays_with_quads():
+    mesh = Mesh(
+        v=cube_vertices,
+        f=np.array(
+            [
+                [0, 1, 2, 3],
+                [7, 6, 5, 4],
+                [4, 5, 1, 0],
+                [5, 6, 2, 1],
+                [6, 7, 3, 2],
+                [3, 7, 4, 0],
+            ]
+        ),
+    )
+    distances, face_indices, coords = mesh.intersect_rays(
+        np.array([[1.0, -1.0, 2.0], [1.0, 1.0, 1.0], [5.0, 5.0, 5.0]]),
+        np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]),
+    )
+    np.testing.assert_array_equal(distances, np.array([1.0, 2.0, np.inf]))
+    np.testing.assert_array_equal(face_indices, np.array([0, 3, -1]))
+    np.testing.assert_array_almost_equal(
+        coords[:2],
+        np.array(
+            [
+                [1.0 / 3.0, 0.0, 1.0 / 3.0, 1.0 / 3.0],
+                [1.0 / 3.0, 0.0, 1.0 / 3.0, 1.0 / 3.0],
+            ]
+        ),
+    )
+
+
+def test_queries_in_chunks(monkeypatch):
+    monkeypatch.setattr(batch, "CHUNK_SIZE", 64)
+    mesh = random_mesh()
+    points = np.random.rand(500, 3)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for method, args in (
+            (mesh.nearest_vertices, (points,)),
+            (mesh.closest_points, (points,)),
+            (mesh.intersect_rays, (points, np.random.randn(500, 3))),
+        ):
+            for expected, actual in zip(
+                method(*args), method(*args, executor=executor)
+            ):
+                np.testing.assert_array_equal(actual, expected)
+
+
+def test_queries_with_no_points():
+    mesh = random_mesh()
+    indices, distances = mesh.nearest_vertices(np.zeros((0, 3)))
+    assert indices.shape == (0,)
+    assert distances.shape == (0,)
+    closest, face_indices, coords, distances = mesh.closest_points(np.zeros((0, 3)))
+    assert closest.shape == (0, 3)
+    assert face_indices.shape == (0,)
+    assert coords.shape == (0, 3)
+    assert distances.shape == (0,)
+    distances, face_indices, coords = mesh.intersect_rays(
+        np.zeros((0, 3)), np.zeros((0, 3))
+    )
+    assert distances.shape == (0,)
+    assert face_indices.shape == (0,)
+    assert coords.shape == (0, 3)
+
+
+def test_queries_validation():
+    mesh = random_mesh()
+    with pytest.raises(ValueError, match=r"points must be an array with shape"):
+        mesh.nearest_vertices(np.zeros(3))
+    with pytest.raises(ValueError, match=r"points must be an array with shape"):
+        mesh.closest_points(np.zeros(3))
+
+    with pytest.raises(ValueError, match=r"directions must be an array with shape"):
+        mesh.intersect_rays(np.zeros((2, 3)), np.ones((3, 3)))
+    with pytest.raises(ValueError, match="Expected directions to be nonzero"):
+        mesh.intersect_rays(np.zeros((2, 3)), np.array([[1.0, 0.0, 0.0], np.zeros(3)]))
+
+    empty_mesh = Mesh(v=np.zeros((0, 3)), f=np.zeros((0, 3), dtype=np.int64))
+    with pytest.raises(ValueError, match="Expected mesh to have at least one vertex"):
+        empty_mesh.nearest_vertices(np.zeros((1, 3)))
+    with pytest.raises(ValueError, match="Expected mesh to have at least one face"):
+        empty_mesh.closest_points(np.zeros((1, 3)))
+    distances, face_indices, _ = empty_mesh.intersect_rays(
+        np.zeros((1, 3)), np.ones((1, 3))
+    )
+    np.testing.assert_array_equal(distances, np.array([np.inf]))
+    np.testing.assert_array_equal(face_indices, np.array([-1]))
@@ -0,0 +1,52 @@
+import numpy as np
+from .ray_intersection import rays_intersect_faces
+
+
+def test_rays_intersect_triangles():
+    triangle = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0]])
+    origins = np.array(
+        [
+            # Hits from above.
+            [0.5, 0.5, 3.0],
+            # Hits from below.
+            [0.5, 0.5, -1.0],
+            # Misses beside the triangle.
+            [2.0, 2.0, 3.0],
+            # Points away from the triangle.
+            [0.5, 0.5, 3.0],
+            # Lies in the triangle's plane.
+            [-1.0, 0.5, 0.0],
+            # Hits a vertex.
+            [0.0, 0.0, 1.0],
+        ]
+    )
+    directions = np.array(
+        [
+            [0.0, 0.0, -1.0],
+            [0.0, 0.0, 2.0],
+            [0.0, 0.0, -1.0],
+            [0.0, 0.0, 1.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 0.0, -1.0],
+        ]
+    )
+    t, coords = rays_intersect_faces(origins, directions, np.tile(triangle, (6, 1, 1)))
+    np.testing.assert_array_equal(t, np.array([3.0, 0.5, np.inf, np.inf, np.inf, 1.0]))
+    np.testing.assert_array_almost_equal(coords[0], np.array([0.5, 0.25, 0.25]))
+    np.testing.assert_array_almost_equal(coords[1], np.array([0.5, 0.25, 0.25]))
+    np.testing.assert_array_almost_equal(coords[5], np.array([1.0, 0.0, 0.0]))
+
+
+def test_rays_intersect_quads():
+    quad = np.array(
+        [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 2.0, 0.0], [0.0, 2.0, 0.0]]
+    )
+    origins = np.array([[1.5, 0.5, 1.0], [0.5, 1.5, 1.0], [3.0, 3.0, 1.0]])
+    directions = np.tile(np.array([0.0, 0.0, -1.0]), (3, 1))
+    t, coords = rays_intersect_faces(origins, directions, np.tile(quad, (3, 1, 1)))
+    np.testing.assert_array_equal(t, np.array([1.0, 1.0, np.inf]))
+    # The first ray hits the first triangle, and the second hits the second
+    # triangle.
+    np.testing.assert_array_almost_equal(
+        coords[:2], np.array([[0.25, 0.5, 0.25, 0.0], [0.25, 0.0, 0.25, 0.5]])
+    )
@@ -0,0 +1,191 @@
+import numpy as np
+
+# Bound the size of the temporary arrays to about this many entries.
+_CHUNK_ENTRIES = 2**24
+
+
+def _chunks(num_elements, entries_per_element):
+    chunk_size = max(1, _CHUNK_ENTRIES // max(1, entries_per_element))
+    for start in range(0, num_elements, chunk_size):
+        yield slice(start, start + chunk_size)
+
+
+def _evaluate_vertex_masks(target, branches):
+    v = target.v
+    masks = np.ones((len(branches), len(v)), dtype=bool)
+
+    # Evaluate the axis bounds of all the branches with one comparison per
+    # axis and kind of bound.
+    for dim in range(3):
+        coords = v[:, dim]
+        for attr, compare_inclusive, compare_exclusive in (
+            ("_lower_bounds", np.greater_equal, np.greater),
+            ("_upper_bounds", np.less_equal, np.less),
+        ):
+            bounds = [getattr(branch, attr)[dim] for branch in branches]
+            for inclusive, compare in (
+                (True, compare_inclusive),
+                (False, compare_exclusive),
+            ):
+                rows = np.array(
+                    [
+                        index
+                        for index, bound in enumerate(bounds)
+                        if bound is not None and bound[1] == inclusive
+                    ],
+                    dtype=np.int64,
+                )
+                if len(rows):
+                    values = np.array([bounds[index][0] for index in rows])
+                    masks[rows] &= compare(coords, values[:, np.newaxis])
+
+    # Evaluate the planes of all the branches with one product over the
+    # vertices, then reduce the planes of each branch.
+    rows = [index for index, branch in enumerate(branches) if branch._plane_equations]
+    if len(rows):
+        plane_equations = np.concatenate(
+            [branches[index]._plane_equations for index in rows]
+        ).reshape(-1, 4)
+        is_strict = np.concatenate([branches[index]._plane_is_strict for index in rows])
+        num_planes = [len(branches[index]._plane_equations) for index in rows]
+        starts = np.concatenate([[0], np.cumsum(num_planes)[:-1]])
+        for chunk in _chunks(len(v), len(plane_equations)):
+            signed_distances = (
+                np.einsum("ij,kj->ik", v[chunk], plane_equations[:, :3])
+                + plane_equations[:, 3]
+            )
+            in_front = signed_distances >= 0
+            if np.any(is_strict):
+                in_front[:, is_strict] &= signed_distances[:, is_strict] != 0
+            masks[rows, chunk] &= np.logical_and.reduceat(in_front, starts, axis=1).T
+
+    for index, branch in enumerate(branches):
+        for value in branch._vertex_picks:
+            masks[index] &= branch._mask_like(value, len(v))
+        for region, args in branch._vertex_regions:
+            masks[index] &= region(target, *args)
+        for group_names in branch._vertex_face_group_names:
+            masks[index] &= branch._vertex_mask_of_face_groups(target, group_names)
+
+    return masks
+
+
+def _evaluate_face_masks(target, branches):
+    masks = np.ones((len(branches), target.num_f), dtype=bool)
+    for index, branch in enumerate(branches):
+        for value in branch._face_picks:
+            masks[index] &= branch._mask_like(value, target.num_f)
+        for group_names in branch._face_group_names:
+            masks[index] &= target.face_groups.union(*group_names)
+        for region, args in branch._face_regions:
+            masks[index] &= region(target, *args)
+    return masks
+
+
+def _reconcile_many(faces, face_masks, vertex_masks, is_referenced, prune):
+    # This is `reconcile_selection()` applied to each row, sharing the gather
+    # of the faces between the rows.
+    num_rows, num_vertices = vertex_masks.shape
+    reconciled_face_masks = np.array(face_masks)
+    is_referenced_by_kept_face = np.zeros((num_rows, num_vertices), dtype=bool)
+    for chunk in _chunks(len(faces), num_rows * faces.shape[1]):
+        these_faces = faces[chunk]
+        reconciled_face_masks[:, chunk] &= np.all(vertex_masks[:, these_faces], axis=2)
+        if prune:
+            rows, face_indices = reconciled_face_masks[:, chunk].nonzero()
+            is_referenced_by_kept_face[
+                rows[:, np.newaxis], these_faces[face_indices]
+            ] = True
+
+    if prune:
+        # A vertex is orphaned when it's referenced by a face, but not by a
+        # face which is being kept.
+        reconciled_vertex_masks = vertex_masks & (
+            is_referenced_by_kept_face | ~is_referenced
+        )
+    else:
+        reconciled_vertex_masks = vertex_masks
+
+    return reconciled_face_masks, reconciled_vertex_masks
+
+
+def generate_masks_for_selections(target, selections, prune_orphan_vertices=True):
+    """
+    Evaluate many selections of the same mesh at once. This produces the
+    same result as invoking `generate_masks()` on each selection, but
+    evaluates their criteria as `(num_selections, num_elements)` array
+    operations, and shares the gather of the faces and the reconciliation
+    between them.
+
+    Args:
+        target (lacecore.Mesh): The mesh on which to operate.
+        selections (list): Instances of `lacecore.Selection`, which should
+            have been created by invoking `target.select()`.
+        prune_orphan_vertices (bool): When `True`, remove vertices which
+            are referenced only by faces which are being removed.
+
+    Returns:
+        tuple: `(face_masks, vertex_masks)` with shapes
+        `(num_selections, num_faces)` and `(num_selections, num_vertices)`.
+    """
+    from .selection_object import Selection
+
+    if not all(
+        isinstance(selection, Selection) and selection._target is target
+        for selection in selections
+    ):
+        raise ValueError("Expected selections of this mesh")
+
+    if len(selections) == 0:
+        return (
+            np.zeros((0, target.num_f), dtype=bool),
+            np.zeros((0, target.num_v), dtype=bool),
+        )
+
+    faces = target.f
+    branches = []
+    owners = []
+    for index, selection in enumerate(selections):
+        these_branches = selection._union_with + [selection]
+        branches.extend(these_branches)
+        owners.extend([index] * len(these_branches))
+    owners = np.array(owners, dtype=np.int64)
+
+    face_masks = _evaluate_face_masks(target, branches)
+    vertex_masks = _evaluate_vertex_masks(target, branches)
+
+    is_referenced = np.zeros(target.num_v, dtype=bool)
+    if prune_orphan_vertices:
+        is_referenced[faces] = True
+
+    reconciled_face_masks, reconciled_vertex_masks = _reconcile_many(
+        faces, face_masks, vertex_masks, is_referenced, prune_orphan_vertices
+    )
+
+    num_branches = np.bincount(owners, minlength=len(selections))
+    starts = np.concatenate([[0], np.cumsum(num_branches)[:-1]]).astype(np.int64)
+    result_face_masks = reconciled_face_masks[starts]
+    result_vertex_masks = reconciled_vertex_masks[starts]
+
+    # Reconcile the unions of the selections with more than one branch. Like
+    # `Selection.generate_masks()`, combine the reconciled vertices of the
+    # branches with their original faces.
+    is_union = num_branches > 1
+    if np.any(is_union):
+        union_face_masks, union_vertex_masks = _reconcile_many(
+            faces,
+            np.logical_or.reduceat(face_masks, starts, axis=0)[is_union],
+            np.logical_or.reduceat(reconciled_vertex_masks, starts, axis=0)[is_union],
+            is_referenced,
+            prune_orphan_vertices,
+        )
+        result_face_masks[is_union] = union_face_masks
+        result_vertex_masks[is_union] = union_vertex_masks
+
+    # When any branch is unconstrained, the whole mesh is selected.
+    is_unconstrained = np.zeros(len(selections), dtype=bool)
+    is_unconstrained[owners[[branch._is_unconstrained for branch in branches]]] = True
+    result_face_masks[is_unconstrained] = True
+    result_vertex_masks[is_unconstrained] = True
+
+    return result_face_masks, result_vertex_masks
@@ -0,0 +1,208 @@
+import numpy as np
+from vg.compat import v2 as vg
+from .plane_slicing import (
+    ON_PLANE_TOLERANCE,
+    _WorkingVertices,
+    _signed_distances,
+    _slice_by_plane,
+)
+
+
+class Clipper:
+    """
+    Slice a mesh by a plane which moves along a fixed normal, such as a clip
+    plane being dragged in a viewer.
+
+    The faces are sorted by their extent along the normal, so each time the
+    plane moves, only the faces near it and those whose classification has
+    changed are reprocessed. Invoke `.sliced_by_plane()` with each new
+    position of the plane. The results are identical to
+    `lacecore.Mesh.sliced_by_plane()`.
+
+    Args:
+        target (lacecore.Mesh): The mesh on which to operate.
+        normal (np.ndarray): The unit normal of the plane.
+        only_for_selection (function): A function which receives a
+            `lacecore.Selection` and should invoke selection methods on it.
+            The selection is evaluated once, on the target, and only the
+            selected faces are sliced.
+    """
+
+    def __init__(self, target, normal, only_for_selection=None):
+        vg.shape.check(locals(), "normal", (3,))
+        if not target.is_tri:
+            raise ValueError("Expected a triangle mesh")
+
+        self.target = target
+        self.normal = np.array(normal, dtype=np.float64)
+        self.normal.setflags(write=False)
+
+        heights_of_faces = target.v.dot(self.normal)[target.f]
+        self._lower = np.min(heights_of_faces, axis=1, initial=np.inf)
+        self._upper = np.max(heights_of_faces, axis=1, initial=-np.inf)
+        if only_for_selection is not None:
+            selection = target.select()
+            only_for_selection(selection)
+            faces_to_slice, _ = selection.generate_masks()
+            # Faces which are not selected always lie above the plane.
+            self._lower[~faces_to_slice] = np.inf
+        self._order_by_lower = np.argsort(self._lower)
+        self._sorted_lower = self._lower[self._order_by_lower]
+        self._order_by_upper = np.argsort(self._upper)
+        self._sorted_upper = self._upper[self._order_by_upper]
+        self._scale = np.max(np.abs(target.v), initial=0.0)
+
+        self._offset = None
+        self._margin = None
+        self._is_kept = np.zeros(target.num_f, dtype=bool)
+        self._reference_counts = np.zeros(target.num_v, dtype=np.int64)
+        self._candidates = np.zeros(0, dtype=np.int64)
+        self._dots = np.zeros((target.num_v, 1))
+
+    def _classify(self, face_indices, offset, margin):
+        # Classify the faces which certainly lie above the plane, and those
+        # which may straddle it. The remainder certainly lie below it.
+        lower, upper = self._lower[face_indices], self._upper[face_indices]
+        is_kept = lower > offset - ON_PLANE_TOLERANCE + margin
+        is_culled = np.logical_and(
+            lower < offset - ON_PLANE_TOLERANCE - margin,
+            upper < offset + ON_PLANE_TOLERANCE - margin,
+        )
+        return is_kept, np.logical_not(np.logical_or(is_kept, is_culled))
+
+    def _faces_between(self, sorted_heights, order, low, high):
+        return order[
+            np.searchsorted(sorted_heights, low, side="left") : np.searchsorted(
+                sorted_heights, high, side="right"
+            )
+        ]
+
+    def _move_to(self, reference_point):
+        offset = reference_point.dot(self.normal)
+        # The heights along the normal, and therefore the offset of the plane,
+        # are computed differently than the signed distances used to classify
+        # the vertices. This bounds the difference due to rounding.
+        margin = (
+            48
+            * np.finfo(np.float64).eps
+            * (self._scale + np.max(np.abs(reference_point)))
+        )
+        if self._offset is None:
+            changed = np.arange(self.target.num_f)
+        else:
+            # The classification of a face can only change if one of the
+            # thresholds passes its lowest or highest height.
+            margin = max(margin, self._margin)
+            low, high = sorted([self._offset, offset])
+            changed = np.union1d(
+                self._faces_between(
+                    self._sorted_lower,
+                    self._order_by_lower,
+                    low - ON_PLANE_TOLERANCE - margin,
+                    high - ON_PLANE_TOLERANCE + margin,
+                ),
+                self._faces_between(
+                    self._sorted_upper,
+                    self._order_by_upper,
+                    low + ON_PLANE_TOLERANCE - margin,
+                    high + ON_PLANE_TOLERANCE + margin,
+                ),
+            )
+        is_kept, is_candidate = self._classify(changed, offset, margin)
+        # Count the kept faces which use each vertex.
+        was_kept = self._is_kept[changed]
+        self._reference_counts += np.bincount(
+            self.target.f[changed[is_kept & ~was_kept]].ravel(),
+            minlength=self.target.num_v,
+        ) - np.bincount(
+            self.target.f[changed[was_kept & ~is_kept]].ravel(),
+            minlength=self.target.num_v,
+        )
+        self._is_kept[changed] = is_kept
+        self._candidates = np.union1d(
+            np.setdiff1d(self._candidates, changed, assume_unique=True),
+            changed[is_candidate],
+        )
+        self._offset = offset
+        self._margin = margin
+
+    def sliced_by_plane(self, plane):
+        """
+        Slice the triangles, keeping the portion in front of the given
+        plane.
+
+        Return a new mesh, without mutating the target.
+
+        Args:
+            plane (polliwog.Plane): The plane of interest, whose normal must
+                be the clipper's normal.
+
+        Returns:
+            lacecore.Mesh: The sliced mesh.
+        """
+        from .._mesh import Mesh
+
+        if not np.array_equal(plane.normal, self.normal):
+            raise ValueError("Expected plane to have the clipper's normal")
+
+        self._move_to(plane.reference_point)
+
+        # Classify the faces which may straddle the plane exactly as
+        # `slice_triangles_by_planes()` would, and slice those which do.
+        vertices, faces = self.target.v, self.target.f
+        candidate_faces = faces[self._candidates]
+        vertex_indices = np.unique(candidate_faces)
+        self._dots[vertex_indices, 0] = _signed_distances(
+            vertices[vertex_indices], plane.reference_point, self.normal
+        )
+        dots = self._dots[candidate_faces, 0]
+        is_behind = np.any(dots < -ON_PLANE_TOLERANCE, axis=1)
+        is_in_front = np.any(dots > ON_PLANE_TOLERANCE, axis=1)
+        kept_candidates = self._candidates[~is_behind]
+        sliced_indices = self._candidates[np.logical_and(is_behind, is_in_front)]
+
+        working_vertices = _WorkingVertices(vertices, self._dots)
+        sliced_faces, face_mapping = _slice_by_plane(
+            working_vertices,
+            faces[sliced_indices],
+            0,
+            plane.reference_point,
+            self.normal,
+        )
+        sliced_indices = sliced_indices[face_mapping]
+
+        # Interleave the kept faces with the sliced ones, ordering them by
+        # the faces from which they were derived.
+        is_kept = self._is_kept.copy()
+        is_kept[kept_candidates] = True
+        (kept_indices,) = is_kept.nonzero()
+        order = np.argsort(sliced_indices, kind="stable")
+        sliced_faces, sliced_indices = sliced_faces[order], sliced_indices[order]
+        insertion_points = np.searchsorted(kept_indices, sliced_indices)
+        face_mapping = np.insert(kept_indices, insertion_points, sliced_indices)
+        new_faces = faces[face_mapping]
+        new_faces[insertion_points + np.arange(len(sliced_indices))] = sliced_faces
+
+        # Renumber the vertices, dropping any which have been orphaned.
+        is_referenced = np.zeros(
+            len(vertices) + len(working_vertices.created), dtype=bool
+        )
+        is_referenced[: len(vertices)] = self._reference_counts > 0
+        is_referenced[faces[kept_candidates]] = True
+        is_referenced[sliced_faces] = True
+        new_vertex_indices = np.cumsum(is_referenced) - 1
+        face_groups = (
+            None
+            if self.target.face_groups is None
+            else self.target.face_groups.reindexed(face_mapping)
+        )
+        return Mesh(
+            v=np.concatenate(
+                [
+                    vertices[is_referenced[: len(vertices)]],
+                    working_vertices.created[is_referenced[len(vertices) :]],
+                ]
+            ),
+            f=new_vertex_indices[new_faces].astype(faces.dtype, copy=False),
+            face_groups=face_groups,
+        )
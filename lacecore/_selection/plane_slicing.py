@@ -0,0 +1,226 @@
+import numpy as np
+from vg.compat import v2 as vg
+
+# Vertices this close to a plane are considered to lie on it, matching
+# `polliwog.plane.slice_triangles_by_plane()`.
+ON_PLANE_TOLERANCE = 1e-8
+
+
+def _signed_distances(vertices, reference_point, normal):
+    return (vertices - reference_point).dot(normal)
+
+
+class _WorkingVertices:
+    # The vertices of a mesh which is being sliced: the original vertices,
+    # followed by those created along the way, which are only ever appended.
+
+    def __init__(self, vertices, dots):
+        self.original = vertices
+        self.original_dots = dots
+        self.created = np.zeros((0, 3))
+
+    def positions(self, indices):
+        is_created = indices >= len(self.original)
+        result = self.original[np.where(is_created, 0, indices)]
+        result[is_created] = self.created[indices[is_created] - len(self.original)]
+        return result
+
+    def dots(self, indices, plane_index, reference_point, normal):
+        is_created = indices >= len(self.original)
+        result = self.original_dots[np.where(is_created, 0, indices), plane_index]
+        result[is_created] = _signed_distances(
+            self.created[indices[is_created] - len(self.original)],
+            reference_point,
+            normal,
+        )
+        return result
+
+    def append(self, vertices):
+        first_index = len(self.original) + len(self.created)
+        self.created = np.concatenate([self.created, vertices])
+        return np.arange(first_index, first_index + len(vertices))
+
+
+def _slice_by_plane(working_vertices, faces, plane_index, reference_point, normal):
+    # Slice the given faces, each of which is sliced by at least one plane,
+    # by one of the planes. This follows the conventions of
+    # `polliwog.plane.slice_triangles_by_plane()`, so the results match.
+    dots = working_vertices.dots(
+        faces.ravel(), plane_index, reference_point, normal
+    ).reshape(-1, 3)
+    is_vertex_behind = dots < -ON_PLANE_TOLERANCE
+    is_vertex_in_front = dots > ON_PLANE_TOLERANCE
+    is_inside = ~np.any(is_vertex_behind, axis=1)
+    is_sliced = np.logical_and(~is_inside, np.any(is_vertex_in_front, axis=1))
+    sliced_faces = faces[is_sliced]
+    is_vertex_behind = is_vertex_behind[is_sliced]
+    is_vertex_in_front = is_vertex_in_front[is_sliced]
+
+    # Intersect the edge from each vertex to the next with the plane.
+    origins = working_vertices.positions(sliced_faces.ravel()).reshape(-1, 3, 3)
+    directions = np.roll(origins, -1, axis=1) - origins
+    numerators = (reference_point - origins).dot(normal)
+    denominators = directions.dot(normal)
+    denominators[denominators == 0.0] = 1e-12
+    intersections = (
+        np.einsum("ij,ijk->ijk", numerators / denominators, directions) + origins
+    )
+
+    rows = np.arange(len(sliced_faces))[:, np.newaxis]
+
+    # When one vertex lies behind the plane, the remainder is a quad, which
+    # is split into two triangles.
+    becomes_quad = np.sum(is_vertex_in_front, axis=1) > np.sum(is_vertex_behind, axis=1)
+    quad_rows = rows[becomes_quad]
+    behind_column = np.argmax(is_vertex_behind[becomes_quad], axis=1)[:, np.newaxis]
+    new_quad_vertices = working_vertices.append(
+        intersections[quad_rows, (behind_column + np.array([2, 0])) % 3].reshape(-1, 3)
+    ).reshape(-1, 2)
+    quads = np.column_stack(
+        [
+            sliced_faces[quad_rows, (behind_column + np.array([1, 2])) % 3],
+            new_quad_vertices,
+        ]
+    )
+    tris_from_quads = np.empty((2 * len(quads), 3), dtype=faces.dtype)
+    tris_from_quads[0::2] = quads[:, [0, 1, 2]]
+    tris_from_quads[1::2] = quads[:, [0, 2, 3]]
+
+    # Otherwise the remainder is a triangle.
+    tri_rows = rows[~becomes_quad]
+    in_front_column = np.argmax(is_vertex_in_front[~becomes_quad], axis=1)[
+        :, np.newaxis
+    ]
+    new_tri_vertices = working_vertices.append(
+        intersections[tri_rows, (in_front_column + np.array([0, 2])) % 3].reshape(-1, 3)
+    ).reshape(-1, 2)
+    tris = np.column_stack(
+        [sliced_faces[tri_rows, in_front_column].ravel(), new_tri_vertices]
+    )
+
+    (sliced_indices,) = is_sliced.nonzero()
+    new_faces = np.concatenate([faces[is_inside], tris_from_quads, tris])
+    face_mapping = np.concatenate(
+        [
+            is_inside.nonzero()[0],
+            np.repeat(sliced_indices[becomes_quad], 2),
+            sliced_indices[~becomes_quad],
+        ]
+    )
+    return new_faces, face_mapping
+
+
+def slice_triangles_by_planes(
+    vertices, faces, reference_points, normals, faces_to_slice=None
+):
+    """
+    Slice the given triangles by each of the given planes, keeping the
+    portion in front of all of them.
+
+    This produces the same triangles as slicing by one plane at a time with
+    `polliwog.plane.slice_triangles_by_plane()`, but classifies all the
+    vertices against all the planes at once, so only the triangles which
+    straddle one of the planes pass through the sequential slicing.
+
+    Args:
+        vertices (np.ndarray): A `kx3` array of vertices.
+        faces (np.ndarray): A `kx3` array of vertex indices.
+        reference_points (np.ndarray): A `kx3` array of a point on each plane.
+        normals (np.ndarray): A `kx3` array of the normal of each plane.
+        faces_to_slice (np.ndarray): An optional boolean mask of the faces
+            which may be sliced. The others are kept as is.
+
+    Returns:
+        tuple: `(vertices, faces, face_mapping)`, where `face_mapping`
+        contains the index of the original face from which each new face was
+        derived. New faces are ordered by the face from which they were
+        derived.
+    """
+    vg.shape.check(locals(), "vertices", (-1, 3))
+    vg.shape.check(locals(), "faces", (-1, 3))
+    num_planes = vg.shape.check(locals(), "reference_points", (-1, 3))
+    vg.shape.check(locals(), "normals", (num_planes, 3))
+
+    # Pack whether each vertex lies behind or in front of each plane into
+    # the bits of integers, so the faces can be classified against all the
+    # planes at once with a few bitwise operations.
+    dots = np.empty((len(vertices), num_planes))
+    num_words = -(-num_planes // 64)
+    vertex_behind_bits = np.zeros((len(vertices), num_words), dtype=np.uint64)
+    vertex_in_front_bits = np.zeros((len(vertices), num_words), dtype=np.uint64)
+    for plane_index, (reference_point, normal) in enumerate(
+        zip(reference_points, normals)
+    ):
+        dots[:, plane_index] = _signed_distances(vertices, reference_point, normal)
+        word, bit = divmod(plane_index, 64)
+        vertex_behind_bits[:, word] |= (
+            dots[:, plane_index] < -ON_PLANE_TOLERANCE
+        ).astype(np.uint64) << np.uint64(bit)
+        vertex_in_front_bits[:, word] |= (
+            dots[:, plane_index] > ON_PLANE_TOLERANCE
+        ).astype(np.uint64) << np.uint64(bit)
+
+    behind_bits = (
+        vertex_behind_bits[faces[:, 0]]
+        | vertex_behind_bits[faces[:, 1]]
+        | vertex_behind_bits[faces[:, 2]]
+    )
+    if faces_to_slice is not None:
+        behind_bits[~faces_to_slice] = 0
+
+    # Faces which have no vertices behind any of the planes are kept as is,
+    # and faces which lie entirely behind the first plane which affects them
+    # are culled as is. Only the remainder are sliced.
+    is_kept = ~np.any(behind_bits, axis=1)
+    (affected_indices,) = np.logical_not(is_kept).nonzero()
+    affected_behind_bits = behind_bits[affected_indices]
+    first_word = np.argmax(affected_behind_bits != 0, axis=1)
+    rows = np.arange(len(affected_indices))
+    word = affected_behind_bits[rows, first_word]
+    # Isolate the lowest set bit, which is a power of two.
+    first_plane_bit = word & (~word + np.uint64(1))
+    first_plane = 64 * first_word + np.log2(first_plane_bit).astype(np.int64)
+    affected_faces = faces[affected_indices]
+    in_front_bits = (
+        vertex_in_front_bits[affected_faces[:, 0], first_word]
+        | vertex_in_front_bits[affected_faces[:, 1], first_word]
+        | vertex_in_front_bits[affected_faces[:, 2], first_word]
+    )
+    is_sliced = (in_front_bits & first_plane_bit) != 0
+    sliced_indices = affected_indices[is_sliced]
+    first_plane = first_plane[is_sliced]
+
+    working_vertices = _WorkingVertices(vertices, dots)
+    sliced_faces = faces[sliced_indices]
+    # Faces are unaffected by the planes before the first one which slices
+    # them.
+    start = np.min(first_plane, initial=num_planes)
+    for plane_index in range(start, num_planes):
+        sliced_faces, face_mapping = _slice_by_plane(
+            working_vertices,
+            sliced_faces,
+            plane_index,
+            reference_points[plane_index],
+            normals[plane_index],
+        )
+        sliced_indices = sliced_indices[face_mapping]
+
+    (kept_indices,) = is_kept.nonzero()
+    face_mapping = np.concatenate([kept_indices, sliced_indices])
+    order = np.argsort(face_mapping, kind="stable")
+    new_faces = np.concatenate([faces[kept_indices], sliced_faces])[order]
+
+    # Renumber the vertices, dropping any which have been orphaned.
+    is_referenced = np.zeros(len(vertices) + len(working_vertices.created), dtype=bool)
+    is_referenced[new_faces] = True
+    new_vertex_indices = np.cumsum(is_referenced) - 1
+    return (
+        np.concatenate(
+            [
+                vertices[is_referenced[: len(vertices)]],
+                working_vertices.created[is_referenced[len(vertices) :]],
+            ]
+        ),
+        new_vertex_indices[new_faces].astype(faces.dtype, copy=False),
+        face_mapping[order],
+    )
@@ -28,19 +28,57 @@ def reconcile_selection(faces, face_mask, vertex_mask, prune_orphan_vertices):
         raise ValueError("Expected face_mask and vertex_mask to be boolean arrays")
     check_indices(faces, num_vertices, "faces")
 
+    return reconcile_selection_unchecked(
+        faces=faces,
+        face_mask=face_mask,
+        vertex_mask=vertex_mask,
+        num_vertices=num_vertices,
+        prune_orphan_vertices=prune_orphan_vertices,
+    )
+
+
+def reconcile_selection_unchecked(
+    faces, face_mask, vertex_mask, num_vertices, prune_orphan_vertices
+):
+    """
+    Reconcile the given vertex and face masks, without validating the inputs.
+    This is intended for faces and masks which lacecore has constructed
+    itself.
+
+    Either mask may be `None`, which selects every element and lets the
+    corresponding work be skipped.
+
+    Returns:
+        tuple: The reconciled vertex and face masks.
+    """
     # Invalidate faces containing any vertex which is being removed.
-    reconciled_face_mask = np.zeros_like(face_mask, dtype=bool)
-    reconciled_face_mask[face_mask] = np.all(vertex_mask[faces[face_mask]], axis=1)
+    if vertex_mask is None:
+        reconciled_face_mask = (
+            np.ones(len(faces), dtype=bool) if face_mask is None else face_mask
+        )
+    elif face_mask is None:
+        reconciled_face_mask = np.all(vertex_mask[faces], axis=1)
+    else:
+        reconciled_face_mask = np.zeros_like(face_mask, dtype=bool)
+        reconciled_face_mask[face_mask] = np.all(vertex_mask[faces[face_mask]], axis=1)
+
+    if vertex_mask is None:
+        vertex_mask = np.ones(num_vertices, dtype=bool)
 
     # Optionally, invalidate vertices for faces which are being removed.
     if prune_orphan_vertices:
         # Orphaned verts are those belonging to faces which are being
-        # removed, and not faces which are being kept.
-        orphaned_vertices = np.setdiff1d(
-            faces[~reconciled_face_mask], faces[reconciled_face_mask]
+        # removed, and not faces which are being kept. Find them by scattering
+        # each set of faces into a vertex mask, which is linear in the number
+        # of faces, unlike a set difference, which requires sorting.
+        is_referenced_by_kept_face = np.zeros(num_vertices, dtype=bool)
+        is_referenced_by_kept_face[faces[reconciled_face_mask]] = True
+        is_referenced_by_removed_face = np.zeros(num_vertices, dtype=bool)
+        is_referenced_by_removed_face[faces[~reconciled_face_mask]] = True
+        is_orphaned = np.logical_and(
+            is_referenced_by_removed_face, ~is_referenced_by_kept_face
         )
-        reconciled_vertex_mask = np.copy(vertex_mask)
-        reconciled_vertex_mask[orphaned_vertices] = False
+        reconciled_vertex_mask = np.logical_and(vertex_mask, ~is_orphaned)
     else:
         reconciled_vertex_mask = vertex_mask
 
@@ -1,3 +1,4 @@
+import numpy as np
 from .selection_object import Selection
 
 
@@ -167,6 +168,57 @@ class SelectionMixin:
         """
         return self.select().vertices_behind_plane(plane=plane).end()
 
+    def keeping_vertices_in_box(self, box):
+        """
+        Select the vertices which lie inside or on the boundary of the given
+        box.
+
+        Return a new mesh, without mutating the callee.
+
+        Args:
+            box (polliwog.Box): The box of interest.
+
+        Returns:
+            lacecore.Mesh: A submesh containing the selection.
+
+        See also:
+            https://polliwog.readthedocs.io/en/latest/#polliwog.Box
+        """
+        return self.select().vertices_in_box(box=box).end()
+
+    def keeping_vertices_within_radius(self, center, radius):
+        """
+        Select the vertices whose distance from the given point is no more
+        than the given radius.
+
+        Return a new mesh, without mutating the callee.
+
+        Args:
+            center (np.arraylike): The point of interest.
+            radius (float): The radius, which should be non-negative.
+
+        Returns:
+            lacecore.Mesh: A submesh containing the selection.
+        """
+        return self.select().vertices_within_radius(center=center, radius=radius).end()
+
+    def keeping_faces_intersecting_box(self, box):
+        """
+        Select the faces which intersect or touch the given box.
+
+        Return a new mesh, without mutating the callee.
+
+        Args:
+            box (polliwog.Box): The box of interest.
+
+        Returns:
+            lacecore.Mesh: A submesh containing the selection.
+
+        See also:
+            https://polliwog.readthedocs.io/en/latest/#polliwog.Box
+        """
+        return self.select().faces_intersecting_box(box=box).end()
+
     def picking_vertices(self, indices_or_boolean_mask):
         """
         Select only the given vertices.
@@ -217,20 +269,90 @@ class SelectionMixin:
         """
         return self.select().pick_face_groups(*group_names).end()
 
+    def generate_masks_for_selections(self, selections, prune_orphan_vertices=True):
+        """
+        Apply many selections at once to generate their vertex and face masks.
+
+        This produces the same result as invoking `generate_masks()` on each
+        selection, but evaluates their criteria together as
+        `(num_selections, num_elements)` array operations, and shares the
+        gather of the faces and the reconciliation between them.
+
+        Args:
+            selections (list): Instances of `lacecore.Selection`, created by
+                invoking `.select()` on this mesh. They are not evaluated
+                until this method is invoked.
+            prune_orphan_vertices (bool): When `True`, remove vertices which
+                are referenced only by faces which are being removed.
+
+        Returns:
+            tuple: `(face_masks, vertex_masks)`, boolean arrays with shapes
+            `(num_selections, num_f)` and `(num_selections, num_v)`.
+
+        Example:
+            >>> face_masks, vertex_masks = mesh.generate_masks_for_selections(
+                [
+                    mesh.select().vertices_above(0, point)
+                    for point in points
+                ]
+            )
+        """
+        from .batch_selection import generate_masks_for_selections
+
+        return generate_masks_for_selections(
+            target=self,
+            selections=selections,
+            prune_orphan_vertices=prune_orphan_vertices,
+        )
+
+    def submeshes_for_selections(self, selections, prune_orphan_vertices=True):
+        """
+        Apply many selections at once to construct a submesh for each one.
+
+        Return new meshes, without mutating the callee.
+
+        Args:
+            selections (list): Instances of `lacecore.Selection`, created by
+                invoking `.select()` on this mesh.
+            prune_orphan_vertices (bool): When `True`, remove vertices which
+                are referenced only by faces which are being removed.
+
+        Returns:
+            list: The submeshes, as instances of `lacecore.Mesh`.
+
+        See also:
+            `generate_masks_for_selections()`
+        """
+        from .._common.reindexing import create_submesh
+
+        face_masks, vertex_masks = self.generate_masks_for_selections(
+            selections, prune_orphan_vertices=prune_orphan_vertices
+        )
+        return [
+            create_submesh(mesh=self, vertex_mask=vertex_mask, face_mask=face_mask)
+            for face_mask, vertex_mask in zip(face_masks, vertex_masks)
+        ]
+
     def sliced_by_plane(self, *planes, only_for_selection=None):
         """
-        Slice the triangles, keeping the portion in front of the given plane.
+        Slice the triangles, keeping the portion in front of the given
+        planes.
 
-        - Faces partially in front of the plane are sliced.
-        - Faces fully in front of the plane are kept as is.
-        - Faces fully behind the plane are culled.
+        - Faces partially in front of a plane are sliced.
+        - Faces fully in front of every plane are kept as is.
+        - Faces fully behind a plane are culled.
+
+        All the planes are applied in a single pass, and the faces of the
+        result are ordered by the faces from which they were derived.
 
         Return a new mesh, without mutating the callee.
 
         Args:
-            plane (polliwog.Plane): The plane of interest.
+            planes (polliwog.Plane): The planes of interest.
             only_for_selection (function): A function which receives a
                 `lacecore.Selection` and should invoke selection methods on it.
+                The selection is evaluated once, on this mesh, and only the
+                selected faces are sliced.
 
         Returns:
             lacecore.Mesh: The sliced mesh.
@@ -239,35 +361,65 @@ class SelectionMixin:
             https://polliwog.readthedocs.io/en/latest/#polliwog.Plane
         """
         from polliwog import Plane
-        from polliwog.plane import slice_triangles_by_plane
+        from .plane_slicing import slice_triangles_by_planes
         from .._mesh import Mesh
 
         for plane in planes:
             assert isinstance(plane, Plane)
 
-        working = self
-        for plane in planes:
-            # Since slicing renumbers the faces, recompute `faces_to_slice`
-            # after each slice.
-            if only_for_selection is None:
-                faces_to_slice = None
-            else:
-                selection = working.select()
-                only_for_selection(selection)
-                faces_to_slice, _ = selection.generate_masks()
-
-            vertices, faces, face_mapping = slice_triangles_by_plane(
-                vertices=working.v,
-                faces=working.f,
-                plane_reference_point=plane.reference_point,
-                plane_normal=plane.normal,
-                faces_to_slice=faces_to_slice,
-                ret_face_mapping=True,
-            )
-            face_groups = (
-                None
-                if working.face_groups is None
-                else working.face_groups.reindexed(face_mapping)
-            )
-            working = Mesh(v=vertices, f=faces, face_groups=face_groups)
-        return working
+        if len(planes) == 0:
+            return self
+
+        if only_for_selection is None:
+            faces_to_slice = None
+        else:
+            selection = self.select()
+            only_for_selection(selection)
+            faces_to_slice, _ = selection.generate_masks()
+
+        vertices, faces, face_mapping = slice_triangles_by_planes(
+            vertices=self.v,
+            faces=self.f,
+            reference_points=np.array([plane.reference_point for plane in planes]),
+            normals=np.array([plane.normal for plane in planes]),
+            faces_to_slice=faces_to_slice,
+        )
+        face_groups = (
+            None
+            if self.face_groups is None
+            else self.face_groups.reindexed(face_mapping)
+        )
+        return Mesh(v=vertices, f=faces, face_groups=face_groups)
+
+    def clipper(self, normal, only_for_selection=None):
+        """
+        Create a clipper, which repeatedly slices the triangles by a plane
+        that moves along the given normal, such as a clip plane being
+        dragged in a viewer.
+
+        Each time the plane moves, only the faces whose classification has
+        changed and those which straddle the plane are reprocessed. The
+        results are identical to `.sliced_by_plane()`.
+
+        Does not mutate the callee.
+
+        Args:
+            normal (np.ndarray): The unit normal of the plane.
+            only_for_selection (function): A function which receives a
+                `lacecore.Selection` and should invoke selection methods on it.
+                The selection is evaluated once, on this mesh, and only the
+                selected faces are sliced.
+
+        Returns:
+            lacecore.Clipper: The clipper.
+
+        Example:
+            >>> clipper = mesh.clipper(vg.basis.y)
+            >>> for height in np.linspace(0.0, 1.0, 100):
+                    clipped = clipper.sliced_by_plane(
+                        Plane(height * vg.basis.y, vg.basis.y)
+                    )
+        """
+        from .clipper import Clipper
+
+        return Clipper(self, normal, only_for_selection=only_for_selection)
@@ -1,9 +1,10 @@
 import numpy as np
-from polliwog import Plane
+from polliwog import Box, Plane
 from vg.compat import v2 as vg
-from .reconcile_selection import reconcile_selection
+from .reconcile_selection import reconcile_selection_unchecked
 from .._common.reindexing import create_submesh
 from .._common.validation import check_indices
+from .._query import regions
 
 
 class Selection:
@@ -17,6 +18,13 @@ class Selection:
     Include `.union()` in the chain to combine more than one set of selection
     criteria into a single submesh.
 
+    The selection criteria are recorded as they are invoked, and evaluated
+    together when the masks are generated. Axis bounds are merged into a
+    single range test per axis, plane tests are combined into one matrix
+    product, and branches of a union whose outcome is already known are
+    skipped. This keeps the number of temporary arrays constant, regardless
+    of the length of the chain.
+
     Args:
         target (lacecore.Mesh): The mesh on which to operate.
         union_with (lacecore.Selection): The operation with which the new
@@ -31,14 +39,60 @@ class Selection:
     ):
         self._target = target
         self._union_with = union_with
-        self._vertex_mask = np.ones(target.num_v, dtype=bool)
-        self._face_mask = np.ones(target.num_f, dtype=bool)
+        # For each axis, `(value, inclusive)`, or `None` when unbounded.
+        self._lower_bounds = [None, None, None]
+        self._upper_bounds = [None, None, None]
+        # Plane equations, oriented so the selected vertices lie in front,
+        # and whether vertices on the plane are excluded.
+        self._plane_equations = []
+        self._plane_is_strict = []
+        self._vertex_picks = []
+        self._face_picks = []
+        self._face_group_names = []
+        self._vertex_face_group_names = []
+        # Region queries which use the mesh's spatial index, as tuples of a
+        # function from `lacecore._query.regions` and its arguments.
+        self._vertex_regions = []
+        self._face_regions = []
+
+    @property
+    def _is_unconstrained(self):
+        return not (
+            any(bound is not None for bound in self._lower_bounds)
+            or any(bound is not None for bound in self._upper_bounds)
+            or self._plane_equations
+            or self._vertex_picks
+            or self._face_picks
+            or self._face_group_names
+            or self._vertex_face_group_names
+            or self._vertex_regions
+            or self._face_regions
+        )
 
-    def _keep_faces(self, mask):
-        self._face_mask = np.logical_and(self._face_mask, mask)
+    def _keep_vertices_above(self, dim, point, inclusive):
+        if dim not in [0, 1, 2]:
+            raise ValueError("Expected dim to be 0, 1, or 2")
+        vg.shape.check(locals(), "point", (3,))
+        value = point[dim]
+        bound = self._lower_bounds[dim]
+        # At the same value, an exclusive bound is tighter.
+        if bound is None or value > bound[0] or (value == bound[0] and not inclusive):
+            self._lower_bounds[dim] = (value, inclusive)
+
+    def _keep_vertices_below(self, dim, point, inclusive):
+        if dim not in [0, 1, 2]:
+            raise ValueError("Expected dim to be 0, 1, or 2")
+        vg.shape.check(locals(), "point", (3,))
+        value = point[dim]
+        bound = self._upper_bounds[dim]
+        if bound is None or value < bound[0] or (value == bound[0] and not inclusive):
+            self._upper_bounds[dim] = (value, inclusive)
 
-    def _keep_vertices(self, mask):
-        self._vertex_mask = np.logical_and(self._vertex_mask, mask)
+    def _keep_vertices_in_front_of_plane(self, plane, strict, flip=False):
+        if not isinstance(plane, Plane):
+            raise ValueError("Expected an instance of polliwog.Plane")
+        self._plane_equations.append(-plane.equation if flip else plane.equation)
+        self._plane_is_strict.append(strict)
 
     def vertices_at_or_above(self, dim, point):
         """
@@ -53,10 +107,7 @@ class Selection:
         Returns:
             self
         """
-        if dim not in [0, 1, 2]:
-            raise ValueError("Expected dim to be 0, 1, or 2")
-        vg.shape.check(locals(), "point", (3,))
-        self._keep_vertices(self._target.v[:, dim] >= point[dim])
+        self._keep_vertices_above(dim, point, inclusive=True)
         return self
 
     def vertices_above(self, dim, point):
@@ -71,10 +122,7 @@ class Selection:
         Returns:
             self
         """
-        if dim not in [0, 1, 2]:
-            raise ValueError("Expected dim to be 0, 1, or 2")
-        vg.shape.check(locals(), "point", (3,))
-        self._keep_vertices(self._target.v[:, dim] > point[dim])
+        self._keep_vertices_above(dim, point, inclusive=False)
         return self
 
     def vertices_at_or_below(self, dim, point):
@@ -89,10 +137,7 @@ class Selection:
         Returns:
             self
         """
-        if dim not in [0, 1, 2]:
-            raise ValueError("Expected dim to be 0, 1, or 2")
-        vg.shape.check(locals(), "point", (3,))
-        self._keep_vertices(self._target.v[:, dim] <= point[dim])
+        self._keep_vertices_below(dim, point, inclusive=True)
         return self
 
     def vertices_below(self, dim, point):
@@ -107,10 +152,7 @@ class Selection:
         Returns:
             self
         """
-        if dim not in [0, 1, 2]:
-            raise ValueError("Expected dim to be 0, 1, or 2")
-        vg.shape.check(locals(), "point", (3,))
-        self._keep_vertices(self._target.v[:, dim] < point[dim])
+        self._keep_vertices_below(dim, point, inclusive=False)
         return self
 
     def vertices_on_or_in_front_of_plane(self, plane):
@@ -127,9 +169,7 @@ class Selection:
         See also:
             https://polliwog.readthedocs.io/en/latest/#polliwog.Plane
         """
-        if not isinstance(plane, Plane):
-            raise ValueError("Expected an instance of polliwog.Plane")
-        self._keep_vertices(plane.sign(self._target.v) != -1)
+        self._keep_vertices_in_front_of_plane(plane, strict=False)
         return self
 
     def vertices_in_front_of_plane(self, plane):
@@ -145,9 +185,7 @@ class Selection:
         See also:
             https://polliwog.readthedocs.io/en/latest/#polliwog.Plane
         """
-        if not isinstance(plane, Plane):
-            raise ValueError("Expected an instance of polliwog.Plane")
-        self._keep_vertices(plane.sign(self._target.v) == 1)
+        self._keep_vertices_in_front_of_plane(plane, strict=True)
         return self
 
     def vertices_on_or_behind_plane(self, plane):
@@ -163,9 +201,7 @@ class Selection:
         See also:
             https://polliwog.readthedocs.io/en/latest/#polliwog.Plane
         """
-        if not isinstance(plane, Plane):
-            raise ValueError("Expected an instance of polliwog.Plane")
-        self._keep_vertices(plane.sign(self._target.v) != 1)
+        self._keep_vertices_in_front_of_plane(plane, strict=False, flip=True)
         return self
 
     def vertices_behind_plane(self, plane):
@@ -181,23 +217,115 @@ class Selection:
         See also:
             https://polliwog.readthedocs.io/en/latest/#polliwog.Plane
         """
-        if not isinstance(plane, Plane):
-            raise ValueError("Expected an instance of polliwog.Plane")
-        self._keep_vertices(plane.sign(self._target.v) == -1)
+        self._keep_vertices_in_front_of_plane(plane, strict=True, flip=True)
         return self
 
     @staticmethod
-    def _mask_like(value, num_elements):
+    def _box_bounds(box):
+        if not isinstance(box, Box):
+            raise ValueError("Expected an instance of polliwog.Box")
+        lower, upper = np.asarray(box.ranges, dtype=np.float64).T
+        return lower, upper
+
+    def vertices_in_box(self, box):
+        """
+        Select the vertices which lie inside or on the boundary of the given
+        box.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh, so that subsequent queries only visit the
+        vertices near the box.
+
+        Args:
+            box (polliwog.Box): The box of interest.
+
+        Returns:
+            self
+
+        See also:
+            https://polliwog.readthedocs.io/en/latest/#polliwog.Box
+        """
+        self._vertex_regions.append((regions.vertices_in_box, self._box_bounds(box)))
+        return self
+
+    def vertices_within_radius(self, center, radius):
+        """
+        Select the vertices whose distance from the given point is no more
+        than the given radius.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh, so that subsequent queries only visit the
+        vertices near the point.
+
+        Args:
+            center (np.arraylike): The point of interest.
+            radius (float): The radius, which should be non-negative.
+
+        Returns:
+            self
+        """
+        vg.shape.check(locals(), "center", (3,))
+        if radius < 0:
+            raise ValueError("Expected radius to be non-negative")
+        self._vertex_regions.append(
+            (
+                regions.vertices_within_radius,
+                (np.asarray(center, dtype=np.float64), float(radius)),
+            )
+        )
+        return self
+
+    def faces_intersecting_box(self, box):
+        """
+        Select the faces which intersect or touch the given box. Each quad is
+        tested as two triangles.
+
+        This uses a spatial index which is built the first time it's needed
+        and cached on the mesh, so that subsequent queries only visit the
+        faces near the box.
+
+        Args:
+            box (polliwog.Box): The box of interest.
+
+        Returns:
+            self
+
+        See also:
+            https://polliwog.readthedocs.io/en/latest/#polliwog.Box
+        """
+        self._face_regions.append(
+            (regions.faces_intersecting_box, self._box_bounds(box))
+        )
+        return self
+
+    @staticmethod
+    def _check_mask_like(value, num_elements):
+        # Validate eagerly, but defer constructing the mask until the selection
+        # is evaluated.
         value = np.asarray(value)
         if value.dtype == bool:
             vg.shape.check(locals(), "value", (num_elements,))
-            return value
         else:
             check_indices(value, num_elements, "mask")
+        return value
+
+    @staticmethod
+    def _mask_like(value, num_elements):
+        if value.dtype == bool:
+            return value
+        else:
             mask = np.zeros(num_elements, dtype=bool)
             mask[value] = True
             return mask
 
+    @staticmethod
+    def _vertex_mask_of_face_groups(target, group_names):
+        # Scatter the vertices of only the requested groups, rather than
+        # computing the vertex masks of every group.
+        mask = np.zeros(target.num_v, dtype=bool)
+        mask[target.f[target.face_groups.union(*group_names)]] = True
+        return mask
+
     def pick_vertices(self, indices_or_boolean_mask):
         """
         Select only the given vertices.
@@ -209,8 +337,8 @@ class Selection:
         Returns:
             self
         """
-        self._keep_vertices(
-            self._mask_like(indices_or_boolean_mask, len(self._vertex_mask))
+        self._vertex_picks.append(
+            self._check_mask_like(indices_or_boolean_mask, self._target.num_v)
         )
         return self
 
@@ -225,7 +353,9 @@ class Selection:
         Returns:
             self
         """
-        self._keep_faces(self._mask_like(indices_or_boolean_mask, len(self._face_mask)))
+        self._face_picks.append(
+            self._check_mask_like(indices_or_boolean_mask, self._target.num_f)
+        )
         return self
 
     def pick_face_groups(self, *group_names):
@@ -240,7 +370,9 @@ class Selection:
         """
         if self._target.face_groups is None:
             raise ValueError("Mesh has no face groups")
-        self._keep_faces(self._target.face_groups.union(*group_names))
+        # Validate the group names eagerly.
+        self._target.face_groups._indices_of_groups(group_names)
+        self._face_group_names.append(group_names)
         return self
 
     def pick_vertices_of_face_groups(self, *group_names):
@@ -255,9 +387,8 @@ class Selection:
         """
         if self._target.face_groups is None:
             raise ValueError("Mesh has no face groups")
-        face_indices = self._target.face_groups.union(*group_names)
-        vertex_indices = self._target.f[face_indices].flatten()
-        self._keep_vertices(self._mask_like(vertex_indices, len(self._vertex_mask)))
+        self._target.face_groups._indices_of_groups(group_names)
+        self._vertex_face_group_names.append(group_names)
         return self
 
     def union(self):
@@ -285,13 +416,97 @@ class Selection:
         """
         return self.__class__(target=self._target, union_with=self._union_with + [self])
 
-    def _reconciled_selection(self, prune_orphan_vertices):
-        return reconcile_selection(
-            faces=self._target.f,
-            face_mask=self._face_mask,
-            vertex_mask=self._vertex_mask,
-            prune_orphan_vertices=prune_orphan_vertices,
-        )
+    @staticmethod
+    def _combine(mask, other):
+        # Combine `other` into the working mask `mask`, which is owned by the
+        # caller and can be modified in place.
+        if mask is None:
+            return np.array(other, dtype=bool)
+        else:
+            return np.logical_and(mask, other, out=mask)
+
+    def _evaluate_vertex_mask(self):
+        """
+        Evaluate the vertex criteria of this branch.
+
+        Returns:
+            np.ndarray: A writable vertex mask, or `None` when every vertex is
+            selected.
+        """
+        v = self._target.v
+        mask = None
+
+        for dim in range(3):
+            lower_bound = self._lower_bounds[dim]
+            upper_bound = self._upper_bounds[dim]
+            if lower_bound is not None and upper_bound is not None:
+                (lower, lower_inclusive), (upper, upper_inclusive) = (
+                    lower_bound,
+                    upper_bound,
+                )
+                if lower > upper or (
+                    lower == upper and not (lower_inclusive and upper_inclusive)
+                ):
+                    # The range is empty, so there is no need to look at the
+                    # vertices.
+                    return np.zeros(len(v), dtype=bool)
+            coords = v[:, dim]
+            for bound, compare_inclusive, compare_exclusive in (
+                (lower_bound, np.greater_equal, np.greater),
+                (upper_bound, np.less_equal, np.less),
+            ):
+                if bound is not None:
+                    value, inclusive = bound
+                    compare = compare_inclusive if inclusive else compare_exclusive
+                    if mask is None:
+                        mask = compare(coords, value)
+                    else:
+                        mask &= compare(coords, value)
+
+        if self._plane_equations:
+            plane_equations = np.array(self._plane_equations)
+            # Compute the signed distances to all the planes in one pass. This
+            # uses the same arithmetic as `polliwog.Plane.signed_distance()`,
+            # so vertices on the planes are classified consistently.
+            signed_distances = (
+                np.einsum("ij,kj->ik", v, plane_equations[:, :3])
+                + plane_equations[:, 3]
+            )
+            in_front = signed_distances >= 0
+            is_strict = np.array(self._plane_is_strict)
+            if np.any(is_strict):
+                in_front[:, is_strict] &= signed_distances[:, is_strict] != 0
+            mask = self._combine(mask, np.all(in_front, axis=1))
+
+        for value in self._vertex_picks:
+            mask = self._combine(mask, self._mask_like(value, len(v)))
+
+        for region, args in self._vertex_regions:
+            mask = self._combine(mask, region(self._target, *args))
+
+        for group_names in self._vertex_face_group_names:
+            mask = self._combine(
+                mask, self._vertex_mask_of_face_groups(self._target, group_names)
+            )
+
+        return mask
+
+    def _evaluate_face_mask(self):
+        """
+        Evaluate the face criteria of this branch.
+
+        Returns:
+            np.ndarray: A writable face mask, or `None` when every face is
+            selected.
+        """
+        mask = None
+        for value in self._face_picks:
+            mask = self._combine(mask, self._mask_like(value, self._target.num_f))
+        for group_names in self._face_group_names:
+            mask = self._combine(mask, self._target.face_groups.union(*group_names))
+        for region, args in self._face_regions:
+            mask = self._combine(mask, region(self._target, *args))
+        return mask
 
     def generate_masks(self, prune_orphan_vertices=True):
         """
@@ -306,36 +521,68 @@ class Selection:
                 indices of the original vertices, and `-1` for each removed face
                 and vertex.
         """
+        faces = self._target.f
+        num_vertices = self._target.num_v
+        branches = self._union_with + [self]
+
+        # When any branch is unconstrained, the whole mesh is selected.
+        if any(branch._is_unconstrained for branch in branches):
+            return (
+                np.ones(self._target.num_f, dtype=bool),
+                np.ones(num_vertices, dtype=bool),
+            )
+
+        if len(branches) == 1:
+            # Without a union, reconciling once is enough.
+            return reconcile_selection_unchecked(
+                faces=faces,
+                face_mask=self._evaluate_face_mask(),
+                vertex_mask=self._evaluate_vertex_mask(),
+                num_vertices=num_vertices,
+                prune_orphan_vertices=prune_orphan_vertices,
+            )
+
         # The approach here is designed to keep faces which have verts in two
         # halves of a union, and to avoid keeping the entire mesh when faces
         # are selected in one half of a union and verts are selected in the
         # other.
-
-        # First, form the union of reconciled vertices.
-        _, initial_vertex_mask_of_union = self._reconciled_selection(
-            prune_orphan_vertices=prune_orphan_vertices
-        )
-        for other in self._union_with:
-            _, this_vertex_mask = other._reconciled_selection(
-                prune_orphan_vertices=prune_orphan_vertices
-            )
-            initial_vertex_mask_of_union = np.logical_or(
-                initial_vertex_mask_of_union, this_vertex_mask
-            )
-
-        # Second, union the faces.
-        initial_face_mask_of_union = self._face_mask
-        for other in self._union_with:
-            initial_face_mask_of_union = np.logical_or(
-                initial_face_mask_of_union, other._face_mask
+        #
+        # First, form the union of reconciled vertices, and the union of the
+        # faces.
+        initial_vertex_mask_of_union = np.zeros(num_vertices, dtype=bool)
+        initial_face_mask_of_union = np.zeros(self._target.num_f, dtype=bool)
+        all_vertices_selected = False
+        for branch in branches:
+            face_mask = branch._evaluate_face_mask()
+            if face_mask is None:
+                initial_face_mask_of_union[:] = True
+            else:
+                initial_face_mask_of_union |= face_mask
+
+            # Skip the branches which can't add vertices to the union.
+            if all_vertices_selected:
+                continue
+            vertex_mask = branch._evaluate_vertex_mask()
+            if vertex_mask is not None and not np.any(vertex_mask):
+                continue
+
+            _, this_vertex_mask = reconcile_selection_unchecked(
+                faces=faces,
+                face_mask=face_mask,
+                vertex_mask=vertex_mask,
+                num_vertices=num_vertices,
+                prune_orphan_vertices=prune_orphan_vertices,
             )
+            initial_vertex_mask_of_union |= this_vertex_mask
+            all_vertices_selected = np.all(initial_vertex_mask_of_union)
 
         # Finally, reconcile the union of reconciled vertices with the union of
         # faces.
-        return reconcile_selection(
-            faces=self._target.f,
+        return reconcile_selection_unchecked(
+            faces=faces,
             face_mask=initial_face_mask_of_union,
             vertex_mask=initial_vertex_mask_of_union,
+            num_vertices=num_vertices,
             prune_orphan_vertices=prune_orphan_vertices,
         )
 
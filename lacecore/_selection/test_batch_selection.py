@@ -0,0 +1,109 @@
+from lacecore import Mesh
+import numpy as np
+from polliwog import Box
+import pytest
+from . import batch_selection
+from .test_selection_mixin import cube_at_origin
+from .test_selection_object import apply_criteria, random_criteria, random_mesh
+
+
+def assert_matches_generate_masks(mesh, selections, prune_orphan_vertices=True):
+    face_masks, vertex_masks = mesh.generate_masks_for_selections(
+        selections, prune_orphan_vertices=prune_orphan_vertices
+    )
+    assert face_masks.shape == (len(selections), mesh.num_f)
+    assert vertex_masks.shape == (len(selections), mesh.num_v)
+    for selection, face_mask, vertex_mask in zip(selections, face_masks, vertex_masks):
+        expected_face_mask, expected_vertex_mask = selection.generate_masks(
+            prune_orphan_vertices=prune_orphan_vertices
+        )
+        np.testing.assert_array_equal(face_mask, expected_face_mask)
+        np.testing.assert_array_equal(vertex_mask, expected_vertex_mask)
+
+
+def test_generate_masks_for_selections():
+    mesh = random_mesh()
+    for _ in range(20):
+        selections = [
+            apply_criteria(
+                mesh.select(),
+                [random_criteria(mesh) for _ in range(np.random.randint(1, 4))],
+            )
+            for _ in range(np.random.randint(1, 10))
+        ]
+        for prune_orphan_vertices in (True, False):
+            assert_matches_generate_masks(
+                mesh, selections, prune_orphan_vertices=prune_orphan_vertices
+            )
+
+
+def test_generate_masks_for_selections_in_chunks(monkeypatch):
+    monkeypatch.setattr(batch_selection, "_CHUNK_ENTRIES", 64)
+    mesh = random_mesh()
+    selections = [
+        apply_criteria(mesh.select(), [random_criteria(mesh)]) for _ in range(10)
+    ]
+    assert_matches_generate_masks(mesh, selections)
+
+
+def test_generate_masks_for_selections_with_face_groups():
+    selections = [
+        cube_at_origin.select().pick_face_groups("top", "left_side"),
+        cube_at_origin.select()
+        .pick_vertices_of_face_groups("sides")
+        .union()
+        .pick_face_groups("bottom"),
+        cube_at_origin.select().pick_vertices([0, 1]).union(),
+        cube_at_origin.select(),
+        cube_at_origin.select()
+        .vertices_at_or_above(0, np.repeat(1.0, 3))
+        .vertices_below(0, np.repeat(1.0, 3)),
+    ]
+    assert_matches_generate_masks(cube_at_origin, selections)
+    assert_matches_generate_masks(
+        cube_at_origin, selections, prune_orphan_vertices=False
+    )
+
+
+def test_generate_masks_for_no_selections():
+    face_masks, vertex_masks = cube_at_origin.generate_masks_for_selections([])
+    assert face_masks.shape == (0, 12)
+    assert vertex_masks.shape == (0, 8)
+
+
+def test_generate_masks_for_selections_error():
+    other_mesh = Mesh(v=cube_at_origin.v, f=cube_at_origin.f)
+    with pytest.raises(ValueError, match="Expected selections of this mesh"):
+        cube_at_origin.generate_masks_for_selections(
+            [cube_at_origin.select(), other_mesh.select()]
+        )
+    with pytest.raises(ValueError, match="Expected selections of this mesh"):
+        cube_at_origin.generate_masks_for_selections(["not-a-selection"])
+
+
+def test_generate_masks_for_selections_with_regions():
+    mesh = random_mesh()
+    selections = [
+        mesh.select().vertices_in_box(Box(origin=np.repeat(0.2, 3), size=np.ones(3))),
+        mesh.select()
+        .vertices_above(0, np.repeat(0.5, 3))
+        .vertices_within_radius(np.repeat(0.5, 3), 0.4),
+        mesh.select()
+        .faces_intersecting_box(Box(origin=np.repeat(0.4, 3), size=np.repeat(0.2, 3)))
+        .union()
+        .vertices_within_radius(np.zeros(3), 0.5),
+    ]
+    assert_matches_generate_masks(mesh, selections)
+
+
+def test_submeshes_for_selections():
+    selections = [
+        cube_at_origin.select().pick_face_groups("top"),
+        cube_at_origin.select().vertices_at_or_above(2, np.repeat(1.0, 3)),
+    ]
+    submeshes = cube_at_origin.submeshes_for_selections(selections)
+    assert len(submeshes) == 2
+    for submesh, selection in zip(submeshes, selections):
+        expected = selection.end()
+        np.testing.assert_array_equal(submesh.v, expected.v)
+        np.testing.assert_array_equal(submesh.f, expected.f)
@@ -0,0 +1,83 @@
+from lacecore import Mesh
+import numpy as np
+from polliwog import Plane
+import pytest
+from vg.compat import v2 as vg
+from .test_selection_mixin import cube_at_origin
+
+
+def random_mesh():
+    np.random.seed(0)
+    vertices = np.random.rand(300, 3)
+    faces = np.random.randint(300, size=(500, 3))
+    faces[:, 1:] = np.argsort(
+        np.linalg.norm(vertices[:, np.newaxis] - vertices, axis=2), axis=1
+    )[faces[:, 0], 1:3]
+    return Mesh(v=vertices, f=faces)
+
+
+def assert_meshes_identical(mesh, expected):
+    np.testing.assert_array_equal(mesh.v, expected.v)
+    np.testing.assert_array_equal(mesh.f, expected.f)
+    assert mesh.f.dtype == expected.f.dtype
+    if expected.face_groups is None:
+        assert mesh.face_groups is None
+    else:
+        assert list(mesh.face_groups.keys()) == list(expected.face_groups.keys())
+        for name in expected.face_groups.keys():
+            np.testing.assert_array_equal(
+                mesh.face_groups[name], expected.face_groups[name]
+            )
+
+
+def test_clipper_matches_sliced_by_plane():
+    mesh = random_mesh()
+    normal = vg.normalize(np.array([1.0, 2.0, -0.5]))
+    clipper = mesh.clipper(normal)
+    # The reference point need not lie along the normal.
+    in_plane = vg.perpendicular(normal, vg.basis.z)
+    heights = np.concatenate(
+        [
+            np.linspace(-1.0, 2.0, 25),
+            np.linspace(1.2, 0.3, 19),
+            # Pass the plane through some vertices, to exercise the boundary
+            # cases.
+            mesh.v[:5].dot(normal),
+            mesh.v[:5].dot(normal) + 5e-9,
+        ]
+    )
+    for height in heights:
+        plane = Plane(height * normal + 0.3 * in_plane, normal)
+        assert_meshes_identical(
+            clipper.sliced_by_plane(plane), mesh.sliced_by_plane(plane)
+        )
+
+
+def test_clipper_with_face_groups_and_selection():
+    normal = vg.normalize(np.array([1.0, 1.0, 1.0]))
+
+    def only_for_selection(selection):
+        selection.pick_face_groups("top", "sides")
+
+    clipper = cube_at_origin.clipper(normal, only_for_selection=only_for_selection)
+    for height in (5.0, 4.0, 4.8, 1.0, 0.0, -1.0, 2.5):
+        plane = Plane(height * normal, normal)
+        assert_meshes_identical(
+            clipper.sliced_by_plane(plane),
+            cube_at_origin.sliced_by_plane(
+                plane, only_for_selection=only_for_selection
+            ),
+        )
+
+
+def test_clipper_validation():
+    with pytest.raises(ValueError, match="Expected a triangle mesh"):
+        Mesh(v=cube_at_origin.v, f=np.array([[0, 1, 2, 3]], dtype=np.int64)).clipper(
+            vg.basis.y
+        )
+    with pytest.raises(ValueError, match=r"normal must be an array with shape \(3,\)"):
+        cube_at_origin.clipper(np.zeros(2))
+    with pytest.raises(ValueError, match="Expected plane to have the clipper's normal"):
+        cube_at_origin.clipper(vg.basis.y).sliced_by_plane(
+            Plane(np.zeros(3), vg.basis.x)
+        )
@@ -0,0 +1,99 @@
+import numpy as np
+from polliwog.plane import slice_triangles_by_plane
+import pytest
+from vg.compat import v2 as vg
+from .plane_slicing import slice_triangles_by_planes
+
+
+def slice_one_plane_at_a_time(
+    vertices, faces, reference_points, normals, faces_to_slice
+):
+    face_mapping = np.arange(len(faces))
+    for reference_point, normal in zip(reference_points, normals):
+        vertices, faces, step_face_mapping = slice_triangles_by_plane(
+            vertices=vertices,
+            faces=faces,
+            plane_reference_point=reference_point,
+            plane_normal=normal,
+            faces_to_slice=faces_to_slice,
+            ret_face_mapping=True,
+        )
+        face_mapping = face_mapping[step_face_mapping]
+        if faces_to_slice is not None:
+            faces_to_slice = faces_to_slice[step_face_mapping]
+    return vertices, faces, face_mapping
+
+
+def sorted_triangles(vertices, faces, face_mapping):
+    # Each row is the index of the original face, followed by the coordinates
+    # of the triangle's vertices.
+    rows = np.column_stack([face_mapping, vertices[faces].reshape(-1, 9)])
+    return rows[np.lexsort(rows.T[::-1])]
+
+
+@pytest.mark.parametrize("num_planes", [1, 2, 6])
+@pytest.mark.parametrize("with_faces_to_slice", [False, True])
+def test_slice_triangles_by_planes_matches_slicing_one_plane_at_a_time(
+    num_planes, with_faces_to_slice
+):
+    np.random.seed(num_planes)
+    vertices = np.random.rand(300, 3)
+    faces = np.random.randint(300, size=(500, 3))
+    faces[:, 1:] = np.argsort(
+        np.linalg.norm(vertices[:, np.newaxis] - vertices, axis=2), axis=1
+    )[faces[:, 0], 1:3]
+    reference_points = 0.5 + 0.3 * (np.random.rand(num_planes, 3) - 0.5)
+    normals = vg.normalize(np.random.randn(num_planes, 3))
+    # Pass one plane through a vertex, to exercise the boundary cases.
+    reference_points[0] = vertices[0]
+    faces_to_slice = np.random.rand(500) > 0.3 if with_faces_to_slice else None
+
+    new_vertices, new_faces, face_mapping = slice_triangles_by_planes(
+        vertices, faces, reference_points, normals, faces_to_slice=faces_to_slice
+    )
+    assert new_faces.dtype == faces.dtype
+    np.testing.assert_array_equal(face_mapping, np.sort(face_mapping))
+    assert np.all(np.bincount(new_faces.ravel(), minlength=len(new_vertices)) > 0)
+
+    expected = sorted_triangles(
+        *slice_one_plane_at_a_time(
+            vertices, faces, reference_points, normals, faces_to_slice
+        )
+    )
+    actual = sorted_triangles(new_vertices, new_faces, face_mapping)
+    assert actual.shape == expected.shape
+    np.testing.assert_array_almost_equal(actual, expected)
+
+
+def test_slice_triangles_by_more_than_64_planes():
+    np.random.seed(0)
+    vertices = np.random.rand(300, 3)
+    faces = np.random.randint(300, size=(500, 3))
+    # Only the last few planes affect the triangles.
+    normals = vg.normalize(np.random.randn(70, 3))
+    reference_points = -2.0 * normals
+    reference_points[66:] = 0.5
+
+    new_vertices, new_faces, face_mapping = slice_triangles_by_planes(
+        vertices, faces, reference_points, normals
+    )
+    assert len(new_faces) > 0
+    np.testing.assert_array_almost_equal(
+        sorted_triangles(new_vertices, new_faces, face_mapping),
+        sorted_triangles(
+            *slice_one_plane_at_a_time(vertices, faces, reference_points, normals, None)
+        ),
+    )
+
+
+def test_slice_triangles_by_planes_with_everything_culled():
+    vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    new_vertices, new_faces, face_mapping = slice_triangles_by_planes(
+        vertices,
+        np.array([[0, 1, 2]]),
+        np.array([[0.0, 0.0, 1.0]]),
+        np.array([[0.0, 0.0, 1.0]]),
+    )
+    assert new_vertices.shape == (0, 3)
+    assert new_faces.shape == (0, 3)
+    assert face_mapping.shape == (0,)
@@ -25,3 +25,30 @@ def test_reconcile_selection_validation():
             vertex_mask=np.zeros(example_mesh.num_v),
             prune_orphan_vertices=False,
         )
+
+
+def test_reconcile_selection_prunes_orphan_vertices():
+    example_mesh = shapes.cube(np.zeros(3), 3.0)
+    np.random.seed(0)
+    for _ in range(20):
+        face_mask = np.random.rand(example_mesh.num_f) > 0.5
+        vertex_mask = np.random.rand(example_mesh.num_v) > 0.2
+
+        reconciled_face_mask, reconciled_vertex_mask = reconcile_selection(
+            faces=example_mesh.f,
+            face_mask=face_mask,
+            vertex_mask=vertex_mask,
+            prune_orphan_vertices=True,
+        )
+
+        expected_face_mask = np.logical_and(
+            face_mask, np.all(vertex_mask[example_mesh.f], axis=1)
+        )
+        np.testing.assert_array_equal(reconciled_face_mask, expected_face_mask)
+        expected_vertex_mask = np.copy(vertex_mask)
+        expected_vertex_mask[
+            np.setdiff1d(
+                example_mesh.f[~expected_face_mask], example_mesh.f[expected_face_mask]
+            )
+        ] = False
+        np.testing.assert_array_equal(reconciled_vertex_mask, expected_vertex_mask)
@@ -1,6 +1,6 @@
 from lacecore import GroupMap, Mesh
 import numpy as np
-from polliwog import Plane
+from polliwog import Box, Plane
 from vg.compat import v2 as vg
 
 cube_vertices = np.array(
@@ -248,6 +248,36 @@ def test_vertices_behind_plane():
     )
 
 
+def test_vertices_in_box():
+    assert_subcube(
+        submesh=cube_at_origin.keeping_vertices_in_box(
+            Box(origin=np.array([-1.0, -1.0, 2.0]), size=np.array([5.0, 5.0, 2.0]))
+        ),
+        expected_vertex_indices=[2, 3, 6, 7],
+        expected_face_indices=[8, 9],
+    )
+
+
+def test_vertices_within_radius():
+    assert_subcube(
+        submesh=cube_at_origin.keeping_vertices_within_radius(
+            np.array([3.0, 3.0, 3.0]), 3.0
+        ),
+        expected_vertex_indices=[2, 5, 6, 7],
+        expected_face_indices=[2, 6],
+    )
+
+
+def test_faces_intersecting_box():
+    assert_subcube(
+        submesh=cube_at_origin.keeping_faces_intersecting_box(
+            Box(origin=np.array([1.0, -0.5, 1.0]), size=np.array([0.5, 1.0, 0.5]))
+        ),
+        expected_vertex_indices=[0, 1, 2, 3],
+        expected_face_indices=[0, 1],
+    )
+
+
 def test_pick_vertices_list():
     wanted_vs = [3, 7, 4]
     submesh = cube_at_origin.picking_vertices(wanted_vs)
@@ -349,3 +379,7 @@ def test_sliced_by_plane_selection():
     np.testing.assert_array_almost_equal(np.min(sliced.v, axis=0), np.array([0, 0, 0]))
     np.testing.assert_array_almost_equal(np.max(sliced.v, axis=0), extent)
     assert len(sliced.f) == 6
+
+
+def test_sliced_by_no_planes():
+    assert cube_at_origin.sliced_by_plane() is cube_at_origin
@@ -1,6 +1,9 @@
 from lacecore import Mesh
 import numpy as np
+from polliwog import Box, Plane
 import pytest
+from vg.compat import v2 as vg
+from .reconcile_selection import reconcile_selection
 from .test_selection_mixin import (
     assert_subcube,
     cube_at_origin,
@@ -116,6 +119,25 @@ def test_pick_vertices_of_face_groups():
     np.testing.assert_array_equal(submesh.v, cube_vertices[np.array([4, 7])])
 
 
+def test_pick_vertices_of_face_groups_of_reindexed_face_groups():
+    f_new_to_old = np.array([2, 3, 10, 11])
+    face_groups = create_group_map().reindexed(f_new_to_old)
+    mesh = Mesh(v=cube_vertices, f=cube_faces[f_new_to_old], face_groups=face_groups)
+    submesh = (
+        mesh.select()
+        .pick_vertices_of_face_groups("top", "left_side")
+        .end(prune_orphan_vertices=False)
+    )
+    groups = create_group_map()
+    expected_faces = cube_faces[f_new_to_old][
+        (groups["top"] | groups["left_side"])[f_new_to_old]
+    ]
+    np.testing.assert_array_equal(submesh.v, cube_vertices[np.unique(expected_faces)])
+    # Only the requested groups are computed, and the face groups stay lazy.
+    assert face_groups._element_mapping is not None
+    assert mesh._cache == {}
+
+
 def test_pick_face_groups_error():
     with pytest.raises(ValueError, match="Mesh has no face groups"):
         Mesh(v=cube_vertices, f=cube_faces).select().pick_face_groups("anything")
@@ -126,3 +148,316 @@ def test_pick_vertices_of_face_groups_error():
         Mesh(v=cube_vertices, f=cube_faces).select().pick_vertices_of_face_groups(
             "anything"
         )
+
+
+def random_mesh(num_vertices=200, num_faces=300, seed=0):
+    np.random.seed(seed)
+    return Mesh(
+        v=np.random.rand(num_vertices, 3),
+        f=np.random.randint(num_vertices, size=(num_faces, 3)),
+    )
+
+
+def eagerly_generate_masks(mesh, branches, prune_orphan_vertices=True):
+    # A straightforward reference implementation, which evaluates the
+    # criteria of each branch one at a time.
+    reconciled = []
+    for criteria in branches:
+        vertex_mask = np.ones(mesh.num_v, dtype=bool)
+        face_mask = np.ones(mesh.num_f, dtype=bool)
+        for kind, args in criteria:
+            if kind == "faces":
+                face_mask &= np.isin(np.arange(mesh.num_f), args)
+            elif kind == "vertices":
+                vertex_mask &= np.isin(np.arange(mesh.num_v), args)
+            elif kind == "vertices_on_or_in_front_of_plane":
+                vertex_mask &= args.sign(mesh.v) != -1
+            elif kind == "vertices_in_front_of_plane":
+                vertex_mask &= args.sign(mesh.v) == 1
+            elif kind == "vertices_on_or_behind_plane":
+                vertex_mask &= args.sign(mesh.v) != 1
+            elif kind == "vertices_behind_plane":
+                vertex_mask &= args.sign(mesh.v) == -1
+            else:
+                dim, point = args
+                compare = {
+                    "vertices_at_or_above": np.greater_equal,
+                    "vertices_above": np.greater,
+                    "vertices_at_or_below": np.less_equal,
+                    "vertices_below": np.less,
+                }[kind]
+                vertex_mask &= compare(mesh.v[:, dim], point[dim])
+        reconciled.append((face_mask, vertex_mask))
+
+    vertex_mask_of_union = np.zeros(mesh.num_v, dtype=bool)
+    face_mask_of_union = np.zeros(mesh.num_f, dtype=bool)
+    for face_mask, vertex_mask in reconciled:
+        _, this_vertex_mask = reconcile_selection(
+            mesh.f, face_mask, vertex_mask, prune_orphan_vertices
+        )
+        vertex_mask_of_union |= this_vertex_mask
+        face_mask_of_union |= face_mask
+    return reconcile_selection(
+        mesh.f, face_mask_of_union, vertex_mask_of_union, prune_orphan_vertices
+    )
+
+
+def apply_criteria(selection, branches):
+    for index, criteria in enumerate(branches):
+        if index > 0:
+            selection = selection.union()
+        for kind, args in criteria:
+            if kind == "faces":
+                selection.pick_faces(args)
+            elif kind == "vertices":
+                selection.pick_vertices(args)
+            elif kind.endswith("plane"):
+                getattr(selection, kind)(args)
+            else:
+                getattr(selection, kind)(*args)
+    return selection
+
+
+def random_criteria(mesh):
+    kinds = [
+        "vertices_at_or_above",
+        "vertices_above",
+        "vertices_at_or_below",
+        "vertices_below",
+        "vertices_on_or_in_front_of_plane",
+        "vertices_in_front_of_plane",
+        "vertices_on_or_behind_plane",
+        "vertices_behind_plane",
+        "faces",
+        "vertices",
+    ]
+    criteria = []
+    for _ in range(np.random.randint(1, 6)):
+        kind = kinds[np.random.randint(len(kinds))]
+        if kind == "faces":
+            args = np.random.choice(mesh.num_f, mesh.num_f // 2, replace=False)
+        elif kind == "vertices":
+            args = np.random.choice(mesh.num_v, 3 * mesh.num_v // 4, replace=False)
+        elif kind.endswith("plane"):
+            # Sometimes pass through vertices, to exercise the boundary cases.
+            reference_point = (
+                mesh.v[np.random.randint(mesh.num_v)]
+                if np.random.rand() > 0.5
+                else np.random.rand(3)
+            )
+            args = Plane(reference_point, vg.normalize(np.random.randn(3)))
+        else:
+            # Sometimes reuse vertex coordinates, to exercise the boundary
+            # cases.
+            point = (
+                mesh.v[np.random.randint(mesh.num_v)]
+                if np.random.rand() > 0.5
+                else np.random.rand(3)
+            )
+            args = (np.random.randint(3), point)
+        criteria.append((kind, args))
+    return criteria
+
+
+def test_selection_matches_eager_evaluation():
+    mesh = random_mesh()
+    for _ in range(200):
+        branches = [random_criteria(mesh) for _ in range(np.random.randint(1, 4))]
+        for prune_orphan_vertices in (True, False):
+            expected_face_mask, expected_vertex_mask = eagerly_generate_masks(
+                mesh, branches, prune_orphan_vertices=prune_orphan_vertices
+            )
+            face_mask, vertex_mask = apply_criteria(
+                mesh.select(), branches
+            ).generate_masks(prune_orphan_vertices=prune_orphan_vertices)
+            np.testing.assert_array_equal(face_mask, expected_face_mask)
+            np.testing.assert_array_equal(vertex_mask, expected_vertex_mask)
+
+
+def test_selection_merges_axis_bounds():
+    point = np.array([1.5, 1.5, 1.5])
+    selection = (
+        cube_at_origin.select()
+        .vertices_above(0, np.zeros(3))
+        .vertices_at_or_above(0, point)
+        .vertices_above(0, point)
+        .vertices_at_or_above(0, np.ones(3))
+        .vertices_at_or_below(1, point)
+        .vertices_below(1, point)
+        .vertices_below(1, np.repeat(2.0, 3))
+    )
+    assert selection._lower_bounds == [(1.5, False), None, None]
+    assert selection._upper_bounds == [None, (1.5, False), None]
+
+
+def test_selection_with_empty_range():
+    point = np.array([1.5, 1.5, 1.5])
+    for selection in (
+        cube_at_origin.select().vertices_above(0, point).vertices_below(0, point),
+        cube_at_origin.select().vertices_at_or_above(2, point).vertices_below(2, point),
+        cube_at_origin.select()
+        .vertices_at_or_above(1, np.repeat(2.0, 3))
+        .vertices_at_or_below(1, point),
+    ):
+        face_mask, vertex_mask = selection.generate_masks()
+        assert not np.any(face_mask)
+        assert not np.any(vertex_mask)
+
+    face_mask, vertex_mask = (
+        cube_at_origin.select()
+        .vertices_at_or_above(2, np.zeros(3))
+        .vertices_at_or_below(2, np.zeros(3))
+        .generate_masks()
+    )
+    np.testing.assert_array_equal(vertex_mask.nonzero()[0], [0, 1, 4, 5])
+    np.testing.assert_array_equal(face_mask.nonzero()[0], [4, 5])
+
+
+def test_union_with_unconstrained_branch():
+    face_mask, vertex_mask = (
+        cube_at_origin.select()
+        .pick_faces([0])
+        .union()
+        .union()
+        .pick_vertices([1])
+        .generate_masks()
+    )
+    assert np.all(face_mask)
+    assert np.all(vertex_mask)
+
+
+def test_union_skips_branches_which_cannot_add_vertices():
+    face_mask, vertex_mask = (
+        cube_at_origin.select()
+        .vertices_at_or_above(0, np.zeros(3))
+        .union()
+        .pick_vertices(np.zeros(8, dtype=bool))
+        .union()
+        .pick_faces([0])
+        .generate_masks()
+    )
+    assert np.all(face_mask)
+    assert np.all(vertex_mask)
+
+
+def test_generate_masks_does_not_alias_inputs():
+    face_mask = np.ones(12, dtype=bool)
+    vertex_mask = np.ones(8, dtype=bool)
+    generated_face_mask, generated_vertex_mask = (
+        cube_at_origin.select()
+        .pick_faces(face_mask)
+        .pick_vertices(vertex_mask)
+        .generate_masks(prune_orphan_vertices=False)
+    )
+    assert generated_face_mask is not face_mask
+    assert generated_vertex_mask is not vertex_mask
+
+
+def test_vertices_in_box():
+    mesh = random_mesh(num_vertices=2000)
+    for _ in range(10):
+        origin = np.random.rand(3) * 0.8
+        shape = np.random.rand(3) * 0.4
+        face_mask, vertex_mask = (
+            mesh.select()
+            .vertices_in_box(Box(origin=origin, size=shape))
+            .generate_masks(prune_orphan_vertices=False)
+        )
+        np.testing.assert_array_equal(
+            vertex_mask,
+            np.all(np.logical_and(mesh.v >= origin, mesh.v <= origin + shape), axis=1),
+        )
+
+
+def test_vertices_in_box_includes_boundary():
+    np.testing.assert_array_equal(
+        cube_at_origin.select()
+        .vertices_in_box(Box(origin=np.zeros(3), size=np.array([3.0, 3.0, 0.0])))
+        .generate_masks(prune_orphan_vertices=False)[1],
+        np.array([True, True, False, False, True, True, False, False]),
+    )
+
+
+def test_vertices_within_radius():
+    mesh = random_mesh(num_vertices=2000)
+    for _ in range(10):
+        center = np.random.rand(3)
+        radius = np.random.rand() * 0.3
+        face_mask, vertex_mask = (
+            mesh.select()
+            .vertices_within_radius(center, radius)
+            .generate_masks(prune_orphan_vertices=False)
+        )
+        np.testing.assert_array_equal(
+            vertex_mask, np.linalg.norm(mesh.v - center, axis=1) <= radius
+        )
+
+
+def test_faces_intersecting_box():
+    # One large triangle passes through the box without any vertex inside.
+    mesh = Mesh(
+        v=np.array(
+            [
+                [-5.0, 0.5, -5.0],
+                [5.0, 0.5, -5.0],
+                [0.0, 0.5, 10.0],
+                [2.0, 2.0, 2.0],
+                [3.0, 2.0, 2.0],
+                [3.0, 3.0, 2.0],
+            ]
+        ),
+        f=np.array([[0, 1, 2], [3, 4, 5]]),
+    )
+    face_mask, vertex_mask = (
+        mesh.select()
+        .faces_intersecting_box(Box(origin=np.zeros(3), size=np.ones(3)))
+        .generate_masks()
+    )
+    np.testing.assert_array_equal(face_mask, np.array([True, False]))
+    np.testing.assert_array_equal(
+        vertex_mask, np.array([True, True, True, False, False, False])
+    )
+
+
+def test_faces_intersecting_box_quads():
+    mesh = Mesh(
+        v=cube_vertices,
+        f=np.array(
+            [
+                [0, 1, 2, 3],
+                [7, 6, 5, 4],
+                [4, 5, 1, 0],
+                [5, 6, 2, 1],
+                [6, 7, 3, 2],
+                [3, 7, 4, 0],
+            ]
+        ),
+    )
+    # Touches one corner of the cube. In the front quad, that corner belongs
+    # only to the second of its two triangles.
+    face_mask, _ = (
+        mesh.select()
+        .faces_intersecting_box(Box(origin=np.array([2.5, -1.0, 2.5]), size=np.ones(3)))
+        .generate_masks()
+    )
+    np.testing.assert_array_equal(
+        face_mask, np.array([True, False, False, True, True, False])
+    )
+
+
+def test_region_validation():
+    selection = cube_at_origin.select()
+    with pytest.raises(ValueError, match="Expected an instance of polliwog.Box"):
+        selection.vertices_in_box(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="Expected an instance of polliwog.Box"):
+        selection.faces_intersecting_box(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="Expected radius to be non-negative"):
+        selection.vertices_within_radius(np.zeros(3), -1.0)
+    with pytest.raises(ValueError, match=r"center must be an array with shape \(3,\)"):
+        selection.vertices_within_radius(np.zeros(2), 1.0)
+
+
+def test_spatial_index_is_cached():
+    mesh = random_mesh()
+    assert mesh._vertex_bvh() is mesh._vertex_bvh()
+    assert mesh._face_bvh() is mesh._face_bvh()
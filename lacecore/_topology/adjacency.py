@@ -0,0 +1,84 @@
+import numpy as np
+
+
+class Adjacency:
+    """
+    A read-only relation from each of a set of elements, such as vertices or
+    edges, to the elements adjacent to it, stored in compressed sparse row
+    form. The elements adjacent to element `i` are
+    `indices[indptr[i]:indptr[i + 1]]`, in increasing order.
+
+    The arrays can be passed directly to `scipy.sparse.csr_matrix()`.
+
+    Args:
+        indptr (np.ndarray): The offset into `indices` of the adjacent
+            elements of each element, followed by `len(indices)`.
+        indices (np.ndarray): The adjacent elements of all the elements,
+            concatenated.
+    """
+
+    def __init__(self, indptr, indices):
+        indptr.setflags(write=False)
+        indices.setflags(write=False)
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_sorted_rows(cls, rows, indices, num_rows):
+        """
+        Construct an adjacency from pairs of elements which are sorted by
+        their first element.
+
+        Args:
+            rows (np.ndarray): The first element of each pair, in increasing
+                order.
+            indices (np.ndarray): The second element of each pair.
+            num_rows (int): The number of first elements.
+
+        Returns:
+            lacecore.Adjacency: The adjacency.
+        """
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+        return cls(indptr=indptr, indices=indices)
+
+    def __len__(self):
+        """
+        The number of elements.
+
+        Returns:
+            int: The number of elements.
+        """
+        return len(self.indptr) - 1
+
+    def __getitem__(self, index):
+        """
+        The elements adjacent to the given element.
+
+        Args:
+            index (int): The element of interest.
+
+        Returns:
+            np.ndarray: The adjacent elements.
+        """
+        return self.indices[self.indptr[index] : self.indptr[index + 1]]
+
+    @property
+    def counts(self):
+        """
+        The number of elements adjacent to each element.
+
+        Returns:
+            np.ndarray: The counts.
+        """
+        return np.diff(self.indptr)
+
+    def rows(self):
+        """
+        The element to which each entry of `indices` is adjacent, which
+        together with `indices` lists the pairs of adjacent elements.
+
+        Returns:
+            np.ndarray: The rows, in increasing order.
+        """
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.counts)
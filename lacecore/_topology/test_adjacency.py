@@ -0,0 +1,20 @@
+import numpy as np
+from .adjacency import Adjacency
+
+
+def test_adjacency():
+    adjacency = Adjacency.from_sorted_rows(
+        rows=np.array([0, 0, 2, 3, 3, 3]),
+        indices=np.array([1, 2, 0, 0, 1, 2]),
+        num_rows=5,
+    )
+    assert len(adjacency) == 5
+    np.testing.assert_array_equal(adjacency.indptr, np.array([0, 2, 2, 3, 6, 6]))
+    np.testing.assert_array_equal(adjacency[0], np.array([1, 2]))
+    np.testing.assert_array_equal(adjacency[1], np.zeros(0))
+    np.testing.assert_array_equal(adjacency[3], np.array([0, 1, 2]))
+    np.testing.assert_array_equal(adjacency[4], np.zeros(0))
+    np.testing.assert_array_equal(adjacency.counts, np.array([2, 0, 1, 3, 0]))
+    np.testing.assert_array_equal(adjacency.rows(), np.array([0, 0, 2, 3, 3, 3]))
+    assert not adjacency.indptr.flags.writeable
+    assert not adjacency.indices.flags.writeable
@@ -0,0 +1,302 @@
+from lacecore import Mesh, shapes
+import numpy as np
+from vg.compat import v2 as vg
+from .._common.reindexing import create_submesh
+
+
+def quad_cube():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    return Mesh(
+        v=cube.v,
+        f=np.array(
+            [
+                [0, 1, 2, 3],
+                [7, 6, 5, 4],
+                [4, 5, 1, 0],
+                [5, 6, 2, 1],
+                [6, 7, 3, 2],
+                [3, 7, 4, 0],
+            ]
+        ),
+    )
+
+
+def random_sheet(num_faces=200, num_vertices=60):
+    # Random faces, some of which share edges with several others.
+    np.random.seed(0)
+    f = np.array(
+        [np.random.choice(num_vertices, 3, replace=False) for _ in range(num_faces)]
+    )
+    # Leave the last vertex unreferenced.
+    return Mesh(v=np.random.randn(num_vertices + 1, 3), f=f)
+
+
+def test_edges_match_brute_force():
+    for mesh in (shapes.cube(np.zeros(3), 3.0), quad_cube(), random_sheet()):
+        sides = np.stack([mesh.f, np.roll(mesh.f, -1, axis=1)], axis=-1).reshape(-1, 2)
+        expected_edges, expected_face_edges = np.unique(
+            np.sort(sides, axis=1), axis=0, return_inverse=True
+        )
+        np.testing.assert_array_equal(mesh.edges(), expected_edges)
+        np.testing.assert_array_equal(
+            mesh.face_edges(), expected_face_edges.reshape(mesh.f.shape)
+        )
+
+        edge_faces = mesh.edge_faces()
+        assert len(edge_faces) == len(expected_edges)
+        for edge_index, edge in enumerate(expected_edges):
+            expected_faces = [
+                face_index
+                for face_index, face_edges in enumerate(mesh.face_edges())
+                for face_edge in face_edges
+                if face_edge == edge_index
+            ]
+            np.testing.assert_array_equal(edge_faces[edge_index], expected_faces)
+            for face_index in expected_faces:
+                assert set(edge) <= set(mesh.f[face_index])
+
+        vertex_neighbors = mesh.vertex_neighbors()
+        vertex_faces = mesh.vertex_faces()
+        assert len(vertex_neighbors) == len(vertex_faces) == mesh.num_v
+        for vertex_index in range(mesh.num_v):
+            np.testing.assert_array_equal(
+                vertex_neighbors[vertex_index],
+                np.sort(
+                    np.concatenate(
+                        [
+                            expected_edges[expected_edges[:, 0] == vertex_index, 1],
+                            expected_edges[expected_edges[:, 1] == vertex_index, 0],
+                        ]
+                    )
+                ),
+            )
+            np.testing.assert_array_equal(
+                vertex_faces[vertex_index],
+                np.nonzero(np.any(mesh.f == vertex_index, axis=1))[0],
+            )
+
+
+def test_topology_of_cube():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    assert len(cube.edges()) == 18
+    np.testing.assert_array_equal(cube.edge_faces().counts, np.repeat(2, 18))
+    np.testing.assert_array_equal(
+        cube.vertex_neighbors().counts, np.bincount(cube.edges().ravel())
+    )
+
+    assert len(quad_cube().edges()) == 12
+    np.testing.assert_array_equal(quad_cube().vertex_neighbors().counts, 3)
+    np.testing.assert_array_equal(quad_cube().vertex_faces().counts, 3)
+
+
+def test_topology_of_unreferenced_vertex():
+    mesh = random_sheet()
+    assert len(mesh.vertex_neighbors()[mesh.num_v - 1]) == 0
+    assert len(mesh.vertex_faces()[mesh.num_v - 1]) == 0
+
+
+def test_topology_is_cached_and_read_only():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    assert cube.edges() is cube.edges()
+    assert cube.vertex_neighbors() is cube.vertex_neighbors()
+    assert not cube.edges().flags.writeable
+    assert not cube.face_edges().flags.writeable
+
+
+def test_topology_of_transformed_mesh():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    rotated = cube.rotated(np.array([0.3, 0.2, 0.1])).translated(vg.basis.x)
+    assert rotated.edges() is cube.edges()
+    assert rotated.edge_faces() is cube.edge_faces()
+    assert rotated.vertex_neighbors() is cube.vertex_neighbors()
+    assert rotated.vertex_faces() is cube.vertex_faces()
+
+    # Flipping the faces changes the face edges.
+    flipped = cube.flipped(0)
+    np.testing.assert_array_equal(flipped.edges(), cube.edges())
+    np.testing.assert_array_equal(
+        flipped.face_edges(), np.fliplr(np.roll(cube.face_edges(), 1, axis=1))
+    )
+
+
+def grid(num_cells_per_side):
+    # A square sheet of quads, with one boundary loop.
+    num_vertices_per_side = num_cells_per_side + 1
+    x, y = np.meshgrid(
+        np.arange(num_vertices_per_side), np.arange(num_vertices_per_side)
+    )
+    corners = (
+        np.arange(num_cells_per_side)[:, np.newaxis] * num_vertices_per_side
+        + np.arange(num_cells_per_side)
+    ).ravel()
+    return Mesh(
+        v=np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)]).astype(np.float64),
+        f=np.column_stack(
+            [
+                corners,
+                corners + 1,
+                corners + num_vertices_per_side + 1,
+                corners + num_vertices_per_side,
+            ]
+        ),
+    )
+
+
+def test_closed_surface():
+    for mesh in (shapes.cube(np.zeros(3), 3.0), quad_cube()):
+        assert mesh.boundary_edges().shape == (0, 2)
+        assert mesh.boundary_loops() == []
+        assert mesh.non_manifold_edges().shape == (0, 2)
+        assert mesh.is_watertight
+        assert mesh.is_consistently_oriented
+
+
+def test_boundary_of_sheet():
+    sheet = grid(3)
+    assert not sheet.is_watertight
+    assert sheet.is_consistently_oriented
+    assert sheet.non_manifold_edges().shape == (0, 2)
+    assert len(sheet.boundary_edges()) == 12
+    assert not sheet.boundary_edges().flags.writeable
+
+    (loop,) = sheet.boundary_loops()
+    # The faces wind counter-clockwise, and so does the boundary.
+    np.testing.assert_array_equal(
+        loop, np.array([0, 1, 2, 3, 7, 11, 15, 14, 13, 12, 8, 4])
+    )
+
+
+def test_boundary_loops_of_cube_with_holes():
+    cube = quad_cube()
+    # Remove the top and bottom faces.
+    open_cube = Mesh(v=cube.v, f=cube.f[2:])
+    assert not open_cube.is_watertight
+    assert open_cube.is_consistently_oriented
+    loops = open_cube.boundary_loops()
+    assert len(loops) == 2
+    assert sorted(sorted(loop.tolist()) for loop in loops) == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+    ]
+    for loop in loops:
+        directed = set(zip(loop, np.roll(loop, -1)))
+        assert directed <= set(map(tuple, open_cube.boundary_edges()))
+
+
+def test_non_manifold_and_inconsistently_oriented():
+    cube = shapes.cube(np.zeros(3), 3.0)
+    # Add a fin which shares an edge of the cube.
+    with_fin = Mesh(
+        v=np.vstack([cube.v, np.array([[-1.0, -1.0, -1.0]])]),
+        f=np.vstack([cube.f, np.array([[0, 1, 8]])]),
+    )
+    assert not with_fin.is_watertight
+    np.testing.assert_array_equal(with_fin.non_manifold_edges(), np.array([[0, 1]]))
+    # The fin traverses the edge in the same direction as one of the faces,
+    # which is allowed along a non-manifold edge.
+    assert with_fin.is_consistently_oriented
+
+    flipped_one = Mesh(v=cube.v, f=np.vstack([np.fliplr(cube.f[:1]), cube.f[1:]]))
+    assert flipped_one.is_watertight
+    assert not flipped_one.is_consistently_oriented
+
+
+def test_boundary_of_transformed_mesh():
+    sheet = grid(3)
+    translated = sheet.translated(vg.basis.z)
+    assert translated.boundary_edges() is sheet.boundary_edges()
+    flipped = sheet.faces_flipped()
+    # The loop is reversed, starting from the same vertex.
+    (loop,) = flipped.boundary_loops()
+    np.testing.assert_array_equal(np.roll(loop[::-1], 1), sheet.boundary_loops()[0])
+
+
+def components_by_brute_force(mesh):
+    # Flood fill from each face, through the faces which share a vertex.
+    face_labels = np.full(mesh.num_f, -1)
+    num_components = 0
+    for seed in range(mesh.num_f):
+        if face_labels[seed] != -1:
+            continue
+        face_labels[seed] = num_components
+        pending = [seed]
+        while pending:
+            face_index = pending.pop()
+            for neighbor in np.nonzero(np.isin(mesh.f, mesh.f[face_index]).any(axis=1))[
+                0
+            ]:
+                if face_labels[neighbor] == -1:
+                    face_labels[neighbor] = num_components
+                    pending.append(neighbor)
+        num_components += 1
+    return face_labels
+
+
+def debris_mesh():
+    # A cube, most of a smaller cube, whose faces are out of order, a
+    # triangle floating on its own, and an unreferenced vertex.
+    small = shapes.cube(np.zeros(3), 1.0)
+    large = shapes.cube(np.array([5.0, 0.0, 0.0]), 2.0)
+    return Mesh(
+        v=np.vstack([large.v, np.zeros((1, 3)), small.v, np.eye(3)]),
+        f=np.vstack(
+            [small.f[:4] + 9, large.f, np.array([[17, 18, 19]]), small.f[4:10] + 9]
+        ),
+    )
+
+
+def test_connected_components():
+    mesh = debris_mesh()
+    face_labels, vertex_labels = mesh.connected_components()
+    np.testing.assert_array_equal(
+        face_labels, np.array([0] * 4 + [1] * 12 + [2] + [0] * 6)
+    )
+    np.testing.assert_array_equal(
+        vertex_labels, np.array([1] * 8 + [-1] + [0] * 8 + [2] * 3)
+    )
+    assert not face_labels.flags.writeable
+    assert not vertex_labels.flags.writeable
+
+    sheet = random_sheet(num_faces=40, num_vertices=100)
+    face_labels, vertex_labels = sheet.connected_components()
+    np.testing.assert_array_equal(face_labels, components_by_brute_force(sheet))
+    for face, label in zip(sheet.f, face_labels):
+        np.testing.assert_array_equal(vertex_labels[face], label)
+
+
+def test_split_components():
+    for mesh in (debris_mesh(), random_sheet(num_faces=40, num_vertices=100)):
+        face_labels, vertex_labels = mesh.connected_components()
+        components = mesh.split_components()
+        assert len(components) == len(np.unique(face_labels))
+        for label, component in enumerate(components):
+            expected = create_submesh(
+                mesh, vertex_mask=vertex_labels == label, face_mask=face_labels == label
+            )
+            np.testing.assert_array_equal(component.v, expected.v)
+            np.testing.assert_array_equal(component.f, expected.f)
+
+    largest = debris_mesh().keeping_largest_component()
+    np.testing.assert_array_equal(
+        largest.v, shapes.cube(np.array([5.0, 0.0, 0.0]), 2.0).v
+    )
+    assert largest.num_f == 12
+
+
+def test_components_of_mesh_without_faces():
+    mesh = Mesh(v=np.eye(3), f=np.zeros((0, 3), dtype=np.int64))
+    face_labels, vertex_labels = mesh.connected_components()
+    assert len(face_labels) == 0
+    np.testing.assert_array_equal(vertex_labels, np.repeat(-1, 3))
+    assert mesh.split_components() == []
+    largest = mesh.keeping_largest_component()
+    assert largest.num_v == 0 and largest.num_f == 0
+
+
+def test_components_of_transformed_mesh():
+    mesh = debris_mesh()
+    translated = mesh.translated(vg.basis.x)
+    assert translated.connected_components() is mesh.connected_components()
+    np.testing.assert_array_almost_equal(
+        translated.split_components()[1].v, mesh.split_components()[1].v + vg.basis.x
+    )
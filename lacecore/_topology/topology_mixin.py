@@ -0,0 +1,345 @@
+import numpy as np
+from .adjacency import Adjacency
+from .._common.cache import cached
+
+
+class TopologyMixin:
+    def _topology_source(self):
+        # A mesh produced by a transform which didn't flip the faces has the
+        # same faces as the mesh which was transformed, and with them the
+        # same topology.
+        if self._transform_source is not None and self.f is self._transform_source.f:
+            return self._transform_source
+        return self
+
+    @cached
+    def _edges_of_faces(self):
+        # Find the edges by sorting the sides of all the faces once, yielding
+        # the unique edges, the edge along each side of each face, and the
+        # faces along each edge.
+        source = self._topology_source()
+        if source is not self:
+            return source._edges_of_faces()
+
+        num_corners = self.f.shape[1]
+        ends = np.empty_like(self.f)
+        ends[:, :-1] = self.f[:, 1:]
+        ends[:, -1] = self.f[:, 0]
+        starts, ends = self.f.ravel(), ends.ravel()
+        # Key each side by its lower and upper vertex. Sides are numbered
+        # face by face, and a stable sort keeps the sides of each edge in
+        # order of their faces.
+        num_v = max(self.num_v, 1)
+        keys = np.minimum(starts, ends) * num_v + np.maximum(starts, ends)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        is_new = np.empty(len(order), dtype=bool)
+        is_new[:1] = True
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_new[1:])
+        edge_of_sorted_side = np.cumsum(is_new, dtype=np.int64)
+        edge_of_sorted_side -= 1
+
+        edges = np.column_stack(np.divmod(sorted_keys[is_new], num_v))
+        edges.setflags(write=False)
+        face_edges = np.empty(len(order), dtype=np.int64)
+        face_edges[order] = edge_of_sorted_side
+        face_edges = face_edges.reshape(-1, num_corners)
+        face_edges.setflags(write=False)
+        edge_faces = Adjacency(
+            indptr=np.append(np.flatnonzero(is_new), len(order)),
+            indices=order // num_corners,
+        )
+        return edges, face_edges, edge_faces
+
+    def edges(self):
+        """
+        Find the unique edges of the faces.
+
+        The topology is built once, with a single sort of the sides of the
+        faces, and cached on the mesh.
+
+        Returns:
+            np.ndarray: A read-only `kx2` array of the vertex indices of
+            each edge, the lower first, sorted by the lower and then the
+            upper.
+        """
+        edges, _, _ = self._edges_of_faces()
+        return edges
+
+    def face_edges(self):
+        """
+        Find the edges along each face.
+
+        Returns:
+            np.ndarray: A read-only `kx3` or `kx4` array of indices into
+            `edges()`. Column `i` holds the edge from corner `i` of each face
+            to the next corner.
+        """
+        _, face_edges, _ = self._edges_of_faces()
+        return face_edges
+
+    def edge_faces(self):
+        """
+        Find the faces along each edge. An edge along one face lies on the
+        boundary of the surface, and an edge along more than two faces is
+        non-manifold.
+
+        Returns:
+            lacecore.Adjacency: The faces along each edge in `edges()`.
+        """
+        _, _, edge_faces = self._edges_of_faces()
+        return edge_faces
+
+    @cached
+    def vertex_neighbors(self):
+        """
+        Find the vertices which share an edge with each vertex.
+
+        Returns:
+            lacecore.Adjacency: The neighbors of each vertex.
+        """
+        source = self._topology_source()
+        if source is not self:
+            return source.vertex_neighbors()
+
+        # Since the edges are sorted by their lower vertex and then their
+        # upper, sorting these pairs stably by their first vertex lists the
+        # lower neighbors of each vertex, then the upper, each in order.
+        lower, upper = self.edges().T
+        rows = np.concatenate([upper, lower])
+        order = np.argsort(rows, kind="stable")
+        return Adjacency.from_sorted_rows(
+            rows[order], np.concatenate([lower, upper])[order], self.num_v
+        )
+
+    @cached
+    def vertex_faces(self):
+        """
+        Find the faces which reference each vertex.
+
+        Returns:
+            lacecore.Adjacency: The faces of each vertex.
+        """
+        source = self._topology_source()
+        if source is not self:
+            return source.vertex_faces()
+
+        vertex_indices = self.f.ravel()
+        order = np.argsort(vertex_indices, kind="stable")
+        return Adjacency.from_sorted_rows(
+            vertex_indices[order], order // self.f.shape[1], self.num_v
+        )
+
+    @cached
+    def boundary_edges(self):
+        """
+        Find the edges which lie along only one face, and so lie on the
+        boundary of the surface.
+
+        Returns:
+            np.ndarray: A read-only `kx2` array of the vertex indices of
+            each boundary edge, ordered as they're traversed by the face
+            which they lie along.
+        """
+        source = self._topology_source()
+        if source is not self:
+            return source.boundary_edges()
+
+        edge_faces = self.edge_faces()
+        (edge_indices,) = (edge_faces.counts == 1).nonzero()
+        face_indices = edge_faces.indices[edge_faces.indptr[edge_indices]]
+        # The side of each face which lies along the edge.
+        columns = np.argmax(
+            self.face_edges()[face_indices] == edge_indices[:, np.newaxis], axis=1
+        )
+        result = np.column_stack(
+            [
+                self.f[face_indices, columns],
+                self.f[face_indices, (columns + 1) % self.f.shape[1]],
+            ]
+        )
+        result.setflags(write=False)
+        return result
+
+    def boundary_loops(self):
+        """
+        Link the boundary edges into loops, such as the rim of each hole in
+        the surface.
+
+        Returns:
+            list: For each loop, an array of the indices of the vertices
+            around it, in the order in which the faces traverse them. The
+            last vertex connects back to the first. Around non-manifold
+            vertices, boundary edges which can't be linked into a loop form
+            an open path.
+        """
+        from .._common.chains import link_segments
+
+        # Link the edges between the boundary vertices alone, so the work is
+        # proportional to the length of the boundary.
+        boundary_vertices, segments = np.unique(
+            self.boundary_edges(), return_inverse=True
+        )
+        return [
+            boundary_vertices[
+                nodes[:-1] if len(nodes) > 1 and nodes[-1] == nodes[0] else nodes
+            ]
+            for nodes, _ in link_segments(
+                segments.reshape(-1, 2), len(boundary_vertices)
+            )
+        ]
+
+    @cached
+    def non_manifold_edges(self):
+        """
+        Find the edges which lie along more than two faces.
+
+        Returns:
+            np.ndarray: A read-only `kx2` array of the vertex indices of
+            each non-manifold edge, the lower first.
+        """
+        result = self.edges()[self.edge_faces().counts > 2]
+        result.setflags(write=False)
+        return result
+
+    @property
+    def is_watertight(self):
+        """
+        `True` if every edge lies along exactly two faces, so the surface has
+        no boundary and no non-manifold edges.
+
+        Return:
+            bool: `True` if watertight.
+        """
+        return bool(np.all(self.edge_faces().counts == 2))
+
+    @property
+    @cached
+    def is_consistently_oriented(self):
+        """
+        `True` if the faces along each edge traverse it in opposite
+        directions, so that their normals all point to the same side of the
+        surface. Along a non-manifold edge, the number of faces which
+        traverse it in each direction may differ by at most one.
+
+        Return:
+            bool: `True` if consistently oriented.
+        """
+        # Count each side of each face which runs from the lower vertex of
+        # its edge to the upper, less each which runs the other way.
+        directions = np.sign(np.roll(self.f, -1, axis=1) - self.f)
+        balance = np.bincount(
+            self.face_edges().ravel(),
+            weights=directions.ravel(),
+            minlength=len(self.edges()),
+        )
+        return bool(np.all(np.abs(balance) <= 1))
+
+    @cached
+    def connected_components(self):
+        """
+        Label the connected components of the surface: sets of faces which
+        are linked by shared vertices.
+
+        The components are found with a vectorized union-find over the
+        cached edges. They're numbered in order of their first face.
+
+        Returns:
+            tuple: `(face_labels, vertex_labels)`, read-only arrays of the
+            component of each face and each vertex. Vertices which aren't
+            referenced by any face are labeled `-1`.
+        """
+        source = self._topology_source()
+        if source is not self:
+            return source.connected_components()
+
+        # Hook the root of each edge's higher-labeled endpoint onto the
+        # lower label, then compress the paths to the roots, until the
+        # endpoints of every edge agree. Each vertex's label only decreases,
+        # and ends as the lowest vertex index in its component.
+        starts, ends = self.edges().T
+        labels = np.arange(self.num_v)
+        while True:
+            start_labels, end_labels = labels[starts], labels[ends]
+            is_disagreeing = start_labels != end_labels
+            if not np.any(is_disagreeing):
+                break
+            start_labels = start_labels[is_disagreeing]
+            end_labels = end_labels[is_disagreeing]
+            labels[np.maximum(start_labels, end_labels)] = np.minimum(
+                start_labels, end_labels
+            )
+            while True:
+                compressed = labels[labels]
+                if np.array_equal(compressed, labels):
+                    break
+                labels = compressed
+
+        face_roots = labels[self.f[:, 0]]
+        roots, first_faces, face_labels = np.unique(
+            face_roots, return_index=True, return_inverse=True
+        )
+        # Renumber the components in order of their first face.
+        new_labels = np.empty(len(roots), dtype=np.int64)
+        new_labels[np.argsort(first_faces)] = np.arange(len(roots))
+        face_labels = new_labels[face_labels.reshape(-1)]
+        vertex_labels = np.full(self.num_v, -1, dtype=np.int64)
+        vertex_labels[self.f.ravel()] = np.repeat(face_labels, self.f.shape[1])
+        face_labels.setflags(write=False)
+        vertex_labels.setflags(write=False)
+        return face_labels, vertex_labels
+
+    def split_components(self):
+        """
+        Split the mesh into a submesh for each connected component, such as
+        a scan and the debris floating around it. Like other submeshes,
+        they discard the face groups.
+
+        All the submeshes are built together, with one sort of the faces and
+        vertices by component.
+
+        Returns:
+            list: The submeshes, as instances of `lacecore.Mesh`, in the
+            order of the labels from `connected_components()`.
+        """
+        from .._mesh import Mesh
+
+        face_labels, vertex_labels = self.connected_components()
+        num_components = len(np.unique(face_labels))
+
+        face_order = np.argsort(face_labels, kind="stable")
+        face_counts = np.bincount(face_labels, minlength=num_components)
+        # Unreferenced vertices sort first, and are discarded.
+        vertex_order = np.argsort(vertex_labels, kind="stable")
+        vertex_counts = np.bincount(vertex_labels + 1, minlength=num_components + 1)
+        vertex_starts = np.cumsum(vertex_counts) - vertex_counts
+        # The index of each vertex within its component.
+        new_vertex_indices = np.empty(self.num_v, dtype=np.int64)
+        new_vertex_indices[vertex_order] = np.arange(self.num_v) - np.repeat(
+            vertex_starts, vertex_counts
+        )
+
+        new_v = np.split(self.v[vertex_order], vertex_starts[1:])[1:]
+        new_f = np.split(
+            new_vertex_indices[self.f[face_order]], np.cumsum(face_counts)[:-1]
+        )
+        return [Mesh._from_valid_arrays(v=v, f=f) for v, f in zip(new_v, new_f)]
+
+    def keeping_largest_component(self):
+        """
+        Keep the connected component with the most faces, discarding any
+        others, such as debris floating around a scan. Like other submeshes,
+        it discards the face groups.
+
+        Returns:
+            lacecore.Mesh: A submesh containing the largest component.
+        """
+        from .._common.reindexing import create_submesh
+
+        face_labels, vertex_labels = self.connected_components()
+        largest = np.argmax(np.bincount(face_labels, minlength=1))
+        return create_submesh(
+            mesh=self,
+            vertex_mask=vertex_labels == largest,
+            face_mask=face_labels == largest,
+        )
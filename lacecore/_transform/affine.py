@@ -0,0 +1,52 @@
+import numpy as np
+from vg.compat import v2 as vg
+
+
+def check_out(out, shape, *vertices):
+    """
+    Check that an array can receive transformed vertices without overwriting
+    any of the given vertices, which may be `None`, and mark it writable.
+    """
+    vg.shape.check(locals(), "out", shape)
+    if out.dtype != np.float64:
+        raise ValueError("Expected out to have dtype float64")
+    if any(other is not None and np.may_share_memory(out, other) for other in vertices):
+        raise ValueError("Expected out not to share memory with the mesh")
+    out.setflags(write=True)
+
+
+def is_affine(matrices):
+    """
+    Check whether the given 4x4 matrix, or stack of matrices, has the bottom
+    row `[0, 0, 0, 1]`. Only then does applying the affine parts of two
+    matrices in turn match applying the affine part of their product.
+    """
+    return bool(np.all(matrices[..., 3, :] == np.array([0.0, 0.0, 0.0, 1.0])))
+
+
+def apply_affine_transforms(vertices, matrices, out):
+    """
+    Apply each of a stack of 4x4 transformation matrices to the given
+    vertices. Like `polliwog.CompositeTransform`, only the affine part of the
+    matrices is used.
+
+    Args:
+        vertices (np.ndarray): A `kx3` array of vertices.
+        matrices (np.ndarray): An `nx4x4` stack of matrices.
+        out (np.ndarray): An `nxkx3` array which receives the transformed
+            vertices.
+
+    Returns:
+        np.ndarray: `out`.
+    """
+    if len(matrices) == 1:
+        # Avoid allocating anything when transforming by a single matrix.
+        np.matmul(vertices, matrices[0, :3, :3].T, out=out[0])
+        out[0] += matrices[0, :3, 3]
+    else:
+        # Otherwise, it's faster to pad the vertices to homogeneous
+        # coordinates once, and apply the translations in the same pass.
+        homogeneous_vertices = np.ones((len(vertices), 4))
+        homogeneous_vertices[:, :3] = vertices
+        np.matmul(homogeneous_vertices, np.swapaxes(matrices[:, :3, :], 1, 2), out=out)
+    return out
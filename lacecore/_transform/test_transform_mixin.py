@@ -197,3 +197,173 @@ def test_faces_triangulated_preserves_face_groups():
 def test_faces_triangulated_error():
     with pytest.raises(ValueError, match="Mesh is already triangulated"):
         cube_at_origin.faces_triangulated()
+
+
+def test_end_with_out():
+    out = np.empty((8, 3))
+    expected = cube_at_origin.rotated(np.array([0.3, -0.2, 0.5])).translated(
+        np.array([1.0, 2.0, 3.0])
+    )
+    transformed = (
+        cube_at_origin.transform()
+        .rotate(np.array([0.3, -0.2, 0.5]))
+        .translate(np.array([1.0, 2.0, 3.0]))
+        .end(out=out)
+    )
+    assert transformed.v is out
+    assert not out.flags.writeable
+    np.testing.assert_array_almost_equal(transformed.v, expected.v)
+    assert transformed.f is cube_at_origin.f
+
+    # The buffer can be reused.
+    flipped = cube_at_origin.transform().flip(0).end(out=out)
+    assert flipped.v is out
+    np.testing.assert_array_equal(out, cube_at_origin.v * np.array([-1.0, 1.0, 1.0]))
+    np.testing.assert_array_equal(flipped.f, np.fliplr(cube_at_origin.f))
+    # The flipped faces are computed once.
+    assert cube_at_origin.faces_flipped().f is flipped.f
+
+
+def test_end_with_out_validation():
+    with pytest.raises(ValueError, match=r"out must be an array with shape \(8, 3\)"):
+        cube_at_origin.transform().end(out=np.empty((7, 3)))
+    with pytest.raises(ValueError, match="Expected out to have dtype float64"):
+        cube_at_origin.transform().end(out=np.empty((8, 3), dtype=np.float32))
+    with pytest.raises(
+        ValueError, match="Expected out not to share memory with the mesh"
+    ):
+        cube_at_origin.transform().end(out=cube_at_origin.v)
+
+
+def random_rigid_transforms(num_transforms):
+    np.random.seed(0)
+    matrices = np.zeros((num_transforms, 4, 4))
+    matrices[:, :3, :3] = np.linalg.qr(np.random.randn(num_transforms, 3, 3))[0]
+    matrices[:, :3, 3] = np.random.randn(num_transforms, 3)
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def test_transformed_many():
+    matrices = random_rigid_transforms(7)
+    transformed = cube_at_origin.transformed_many(matrices)
+    assert transformed.shape == (7, 8, 3)
+    for matrix, vertices in zip(matrices, transformed):
+        np.testing.assert_array_almost_equal(
+            vertices, cube_at_origin.transform().append_transform(matrix).end().v
+        )
+
+    out = np.empty((7, 8, 3))
+    assert cube_at_origin.transformed_many(matrices, out=out) is out
+    np.testing.assert_array_equal(out, transformed)
+
+    np.testing.assert_array_almost_equal(
+        cube_at_origin.transformed_many(matrices[:1]), transformed[:1]
+    )
+
+
+def test_transformed_many_validation():
+    with pytest.raises(
+        ValueError, match=r"matrices must be an array with shape \(-1, 4, 4\)"
+    ):
+        cube_at_origin.transformed_many(np.eye(4))
+    with pytest.raises(
+        ValueError, match=r"out must be an array with shape \(2, 8, 3\)"
+    ):
+        cube_at_origin.transformed_many(
+            random_rigid_transforms(2), out=np.empty((2, 7, 3))
+        )
+
+
+def test_transforms_are_composed_lazily():
+    rotation = np.array([0.3, -0.2, 0.5])
+    translation = np.array([1.0, 2.0, 3.0])
+    transformed = (
+        cube_at_origin.translated(translation).rotated(rotation).uniformly_scaled(2.0)
+    )
+    assert transformed._v is None
+    assert transformed._transform_source is cube_at_origin
+    assert transformed.num_v == 8
+    assert transformed._v is None
+
+    expected = (
+        cube_at_origin.transform()
+        .translate(translation)
+        .rotate(rotation)
+        .uniform_scale(2.0)
+        .end()
+    )
+    np.testing.assert_array_almost_equal(transformed.v, expected.v)
+    assert not transformed.v.flags.writeable
+    assert transformed.v is transformed.v
+
+    # Transforming a mesh which was transformed still refers to the original.
+    assert transformed.translated(translation)._transform_source is cube_at_origin
+    np.testing.assert_array_almost_equal(
+        transformed.translated(translation).v, transformed.v + translation
+    )
+    np.testing.assert_array_almost_equal(
+        transformed.transformed_many(random_rigid_transforms(2))[0],
+        transformed.transform().append_transform(random_rigid_transforms(2)[0]).end().v,
+    )
+
+
+def test_projective_transforms_are_not_composed():
+    # Only the affine part of a matrix is applied, so a projective matrix
+    # can't be folded into a later transform.
+    projection = np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.5, 1.0],
+        ]
+    )
+    translation = np.array([1.0, 2.0, 3.0])
+    projected = cube_at_origin.transform().append_transform(projection).end()
+    np.testing.assert_array_equal(projected.v, cube_at_origin.v)
+
+    translated = projected.translated(translation)
+    assert translated._transform_source is projected
+    np.testing.assert_array_equal(translated.v, cube_at_origin.v + translation)
+    np.testing.assert_array_equal(
+        projected.transformed_many(np.eye(4)[np.newaxis])[0], cube_at_origin.v
+    )
+
+    translated = cube_at_origin.translated(translation)
+    projected = translated.transform().append_transform(projection).end()
+    assert projected._transform_source is translated
+    np.testing.assert_array_equal(projected.v, cube_at_origin.v + translation)
+
+
+def test_end_with_out_of_lazily_transformed_mesh():
+    translated = cube_at_origin.translated(vg.basis.x)
+    out = np.empty((8, 3))
+    scaled = translated.transform().uniform_scale(2.0).end(out=out)
+    assert translated._v is None
+    np.testing.assert_array_almost_equal(
+        scaled.v, 2.0 * (cube_at_origin.v + vg.basis.x)
+    )
+
+    with pytest.raises(
+        ValueError, match="Expected out not to share memory with the mesh"
+    ):
+        translated.transform().end(out=translated.v)
+
+
+def test_transformed_many_with_out_of_lazily_transformed_mesh():
+    translated = cube_at_origin.translated(vg.basis.x)
+    matrices = random_rigid_transforms(2)
+    out = np.empty((2, 8, 3))
+    translated.transformed_many(matrices, out=out)
+    assert translated._v is None
+    np.testing.assert_array_almost_equal(out, translated.transformed_many(matrices))
+
+    with pytest.raises(
+        ValueError, match="Expected out not to share memory with the mesh"
+    ):
+        translated.transformed_many(matrices[:1], out=cube_at_origin.v[np.newaxis])
+    with pytest.raises(
+        ValueError, match="Expected out not to share memory with the mesh"
+    ):
+        translated.transformed_many(matrices[:1], out=translated.v[np.newaxis])
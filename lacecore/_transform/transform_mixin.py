@@ -1,7 +1,33 @@
+import numpy as np
+from vg.compat import v2 as vg
+from .affine import apply_affine_transforms, check_out, is_affine
 from .transform_object import Transform
+from .._common.cache import cached
+from .._common.tri import flip_faces
 
 
 class TransformMixin:
+    @cached
+    def _flipped_faces(self):
+        # The faces with their orientation flipped, which are cached, since a
+        # mesh is often transformed repeatedly.
+        flipped = flip_faces(self.f)
+        flipped.setflags(write=False)
+        return flipped
+
+    def _transform_source_and_matrix(self, matrix):
+        # Express a transform of this mesh as one of the mesh from which it
+        # was itself transformed, if any, so transforms compose without
+        # computing the intermediate vertices. Only the affine part of each
+        # matrix is applied, so projective matrices don't compose this way.
+        if (
+            self._transform_source is None
+            or not is_affine(self._transform_matrix)
+            or not is_affine(matrix)
+        ):
+            return self, matrix
+        return self._transform_source, matrix @ self._transform_matrix
+
     def transform(self):
         """
         Begin a composite transform operation. After invoking `.transform()`,
@@ -122,6 +148,40 @@ class TransformMixin:
         """
         return self.transform().rotate(rotation=rotation).end()
 
+    def transformed_many(self, matrices, out=None):
+        """
+        Apply each of a stack of 4x4 transformation matrices to the vertices,
+        such as the candidates in an alignment search, without building a
+        transform and a mesh for each one.
+
+        Args:
+            matrices (np.arraylike): An `nx4x4` stack of transformation
+                matrices.
+            out (np.ndarray): An optional `nxkx3` array of floats into which
+                the transformed vertices are written. To bound memory use for
+                a large number of matrices, pass them in slices, with a
+                buffer which is reused.
+
+        Returns:
+            np.ndarray: An `nxkx3` array of the transformed vertices for
+            each matrix. They share the faces and face groups of this mesh.
+
+        Example:
+            >>> buffer = np.empty((100, mesh.num_v, 3))
+            >>> for start in range(0, len(matrices), 100):
+                    chunk = matrices[start : start + 100]
+                    vertices = mesh.transformed_many(
+                        chunk, out=buffer[: len(chunk)]
+                    )
+        """
+        num_matrices = vg.shape.check(locals(), "matrices", (-1, 4, 4))
+        source, matrices = self._transform_source_and_matrix(matrices)
+        if out is None:
+            out = np.empty((num_matrices, self.num_v, 3))
+        else:
+            check_out(out, (num_matrices, self.num_v, 3), source.v, self._v)
+        return apply_affine_transforms(source.v, matrices, out)
+
     def faces_triangulated(self):
         """
         Triangulate the mesh's quad faces to triangles. Raise an error if the
@@ -1,6 +1,6 @@
 import numpy as np
 from polliwog import CompositeTransform
-from .._common.tri import flip_faces
+from .affine import apply_affine_transforms, check_out
 
 
 class Transform:
@@ -144,21 +144,43 @@ class Transform:
 
         return self
 
-    def end(self, reverse=False):
+    def end(self, reverse=False, out=None):
         """
         Apply the requested transformation and return a new mesh.
 
+        Unless `out` is given, the new mesh's vertices are computed when
+        they're first read, so a chain of transforms, such as
+        `mesh.translated(a).rotated(b)`, only multiplies their matrices.
+
         Args:
             reverse (bool): When `True` applies the selected transformations
                 in reverse.
+            out (np.ndarray): An optional `kx3` array of floats into which
+                the transformed vertices are written, so that transforming a
+                mesh repeatedly, such as in an animation or fitting loop,
+                doesn't allocate. It becomes the vertices of the new mesh,
+                and is marked read-only. It can be passed to later calls,
+                which overwrite it, and with it the vertices of the earlier
+                meshes, which should then no longer be used.
 
         Returns:
             lacecore.Mesh: The transformed mesh.
         """
         from .._mesh import Mesh  # Avoid circular import.
 
-        return Mesh(
-            v=self._transform(self.target.v),
-            f=flip_faces(self.target.f) if self._flip_faces else self.target.f,
-            face_groups=self.target.face_groups,
+        source, matrix = self.target._transform_source_and_matrix(
+            self._transform.transform_matrix_for(reverse=reverse)
         )
+        # The faces of a transformed mesh are those of its source, or the
+        # source's flipped faces, so derived quantities such as normals can
+        # be computed from the source's.
+        is_flipped = self._flip_faces != (self.target.f is not source.f)
+        f = source._flipped_faces() if is_flipped else source.f
+        if out is None:
+            return Mesh._transformed(
+                source, matrix, f=f, face_groups=self.target.face_groups
+            )
+
+        check_out(out, (self.target.num_v, 3), source.v, self.target._v)
+        apply_affine_transforms(source.v, matrix[np.newaxis], out[np.newaxis])
+        return Mesh._from_valid_arrays(v=out, f=f, face_groups=self.target.face_groups)
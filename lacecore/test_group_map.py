@@ -1,6 +1,7 @@
 from lacecore import GroupMap
 import numpy as np
 import pytest
+from . import _group_map as group_map_module
 from ._common.reindexing import reindex_faces
 from ._mesh import Mesh
 from ._selection.test_selection_mixin import (
@@ -102,6 +103,117 @@ def test_group_map_union():
         groups.union(["a", "left_side", "b", "c"])
 
 
+def test_group_map_intersection():
+    groups = create_group_map()
+    np.testing.assert_array_equal(
+        groups.intersection("sides", "left_side"),
+        np.array([False] * 10 + [True] * 2),
+    )
+    np.testing.assert_array_equal(
+        groups.intersection("top_and_bottom", "sides"), np.zeros(12, dtype=bool)
+    )
+    with pytest.raises(KeyError, match="Unknown groups: a"):
+        groups.intersection("a", "left_side")
+
+
+def test_group_map_difference():
+    groups = create_group_map()
+    np.testing.assert_array_equal(
+        groups.difference("sides", "left_side", "right_side"),
+        np.array([False] * 4 + [True] * 2 + [False] * 2 + [True] * 2 + [False] * 2),
+    )
+    np.testing.assert_array_equal(groups.difference("top"), groups["top"])
+    with pytest.raises(ValueError, match="Group names must be strings"):
+        groups.difference("sides", ["top"])
+
+
+def test_group_map_symmetric_difference():
+    groups = create_group_map()
+    np.testing.assert_array_equal(
+        groups.symmetric_difference("top_and_bottom", "top", "left_side"),
+        np.array([True] * 2 + [False] * 8 + [True] * 2),
+    )
+
+
+def test_group_map_counts():
+    groups = create_group_map()
+    np.testing.assert_array_equal(groups.counts(), [2, 2, 2, 2, 2, 2, 8, 4, 0])
+
+    reindexed = groups.reindexed(np.array([0, 0, 1, 4, 11]))
+    np.testing.assert_array_equal(reindexed.counts(), [3, 0, 1, 0, 0, 1, 2, 3, 0])
+
+
+def test_group_map_overlap_matrix():
+    groups = create_group_map()
+    reindexed = groups.reindexed(np.array([0, 0, 1, 4, 11, 5, 10, 10]))
+    for group_map in (groups, reindexed):
+        names = group_map.keys()
+        expected = np.array(
+            [
+                [np.count_nonzero(group_map[a] & group_map[b]) for b in names]
+                for a in names
+            ]
+        )
+        for chunk_size in (None, 1, 5):
+            overlap = group_map.overlap_matrix(chunk_size=chunk_size)
+            assert overlap.dtype == np.int64
+            np.testing.assert_array_equal(overlap, expected)
+        np.testing.assert_array_equal(np.diag(expected), group_map.counts())
+
+
+def test_group_map_overlap_matrix_chunked_by_bytes(monkeypatch):
+    groups = create_group_map()
+    expected = groups.overlap_matrix()
+    # Leave room for three elements of each group's masks.
+    monkeypatch.setattr(
+        group_map_module, "OVERLAP_CHUNK_BYTES", 2 * 8 * len(groups) * 3
+    )
+    np.testing.assert_array_equal(groups.overlap_matrix(), expected)
+    np.testing.assert_array_equal(
+        GroupMap.from_dict({"empty": []}, 0).overlap_matrix(), [[0]]
+    )
+
+
+def test_group_map_set_operations_on_reindexed():
+    groups = create_group_map()
+    f_new_to_old = np.array([11, 0, 3, 2, 10, 4])
+    reindexed = groups.reindexed(f_new_to_old)
+    np.testing.assert_array_equal(
+        reindexed.intersection("sides", "left_side"),
+        groups.intersection("sides", "left_side")[f_new_to_old],
+    )
+    np.testing.assert_array_equal(
+        reindexed.difference("sides", "left_side"),
+        groups.difference("sides", "left_side")[f_new_to_old],
+    )
+    np.testing.assert_array_equal(
+        reindexed.symmetric_difference("top_and_bottom", "top"),
+        groups.symmetric_difference("top_and_bottom", "top")[f_new_to_old],
+    )
+    assert reindexed.groups_containing([0, 3]) == [
+        "top",
+        "left_side",
+        "sides",
+        "top_and_bottom",
+    ]
+
+
+def test_group_map_groups_containing():
+    groups = create_group_map()
+    assert groups.groups_containing([0, 11]) == [
+        "bottom",
+        "left_side",
+        "sides",
+        "top_and_bottom",
+    ]
+    assert groups.groups_containing(np.arange(12) == 4) == ["back_side", "sides"]
+    assert groups.groups_containing([]) == []
+    with pytest.raises(
+        ValueError, match="Expected indices in elements to be less than 12"
+    ):
+        groups.groups_containing([12])
+
+
 def test_group_map_indices_out_of_range():
     with pytest.raises(ValueError, match="Element indices should be less than 12"):
         GroupMap.from_dict({"too_big": range(20)}, 12)
@@ -218,6 +330,80 @@ def test_reindexed():
         )
 
 
+def test_reindexed_chain():
+    groups = create_group_map()
+
+    # Split each face in two, then keep every third face, then reverse.
+    first = groups.reindexed(np.repeat(np.arange(groups.num_elements), 2))
+    second = first.reindexed(np.arange(0, first.num_elements, 3))
+    third = second.reindexed(np.arange(second.num_elements)[::-1])
+
+    f_new_to_old = np.repeat(np.arange(groups.num_elements), 2)[np.arange(0, 24, 3)][
+        ::-1
+    ]
+    assert third.num_elements == len(f_new_to_old)
+    for group_name in groups:
+        np.testing.assert_array_equal(
+            third[group_name], groups[group_name][f_new_to_old]
+        )
+    np.testing.assert_array_equal(
+        third.mask_for_element(0), groups.mask_for_element(f_new_to_old[0])
+    )
+    np.testing.assert_array_equal(
+        third.union("top", "left_side"),
+        groups.union("top", "left_side")[f_new_to_old],
+    )
+    assert third.to_dict() == {
+        group_name: list(groups[group_name][f_new_to_old].nonzero()[0])
+        for group_name in groups
+    }
+
+
+def test_reindexed_is_lazy():
+    groups = create_group_map()
+    reindexed = groups.reindexed(np.arange(6))
+
+    # The view shares the original masks.
+    assert reindexed._source_masks is groups._source_masks
+
+    # Accessing a group returns the same read-only mask each time.
+    mask = reindexed["bottom"]
+    assert reindexed["bottom"] is mask
+    with pytest.raises(ValueError, match="assignment destination is read-only"):
+        mask[0] = False
+
+    # Mutating the caller's mapping does not affect the view.
+    f_new_to_old = np.zeros(3, dtype=np.int64)
+    view = groups.reindexed(f_new_to_old)
+    f_new_to_old[:] = 4
+    np.testing.assert_array_equal(view["bottom"], [True, True, True])
+
+
+def test_reindexed_error():
+    groups = create_group_map()
+    with pytest.raises(
+        IndexError, match="Expected indices in f_new_to_old to be less than 12"
+    ):
+        groups.reindexed(np.array([0, 12]))
+    with pytest.raises(
+        IndexError, match="Expected indices in f_new_to_old to be less than 12"
+    ):
+        groups.reindexed(np.array([0, -13]))
+    with pytest.raises(IndexError):
+        groups.reindexed(np.arange(6)).reindexed(np.array([6]))
+    for f_new_to_old in (np.arange(12) % 2 == 0, np.array([0.0, 1.0])):
+        with pytest.raises(
+            ValueError, match="Expected f_new_to_old to be an array of indices"
+        ):
+            groups.reindexed(f_new_to_old)
+
+
+def test_reindexed_empty():
+    reindexed = create_group_map().reindexed([])
+    assert reindexed.num_elements == 0
+    assert len(reindexed["top"]) == 0
+
+
 def test_defragment():
     groups = GroupMap.from_dict(non_overlapping_group_data, 12)
 
@@ -1,5 +1,7 @@
-from lacecore import shapes
+from lacecore import Mesh, shapes
 import numpy as np
+import pytest
+from ._selection.test_selection_mixin import cube_at_origin
 
 
 def test_repr():
@@ -23,3 +25,36 @@ def test_write_obj(tmp_path):
 
     assert obj_contents.count("v ") == 8
     assert obj_contents.count("f ") == 12
+
+
+def test_vertex_groups_of_face_groups():
+    vertex_groups = cube_at_origin.vertex_groups_of_face_groups()
+    assert vertex_groups.keys() == cube_at_origin.face_groups.keys()
+    assert vertex_groups.num_elements == cube_at_origin.num_v
+    for group_name in cube_at_origin.face_groups:
+        expected = np.zeros(cube_at_origin.num_v, dtype=bool)
+        expected[cube_at_origin.f[cube_at_origin.face_groups[group_name]]] = True
+        np.testing.assert_array_equal(vertex_groups[group_name], expected)
+
+    # The result is cached.
+    assert cube_at_origin.vertex_groups_of_face_groups() is vertex_groups
+
+
+def test_vertex_groups_of_face_groups_of_reindexed_face_groups():
+    f_new_to_old = np.array([2, 3, 10])
+    mesh = Mesh(
+        v=cube_at_origin.v,
+        f=cube_at_origin.f[f_new_to_old],
+        face_groups=cube_at_origin.face_groups.reindexed(f_new_to_old),
+    )
+    vertex_groups = mesh.vertex_groups_of_face_groups()
+    np.testing.assert_array_equal(vertex_groups["top"].nonzero()[0], [4, 5, 6, 7])
+    np.testing.assert_array_equal(vertex_groups["left_side"].nonzero()[0], [3, 4, 7])
+    np.testing.assert_array_equal(vertex_groups["bottom"].nonzero()[0], [])
+    # The face groups stay lazy.
+    assert mesh.face_groups._element_mapping is not None
+
+
+def test_vertex_groups_of_face_groups_error():
+    with pytest.raises(ValueError, match="Mesh has no face groups"):
+        shapes.cube(np.zeros(3), 3.0).vertex_groups_of_face_groups()